@@ -0,0 +1,132 @@
+"""Concurrent requests through the sync (WSGI) and async (ASGI) paths.
+
+Every query is delayed by LATENCY seconds to stand in for a remote database.
+The sync worker answers its requests one after another, as a gunicorn sync
+worker does; the ASGI modes hand all requests to the ASGI application at once,
+as uvicorn does. Run against a database seeded with ``seed_perf``::
+
+    DATABASE_URL=postgres://... python benchmarks/async_views.py
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODES = {
+    "sync views, one sync worker": ("prod", "wsgi"),
+    "sync views, ASGI": ("prod", "asgi"),
+    "async views, ASGI": ("asgi", "asgi"),
+}
+CONCURRENCY = 20
+LATENCY = 0.01
+
+
+def add_latency(connection, **kwargs):
+    def delay(execute, sql, params, many, context):
+        time.sleep(LATENCY)
+        return execute(sql, params, many, context)
+
+    connection.execute_wrappers.append(delay)
+
+
+async def asgi_get(application, path, cookie):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"127.0.0.1"), (b"cookie", cookie.encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    body = [{"type": "http.request", "body": b"", "more_body": False}]
+    statuses = []
+
+    async def receive():
+        if body:
+            return body.pop()
+        await asyncio.Future()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await application(scope, receive, send)
+    return statuses[0]
+
+
+async def asgi_burst(application, path, cookie):
+    requests = [asgi_get(application, path, cookie) for _ in range(CONCURRENCY)]
+    return await asyncio.wait_for(asyncio.gather(*requests), timeout=120)
+
+
+def measure(server):
+    sys.path.insert(0, str(ROOT))
+    import django
+
+    django.setup()
+    from django.db.backends.signals import connection_created
+    from django.test import Client
+
+    from task_manager.models import Task, Worker
+
+    connection_created.connect(add_latency, weak=False)
+    client = Client(HTTP_HOST="127.0.0.1")
+    client.force_login(Worker.objects.order_by("id").first())
+    task = Task.objects.order_by("id").first()
+    paths = {
+        "home": "/",
+        "task list": "/tasks/",
+        "task detail": task.get_absolute_url(),
+    }
+    results = {}
+    for name, path in paths.items():
+        start = time.perf_counter()
+        if server == "wsgi":
+            statuses = [client.get(path).status_code for _ in range(CONCURRENCY)]
+        else:
+            from workflow_master.asgi import application
+
+            cookie = f"sessionid={client.cookies['sessionid'].value}"
+            statuses = asyncio.run(asgi_burst(application, path, cookie))
+        assert set(statuses) == {200}, statuses
+        results[name] = time.perf_counter() - start
+    return results
+
+
+def run(profile, server):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=f"workflow_master.settings.{profile}")
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", server],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        print(json.dumps(measure(sys.argv[2])))
+    else:
+        print(
+            f"{CONCURRENCY} simultaneous requests per page, "
+            f"{LATENCY * 1000:.0f} ms added to every query"
+        )
+        for name, (profile, server) in MODES.items():
+            results = run(profile, server)
+            timings = ", ".join(
+                f"{page} {seconds * 1000:.0f} ms ({CONCURRENCY / seconds:.0f} req/s)"
+                for page, seconds in results.items()
+            )
+            print(f"-- {name}: {timings}")
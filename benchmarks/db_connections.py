@@ -0,0 +1,90 @@
+"""Connection overhead per request with and without reuse.
+
+Each mode runs in its own interpreter and simulates requests: the
+request_started/request_finished signals around one small query, the same
+lifecycle Django gives a connection during a real request. Point DATABASE_URL
+at a local PostgreSQL (the pool mode is skipped for other databases)::
+
+    DATABASE_URL=postgres://localhost/workflow python benchmarks/db_connections.py
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODES = {
+    "new connection per request": {"DB_CONN_MAX_AGE": "0"},
+    "persistent with health checks": {"DB_CONN_MAX_AGE": "500"},
+    "in-process pool": {"DB_POOL_MAX_SIZE": "4"},
+}
+REPEAT = 200
+
+
+def measure():
+    sys.path.insert(0, str(ROOT))
+    import django
+
+    django.setup()
+    from django.core.signals import request_finished, request_started
+    from django.db import connection
+    from django.db.backends.signals import connection_created
+
+    from task_manager.db.pool import pool_stats
+
+    if connection.vendor != "postgresql" and os.environ.get("DB_POOL_MAX_SIZE"):
+        return None
+    opened = []
+    connection_created.connect(lambda **kwargs: opened.append(1), weak=False)
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        request_started.send(sender=None)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        request_finished.send(sender=None)
+        timings.append(time.perf_counter() - start)
+    pools = pool_stats()
+    return {
+        "median": statistics.median(timings) * 1000,
+        "p95": statistics.quantiles(timings, n=20)[-1] * 1000,
+        # Pool checkouts fire connection_created too; the pool counts sockets.
+        "connections": pools[0]["opened"] if pools else len(opened),
+    }
+
+
+def run(mode):
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ("DB_CONN_MAX_AGE", "DB_POOL_MAX_SIZE")
+    }
+    env.update(mode, DJANGO_SETTINGS_MODULE="workflow_master.settings.prod")
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--measure"]:
+        print(json.dumps(measure()))
+    else:
+        print(f"SELECT 1 per request, {REPEAT} requests")
+        for name, mode in MODES.items():
+            result = run(mode)
+            if result is None:
+                print(f"-- {name}: skipped, needs PostgreSQL")
+                continue
+            print(
+                f"-- {name}: median {result['median']:.3f} ms, "
+                f"p95 {result['p95']:.3f} ms, "
+                f"{result['connections']} connections opened"
+            )
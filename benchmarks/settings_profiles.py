@@ -0,0 +1,78 @@
+"""Startup time and per-request overhead of the dev, test and prod profiles.
+
+Each profile runs in its own interpreter: it times django.setup() plus the
+WSGI application import, then requests the task list as a logged-in worker.
+Point DATABASE_URL at a database seeded with ``seed_perf``::
+
+    DATABASE_URL=postgres://... python benchmarks/settings_profiles.py
+"""
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PROFILES = ["dev", "test", "prod"]
+REPEAT = 50
+
+
+def measure():
+    start = time.perf_counter()
+    sys.path.insert(0, str(ROOT))
+    import django
+
+    django.setup()
+    from workflow_master.wsgi import application  # noqa: F401
+
+    startup = time.perf_counter() - start
+
+    from django.db import connection
+    from django.test import Client
+
+    from task_manager.models import Worker
+
+    client = Client(HTTP_HOST="127.0.0.1", REMOTE_ADDR="127.0.0.1")
+    client.force_login(Worker.objects.order_by("id").first())
+    timings = []
+    for _ in range(REPEAT):
+        request_start = time.perf_counter()
+        client.get("/tasks/")
+        timings.append(time.perf_counter() - request_start)
+    return {
+        "startup": startup * 1000,
+        "request": statistics.median(timings) * 1000,
+        # With DEBUG every query of a request is kept in memory.
+        "logged_queries": len(connection.queries_log),
+        "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024,
+    }
+
+
+def run(profile):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=f"workflow_master.settings.{profile}")
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--measure"]:
+        print(json.dumps(measure()))
+    else:
+        print(f"task list, median of {REPEAT} requests")
+        for profile in PROFILES:
+            result = run(profile)
+            print(
+                f"-- {profile}: startup {result['startup']:.0f} ms, "
+                f"request {result['request']:.2f} ms, "
+                f"{result['logged_queries']} queries logged per request, "
+                f"max RSS {result['max_rss']} MB"
+            )
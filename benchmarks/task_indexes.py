@@ -0,0 +1,87 @@
+"""Query plans and timings for the Task hot filters, with and without the
+deadline indexes of 0003.
+
+Run against a disposable database seeded with ``seed_perf``; the script drops
+the two indexes and always creates them again, even if it is interrupted::
+
+    python manage.py seed_perf --tasks 200000
+    python benchmarks/task_indexes.py
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workflow_master.settings.prod")
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from task_manager.models import Task, Worker  # noqa: E402
+
+DEADLINE_INDEXES = [
+    index
+    for index in Task._meta.indexes
+    if index.name in ("task_open_deadline_idx", "task_status_deadline_idx")
+]
+REPEAT = 20
+
+
+def hot_queries():
+    now = timezone.now()
+    task = Task.objects.order_by("-id").first()
+    worker = Worker.objects.exclude(slug="").order_by("-id").first()
+    return {
+        "open tasks by deadline": Task.objects.filter(is_completed=False).order_by(
+            "deadline"
+        )[:20],
+        "overdue open tasks": Task.objects.filter(
+            is_completed=False, deadline__lt=now
+        ).values("id"),
+        "completed tasks by deadline": Task.objects.filter(is_completed=True).order_by(
+            "-deadline"
+        )[:20],
+        "task by slug": Task.objects.filter(slug=task.slug),
+        "worker by slug": Worker.objects.filter(slug=worker.slug),
+        "worker open tasks": worker.tasks.filter(is_completed=False).order_by(
+            "deadline"
+        ),
+    }
+
+
+def timed(queryset):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        list(queryset.all())
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def report(label):
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    print(f"== {label} ({Task.objects.count()} tasks)")
+    for name, queryset in hot_queries().items():
+        print(f"-- {name}: {timed(queryset):.2f} ms (median of {REPEAT})")
+        for line in queryset.explain().splitlines():
+            print(f"   {line}")
+    print()
+
+
+if __name__ == "__main__":
+    with connection.schema_editor() as schema_editor:
+        for index in DEADLINE_INDEXES:
+            schema_editor.remove_index(Task, index)
+    try:
+        report("without deadline indexes")
+    finally:
+        with connection.schema_editor() as schema_editor:
+            for index in DEADLINE_INDEXES:
+                schema_editor.add_index(Task, index)
+    report("with deadline indexes")
@@ -0,0 +1,76 @@
+"""Render time of the list views with uncached and with warmed cached loaders.
+
+Run against a database seeded with ``seed_perf``; the views are called
+directly, so the numbers cover the view plus rendering of the response::
+
+    python manage.py seed_perf --tasks 10000
+    python benchmarks/template_render.py
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workflow_master.settings.prod")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.test import RequestFactory, override_settings  # noqa: E402
+
+from task_manager import views  # noqa: E402
+from task_manager.models import Worker  # noqa: E402
+from task_manager.warmup import warm_templates  # noqa: E402
+
+REPEAT = 20
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+PROFILES = {
+    "uncached loaders": LOADERS,
+    "warmed cached loader": [("django.template.loaders.cached.Loader", LOADERS)],
+}
+PAGES = {
+    "task list": (views.TaskListView, {}, {}),
+    "task list search": (views.TaskListView, {"search_query": "perf"}, {}),
+    "task list partial": (views.TaskListView, {}, {"HTTP_HX_REQUEST": "true"}),
+    "worker list": (views.WorkerListView, {}, {}),
+    "worker list partial": (views.WorkerListView, {}, {"HTTP_HX_REQUEST": "true"}),
+}
+
+
+def templates_setting(loaders):
+    options = dict(settings.TEMPLATES[0]["OPTIONS"], loaders=loaders)
+    return [dict(settings.TEMPLATES[0], APP_DIRS=False, OPTIONS=options)]
+
+
+def timed(view, request):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        view(request).render()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def report(label, loaders, user):
+    factory = RequestFactory()
+    with override_settings(TEMPLATES=templates_setting(loaders)):
+        if label.startswith("warmed"):
+            warm_templates()
+        print(f"== {label}")
+        for name, (view_class, params, headers) in PAGES.items():
+            request = factory.get("/", params, **headers)
+            request.user = user
+            print(f"-- {name}: {timed(view_class.as_view(), request):.2f} ms")
+    print()
+
+
+if __name__ == "__main__":
+    worker = Worker.objects.order_by("id").first()
+    for label, loaders in PROFILES.items():
+        report(label, loaders, worker)
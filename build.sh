@@ -4,5 +4,7 @@ set -o errexit
 
 pip install -r requirements.txt
 
+export DJANGO_SETTINGS_MODULE="${DJANGO_SETTINGS_MODULE:-workflow_master.settings.prod}"
+
 python3 manage.py collectstatic --no-input
 python3 manage.py migrate
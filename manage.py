@@ -6,7 +6,10 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workflow_master.settings")
+    if sys.argv[1:2] == ["test"]:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workflow_master.settings.test")
+    else:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "workflow_master.settings.dev")
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
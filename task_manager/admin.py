@@ -19,6 +19,9 @@ class WorkerAdmin(UserAdmin):
         )
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).for_detail()
+
 
 @admin.register(Position)
 class PositionAdmin(admin.ModelAdmin):
@@ -27,8 +30,16 @@ class PositionAdmin(admin.ModelAdmin):
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
+    list_display = ("name", "task_type", "deadline", "is_completed")
     search_fields = ("name",)
     prepopulated_fields = {"slug": ["name"]}
 
+    def get_queryset(self, request):
+        # The change list renders list columns only, the forms every field.
+        queryset = super().get_queryset(request)
+        if request.resolver_match.url_name == "task_manager_task_changelist":
+            return queryset.for_list()
+        return queryset.for_detail()
+
 
 admin.site.register(TaskType)
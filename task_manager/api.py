@@ -0,0 +1,354 @@
+import hashlib
+import json
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import ForeignKey, Prefetch, prefetch_related_objects
+from django.http import Http404, HttpResponse, HttpResponseNotModified, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.utils.datastructures import MultiValueDict
+from django.utils.http import parse_etags, quote_etag
+from django.views import generic
+
+from task_manager.db.pool import pool_stats
+from task_manager.forms import BulkTaskForm
+from task_manager.models import Position, Tag, Task, TaskType, Worker
+from task_manager.pagination import CursorPaginator, InvalidCursor
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_IDS = 200
+# Primary keys are 64-bit (BigAutoField), larger ids overflow the driver.
+MAX_ID = 2**63 - 1
+
+
+class ApiError(Exception):
+    status = 400
+
+
+class ApiForbidden(ApiError):
+    status = 403
+
+
+class Resource:
+    model = None
+    lookup_field = "pk"
+    fields = ()
+    # Related fields and the name of the resource they point at.
+    relations = {}
+    default_fields = None
+    version_field = None
+
+    def __init__(self, fields=None, expand=None):
+        requested = fields or self.default_fields or self.all_fields()
+        expand = expand or []
+        unknown = set(requested + expand) - set(self.all_fields())
+        if unknown:
+            raise ApiError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+        invalid = set(expand) - set(self.relations)
+        if invalid:
+            raise ApiError(f"Cannot expand: {', '.join(sorted(invalid))}.")
+        self.requested = list(dict.fromkeys(requested + expand))
+        self.expand = expand
+
+    @classmethod
+    def all_fields(cls):
+        return [*cls.fields, *cls.relations]
+
+    @classmethod
+    def related_resource(cls, name):
+        return RESOURCES[cls.relations[name]]()
+
+    def is_foreign_key(self, name):
+        return isinstance(self.model._meta.get_field(name), ForeignKey)
+
+    def get_queryset(self):
+        # Only the columns needed for the requested fields are loaded. Related
+        # rows are joined for expanded foreign keys; many-to-many fields are
+        # prefetched later, once the page (and its ETag) is known.
+        model_fields = ["pk"]
+        if self.version_field:
+            model_fields.append(self.version_field)
+        select_related = []
+        for name in self.requested:
+            if name not in self.relations:
+                model_fields.append(name)
+            elif self.is_foreign_key(name):
+                model_fields.append(name)
+                if name in self.expand:
+                    select_related.append(name)
+                    related = self.related_resource(name)
+                    model_fields.extend(
+                        f"{name}__{field}" for field in related.nested_fields()
+                    )
+        queryset = self.model.objects.only(*model_fields)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        return queryset.order_by("pk")
+
+    def nested_fields(self):
+        return [field for field in self.requested if field not in self.relations]
+
+    def get_prefetches(self):
+        prefetches = []
+        for name in self.requested:
+            if name in self.relations and not self.is_foreign_key(name):
+                related = self.related_resource(name)
+                fields = related.nested_fields() if name in self.expand else []
+                prefetches.append(
+                    Prefetch(name, queryset=related.model.objects.only("pk", *fields))
+                )
+        return prefetches
+
+    def etag_source(self, objects):
+        # Versioned rows fully determine the response unless related objects
+        # are embedded, in which case the body itself is hashed.
+        if self.version_field and not self.expand:
+            return [(obj.pk, getattr(obj, self.version_field)) for obj in objects]
+        return None
+
+    def serialize(self, obj):
+        data = {}
+        for name in self.requested:
+            if name not in self.relations:
+                data[name] = getattr(obj, name)
+            elif self.is_foreign_key(name):
+                if name in self.expand:
+                    related = getattr(obj, name)
+                    data[name] = self.serialize_nested(name, related)
+                else:
+                    data[name] = getattr(obj, f"{name}_id")
+            else:
+                related_objects = getattr(obj, name).all()
+                if name in self.expand:
+                    data[name] = [
+                        self.serialize_nested(name, related)
+                        for related in related_objects
+                    ]
+                else:
+                    data[name] = [related.pk for related in related_objects]
+        return data
+
+    def serialize_nested(self, name, obj):
+        if obj is None:
+            return None
+        related = self.related_resource(name)
+        return {field: getattr(obj, field) for field in related.nested_fields()}
+
+
+class TaskResource(Resource):
+    model = Task
+    lookup_field = "slug"
+    fields = (
+        "id",
+        "slug",
+        "name",
+        "description",
+        "deadline",
+        "is_completed",
+        "priority",
+        "version",
+    )
+    relations = {
+        "task_type": "task_types",
+        "creator": "workers",
+        "assignees": "workers",
+        "tags": "tags",
+    }
+    version_field = "version"
+
+
+class WorkerResource(Resource):
+    model = Worker
+    lookup_field = "slug"
+    fields = ("id", "username", "slug", "first_name", "last_name")
+    relations = {"position": "positions"}
+
+
+class PositionResource(Resource):
+    model = Position
+    fields = ("id", "name")
+
+
+class TaskTypeResource(Resource):
+    model = TaskType
+    fields = ("id", "name")
+
+
+class TagResource(Resource):
+    model = Tag
+    fields = ("id", "name")
+
+
+RESOURCES = {
+    "tasks": TaskResource,
+    "workers": WorkerResource,
+    "positions": PositionResource,
+    "task_types": TaskTypeResource,
+    "tags": TagResource,
+}
+
+
+def split_param(request, name):
+    value = request.GET.get(name, "")
+    return [item for item in value.split(",") if item]
+
+
+class ApiView(LoginRequiredMixin, generic.View):
+    raise_exception = True
+    resource_name = None
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return JsonResponse({"error": str(error)}, status=error.status)
+        except Http404:
+            return JsonResponse({"error": "Not found."}, status=404)
+
+    def handle_no_permission(self):
+        return JsonResponse({"error": "Authentication required."}, status=403)
+
+    def get_resource(self):
+        resource_class = RESOURCES[self.resource_name]
+        return resource_class(
+            fields=split_param(self.request, "fields"),
+            expand=split_param(self.request, "expand"),
+        )
+
+    def respond(self, resource, objects, build, links=None):
+        source = resource.etag_source(objects)
+        if source is not None:
+            # The query string covers fields, expand, ids and page size.
+            etag = self.make_etag([self.request.get_full_path(), links, source])
+            if self.etag_matches(etag):
+                return self.not_modified(etag)
+        prefetch_related_objects(objects, *resource.get_prefetches())
+        body = json.dumps(build(), cls=DjangoJSONEncoder).encode()
+        if source is None:
+            etag = self.make_etag(body)
+            if self.etag_matches(etag):
+                return self.not_modified(etag)
+        response = HttpResponse(body, content_type="application/json")
+        return self.finalize(response, etag)
+
+    def make_etag(self, source):
+        if not isinstance(source, bytes):
+            source = json.dumps(source, cls=DjangoJSONEncoder).encode()
+        return quote_etag(hashlib.sha1(source).hexdigest())
+
+    def etag_matches(self, etag):
+        if_none_match = self.request.headers.get("If-None-Match", "")
+        etags = parse_etags(if_none_match)
+        return etag in etags or "*" in etags
+
+    def not_modified(self, etag):
+        return self.finalize(HttpResponseNotModified(), etag)
+
+    def finalize(self, response, etag):
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class ApiListView(ApiView):
+    read_from_replica = True
+
+    def get(self, request):
+        resource = self.get_resource()
+        queryset = resource.get_queryset()
+        ids = split_param(request, "ids")
+        if ids:
+            if len(ids) > MAX_IDS:
+                raise ApiError(f"At most {MAX_IDS} ids can be requested at once.")
+            try:
+                ids = [int(pk) for pk in ids]
+            except ValueError:
+                raise ApiError("ids must be integers.")
+            if not all(0 < pk <= MAX_ID for pk in ids):
+                raise ApiError(f"ids must be between 1 and {MAX_ID}.")
+            queryset = queryset.filter(pk__in=ids)
+        page_size = request.GET.get("page_size", str(DEFAULT_PAGE_SIZE))
+        if not page_size.isdigit() or int(page_size) < 1:
+            raise ApiError("page_size must be a positive integer.")
+        page_size = min(int(page_size), MAX_PAGE_SIZE)
+        try:
+            page = CursorPaginator(queryset, page_size).page(request.GET.get("cursor"))
+        except InvalidCursor as error:
+            raise ApiError(str(error))
+        objects = list(page)
+
+        def build():
+            return {
+                "results": [resource.serialize(obj) for obj in objects],
+                "next": self.page_url(page.next_cursor),
+                "previous": self.page_url(page.previous_cursor),
+            }
+
+        links = [page.next_cursor, page.previous_cursor]
+        return self.respond(resource, objects, build, links)
+
+    def page_url(self, cursor):
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query["cursor"] = cursor
+        return f"{self.request.path}?{query.urlencode()}"
+
+
+class ApiDetailView(ApiView):
+    read_from_replica = True
+
+    def get(self, request, **kwargs):
+        resource = self.get_resource()
+        obj = get_object_or_404(resource.get_queryset(), **kwargs)
+        return self.respond(resource, [obj], lambda: resource.serialize(obj))
+
+
+class BulkTaskView(ApiView):
+    http_method_names = ["post"]
+
+    def get_data(self):
+        if self.request.content_type != "application/json":
+            return self.request.POST
+        try:
+            payload = json.loads(self.request.body)
+        except ValueError:
+            raise ApiError("Invalid JSON body.")
+        if not isinstance(payload, dict):
+            raise ApiError("Expected a JSON object.")
+        data = MultiValueDict()
+        for key, value in payload.items():
+            if isinstance(value, list):
+                data.setlist(key, [str(item) for item in value])
+            else:
+                data[key] = str(value)
+        return data
+
+    def post(self, request):
+        form = BulkTaskForm(self.get_data())
+        operation = None
+        if form.is_valid():
+            try:
+                operation = form.get_operation()
+            except ValidationError as error:
+                form.add_error(None, error)
+        if operation is None:
+            return JsonResponse({"errors": form.errors.get_json_data()}, status=400)
+        changed = operation.run()
+        return JsonResponse(
+            {
+                "action": operation.action,
+                "tasks": len(operation.task_ids),
+                "changed": changed,
+            }
+        )
+
+
+class DatabasePoolView(ApiView):
+    def get(self, request):
+        if not request.user.is_staff:
+            raise ApiForbidden("Staff only.")
+        return JsonResponse({"pools": pool_stats()})
@@ -0,0 +1,133 @@
+import asyncio
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
+from django.views import generic
+
+from . import views
+from .dashboard import DashboardStats
+from .models import Position, Task, Worker
+from .versions import ObjectVersion
+
+# Async variants of the read-heavy views, routed instead of the sync ones when
+# settings.ASYNC_VIEWS is set (the asgi settings profile). The page or object
+# is fetched with the async ORM; templates are still rendered synchronously
+# by the handler, in a worker thread.
+
+
+EXPORT_LINES_PER_BATCH = 1000
+
+
+async def stream_in_batches(lines):
+    # Django's ASGI handler reads a sync iterator completely before sending
+    # it. Pulling batches of lines in a thread keeps the export streaming.
+    lines = iter(lines)
+    next_batch = sync_to_async(lambda: list(islice(lines, EXPORT_LINES_PER_BATCH)))
+    while batch := await next_batch():
+        for line in batch:
+            yield line
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    async def dispatch(self, request, *args, **kwargs):
+        # request.user is loaded lazily by the sync ORM, so it is resolved in a
+        # thread before LoginRequiredMixin looks at it.
+        await sync_to_async(lambda: request.user.is_authenticated)()
+        response = super(AsyncLoginRequiredMixin, self).dispatch(
+            request, *args, **kwargs
+        )
+        if asyncio.iscoroutine(response):
+            response = await response
+        return response
+
+
+class AsyncListMixin:
+    page = None
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = self.get_queryset()
+        page_size = self.get_paginate_by(self.object_list)
+        self.page = await self.apaginate_queryset(self.object_list, page_size)
+        return self.render_to_response(self.get_context_data())
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.page is not None:
+            return self.page
+        return super(AsyncListMixin, self).paginate_queryset(queryset, page_size)
+
+
+class AsyncDetailMixin:
+    async def aget_object(self):
+        queryset = self.get_queryset()
+        slug = self.kwargs.get(self.slug_url_kwarg)
+        try:
+            return await queryset.aget(**{self.get_slug_field(): slug})
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f"No {queryset.model._meta.verbose_name} found matching the query"
+            )
+
+    def get_base_context_data(self, **kwargs):
+        # DetailView's context, without the sync view's extra queries.
+        return generic.detail.SingleObjectMixin.get_context_data(self, **kwargs)
+
+
+class HomePage(AsyncLoginRequiredMixin, generic.TemplateView):
+    template_name = "task_manager/index.html"
+    read_from_replica = True
+
+    async def get(self, request, *args, **kwargs):
+        context = self.get_context_data(**kwargs)
+        context.update(await DashboardStats.aget())
+        return self.render_to_response(context)
+
+
+class TaskListView(AsyncLoginRequiredMixin, AsyncListMixin, views.TaskListView):
+    pass
+
+
+class WorkerListView(AsyncLoginRequiredMixin, AsyncListMixin, views.WorkerListView):
+    pass
+
+
+class TaskDetailView(AsyncLoginRequiredMixin, AsyncDetailMixin, views.TaskDetailView):
+    async def get(self, request, *args, **kwargs):
+        self.object = task = await self.aget_object()
+        # Awaited one after another: with a sync middleware in the chain these
+        # calls share the request thread, and gathering them deadlocks it.
+        is_assignee = await task.assignees.filter(pk=request.user.pk).aexists()
+        fragment_version = await sync_to_async(ObjectVersion.get)(
+            (Task, task.pk), Worker, Position
+        )
+        context = self.get_base_context_data(
+            is_assignee=is_assignee,
+            assignees=task.assignees.for_list(),
+            fragment_version=fragment_version,
+        )
+        return self.render_to_response(context)
+
+
+class WorkerDetailView(
+    AsyncLoginRequiredMixin, AsyncDetailMixin, views.WorkerDetailView
+):
+    async def get(self, request, *args, **kwargs):
+        self.object = worker = await self.aget_object()
+        # Both lists are only evaluated if the cached fragment is rendered.
+        context = self.get_base_context_data(
+            completed_tasks=worker.tasks.for_list().filter(is_completed=True),
+            tasks_in_work=worker.tasks.for_list().filter(is_completed=False),
+            fragment_version=await sync_to_async(ObjectVersion.get)(
+                (Worker, worker.pk)
+            ),
+        )
+        return self.render_to_response(context)
+
+
+class TaskExportView(views.TaskExportView):
+    def get(self, request):
+        response = super(TaskExportView, self).get(request)
+        if response.streaming:
+            response.streaming_content = stream_in_batches(response.streaming_content)
+        return response
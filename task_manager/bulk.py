@@ -0,0 +1,175 @@
+from django.db import transaction
+from django.db.models import F
+from django.dispatch import Signal
+
+from task_manager.models import Task
+
+MAX_TASKS = 5000
+BATCH_SIZE = 1000
+
+# Sent once per bulk operation (and per imported batch, with action "create"),
+# after it has been applied. Row-level signals are not sent for the updates,
+# so caches and indexes are refreshed from here.
+tasks_bulk_changed = Signal()
+
+
+class BulkTaskOperation:
+    actions = ("complete", "reopen", "assign", "unassign", "tag", "untag", "delete")
+
+    def __init__(self, action, task_ids, worker_ids=(), tag_ids=()):
+        if action not in self.actions:
+            raise ValueError(f"Unknown bulk action: {action}")
+        self.action = action
+        self.task_ids = list(task_ids)
+        self.worker_ids = list(worker_ids)
+        self.tag_ids = list(tag_ids)
+
+    def tasks(self):
+        return Task.objects.filter(pk__in=self.task_ids)
+
+    def assignments(self):
+        return Task.assignees.through.objects.filter(task_id__in=self.task_ids)
+
+    def taggings(self):
+        return Task.tags.through.objects.filter(task_id__in=self.task_ids)
+
+    def run(self):
+        with transaction.atomic():
+            affected_workers = self.affected_worker_ids()
+            changed = getattr(self, self.action)()
+        tasks_bulk_changed.send(
+            sender=Task,
+            action=self.action,
+            task_ids=self.task_ids,
+            worker_ids=affected_workers,
+        )
+        return changed
+
+    def affected_worker_ids(self):
+        if self.action in ("assign", "unassign"):
+            return self.worker_ids
+        if self.action in ("tag", "untag"):
+            return []
+        return list(self.assignments().values_list("worker_id", flat=True).distinct())
+
+    def bump_versions(self):
+        return self.tasks().update(version=F("version") + 1)
+
+    def set_completed(self, is_completed):
+        return (
+            self.tasks()
+            .exclude(is_completed=is_completed)
+            .update(is_completed=is_completed, version=F("version") + 1)
+        )
+
+    def complete(self):
+        return self.set_completed(True)
+
+    def reopen(self):
+        return self.set_completed(False)
+
+    def assign(self):
+        through = Task.assignees.through
+        through.objects.bulk_create(
+            [
+                through(task_id=task_id, worker_id=worker_id)
+                for task_id in self.task_ids
+                for worker_id in self.worker_ids
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        return self.bump_versions()
+
+    def unassign(self):
+        self.assignments().filter(worker_id__in=self.worker_ids).delete()
+        return self.bump_versions()
+
+    def tag(self):
+        through = Task.tags.through
+        through.objects.bulk_create(
+            [
+                through(task_id=task_id, tag_id=tag_id)
+                for task_id in self.task_ids
+                for tag_id in self.tag_ids
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        return self.bump_versions()
+
+    def untag(self):
+        self.taggings().filter(tag_id__in=self.tag_ids).delete()
+        return self.bump_versions()
+
+    def delete(self):
+        # Tasks only own their m2m rows, remove those first and then delete
+        # the tasks in one statement instead of one signal round per row.
+        self.assignments().delete()
+        self.taggings().delete()
+        return delete_rows(self.tasks())
+
+
+def referring_models(model):
+    # Models with a foreign key to model, auto-created m2m tables included.
+    return {
+        field.related_model
+        for field in model._meta.get_fields(include_hidden=True)
+        if field.auto_created
+        and not field.concrete
+        and (field.one_to_many or field.one_to_one)
+    }
+
+
+def delete_rows(queryset):
+    # One DELETE statement, without the collector and per-row signals of
+    # QuerySet.delete(). It relies on private API and ignores on_delete, so
+    # rows referring to the deleted ones must have been removed already
+    # (tests/test_bulk.py checks which models can refer to tasks).
+    return queryset._raw_delete(queryset.db)
+
+
+def toggle_completed(slug):
+    # The flag is flipped by the database, so concurrent toggles never
+    # overwrite each other. The row stays locked until commit, so the state
+    # read back is the one this toggle produced.
+    with transaction.atomic():
+        tasks = Task.objects.filter(slug=slug)
+        if not tasks.update(is_completed=~F("is_completed"), version=F("version") + 1):
+            return None
+        # One row per assignee (or a single row with None).
+        rows = list(tasks.values_list("pk", "is_completed", "assignees"))
+    task_id, is_completed, _ = rows[0]
+    worker_ids = [worker_id for _, _, worker_id in rows if worker_id is not None]
+    tasks_bulk_changed.send(
+        sender=Task,
+        action="complete" if is_completed else "reopen",
+        task_ids=[task_id],
+        worker_ids=worker_ids,
+    )
+    return is_completed
+
+
+def toggle_assignee(slug, worker_id):
+    # The version bump comes first and locks the task row, so toggles of the
+    # same task are applied one after the other. Removing the row doubles as
+    # the membership check: only when nothing was deleted is the worker
+    # assigned.
+    through = Task.assignees.through
+    with transaction.atomic():
+        tasks = Task.objects.filter(slug=slug)
+        if not tasks.update(version=F("version") + 1):
+            return None
+        task_id = tasks.values_list("pk", flat=True).get()
+        removed, _ = through.objects.filter(
+            task_id=task_id, worker_id=worker_id
+        ).delete()
+        if not removed:
+            through.objects.create(task_id=task_id, worker_id=worker_id)
+    tasks_bulk_changed.send(
+        sender=Task,
+        action="unassign" if removed else "assign",
+        task_ids=[task_id],
+        worker_ids=[worker_id],
+    )
+    return not removed
@@ -0,0 +1,221 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULTS = {
+    # Django cache alias used as the shared tier, None for in-process only.
+    "ALIAS": "default",
+    "KEY_PREFIX": "task_manager",
+    "LOCAL_MAX_ENTRIES": 1000,
+    # Other processes only see writes through the shared tier, so the local
+    # copy of a value is trusted for a few seconds at most.
+    "LOCAL_TIMEOUT": 5,
+    # Upper bound for the timeouts of unversioned namespaces, None for none.
+    # Set it when the shared tier is not shared between processes: their
+    # invalidations do not reach each other, so values that can go stale under
+    # the same key may not be cached for longer than that is tolerable.
+    "MAX_TIMEOUT": None,
+}
+MISSING = object()
+
+
+def get_config():
+    return {**DEFAULTS, **getattr(settings, "TASK_MANAGER_CACHE", {})}
+
+
+class LocalLRU:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is None:
+                return MISSING
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self.data[key]
+                return MISSING
+            self.data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout):
+        if self.max_entries <= 0:
+            return
+        expires = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            self.data[key] = (value, expires)
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_entries:
+                self.data.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.data.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+    def __len__(self):
+        return len(self.data)
+
+
+class Namespace:
+    # Keys of a versioned namespace embed the versions of what their values
+    # were built from, so a value never goes stale under its key.
+    def __init__(self, name, timeout=300, versioned=False):
+        self.name = name
+        self.timeout = timeout
+        self.versioned = versioned
+        self.stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+        self.configure()
+
+    def configure(self):
+        config = get_config()
+        self.prefix = f"{config['KEY_PREFIX']}:{self.name}"
+        self.local_timeout = config["LOCAL_TIMEOUT"]
+        self.max_timeout = config["MAX_TIMEOUT"]
+        self.local = LocalLRU(config["LOCAL_MAX_ENTRIES"])
+        self.alias = config["ALIAS"]
+
+    @property
+    def shared(self):
+        # Django cache connections are per thread, look them up every time.
+        return caches[self.alias] if self.alias else None
+
+    def key(self, *parts):
+        return ":".join([self.prefix, *map(str, parts)])
+
+    def capped(self, timeout):
+        if self.max_timeout is None or self.versioned:
+            return timeout
+        if timeout is None:
+            return self.max_timeout
+        return min(timeout, self.max_timeout)
+
+    def local_ttl(self, timeout):
+        if self.shared is None:
+            return timeout
+        if timeout is None:
+            return self.local_timeout
+        return min(timeout, self.local_timeout)
+
+    def count(self, stat, amount=1):
+        self.stats[stat] += amount
+
+    def get(self, key, default=None):
+        value = self.local.get(key)
+        if value is not MISSING:
+            self.count("local_hits")
+            return value
+        shared = self.shared
+        if shared is not None:
+            value = shared.get(key, MISSING)
+            if value is not MISSING:
+                self.count("shared_hits")
+                self.local.set(key, value, self.local_ttl(self.timeout))
+                return value
+        self.count("misses")
+        return default
+
+    def get_many(self, keys):
+        found = {}
+        for key in keys:
+            value = self.local.get(key)
+            if value is not MISSING:
+                found[key] = value
+        self.count("local_hits", len(found))
+        remaining = [key for key in keys if key not in found]
+        shared = self.shared
+        if remaining and shared is not None:
+            values = shared.get_many(remaining)
+            self.count("shared_hits", len(values))
+            for key, value in values.items():
+                self.local.set(key, value, self.local_ttl(self.timeout))
+            found.update(values)
+        self.count("misses", len(keys) - len(found))
+        return found
+
+    def set(self, key, value, timeout=MISSING):
+        timeout = self.capped(self.timeout if timeout is MISSING else timeout)
+        if self.shared is not None:
+            self.shared.set(key, value, timeout)
+        self.local.set(key, value, self.local_ttl(timeout))
+
+    def set_many(self, data, timeout=MISSING):
+        timeout = self.capped(self.timeout if timeout is MISSING else timeout)
+        if self.shared is not None:
+            self.shared.set_many(data, timeout)
+        for key, value in data.items():
+            self.local.set(key, value, self.local_ttl(timeout))
+
+    def get_or_set(self, key, default, timeout=MISSING):
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            value = default() if callable(default) else default
+            self.set(key, value, timeout)
+        return value
+
+    def incr(self, key, delta=1):
+        # Raises ValueError for a missing key, like Django's cache.incr().
+        shared = self.shared
+        if shared is not None:
+            value = shared.incr(key, delta)
+        else:
+            value = self.local.get(key)
+            if value is MISSING:
+                raise ValueError(f"Key '{key}' not found")
+            value += delta
+        self.local.set(key, value, self.local_ttl(self.capped(self.timeout)))
+        return value
+
+    def delete(self, key):
+        if self.shared is not None:
+            self.shared.delete(key)
+        self.local.delete(key)
+
+    def clear_local(self):
+        self.local.clear()
+
+
+namespaces = {}
+
+
+def namespace(name, timeout=300, versioned=False):
+    if name not in namespaces:
+        namespaces[name] = Namespace(name, timeout, versioned)
+    return namespaces[name]
+
+
+def stats():
+    return {name: dict(ns.stats) for name, ns in namespaces.items()}
+
+
+def reset_stats():
+    for ns in namespaces.values():
+        for stat in ns.stats:
+            ns.stats[stat] = 0
+
+
+def clear():
+    # Empties the local tiers and the shared caches behind them.
+    for ns in namespaces.values():
+        ns.clear_local()
+        shared = ns.shared
+        if shared is not None:
+            shared.clear()
+
+
+@receiver(setting_changed)
+def reconfigure(setting, **kwargs):
+    if setting in ("TASK_MANAGER_CACHE", "CACHES"):
+        for ns in namespaces.values():
+            ns.configure()
@@ -0,0 +1,70 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections, router
+from django.utils import timezone
+
+from task_manager.cache import namespace
+from task_manager.db.routers import reading_from_replica
+from task_manager.models import Position, Task, Worker, start_of_today
+
+
+class DashboardStats:
+    cache = namespace("dashboard", timeout=60 * 60)
+    fields = (
+        "num_workers",
+        "num_positions",
+        "num_tasks",
+        "tasks_in_work",
+        "completed_tasks",
+        "overdue_tasks",
+    )
+
+    @classmethod
+    def cache_key(cls):
+        # Tasks become overdue at midnight without any write to invalidate on.
+        return cls.cache.key("stats", timezone.localdate())
+
+    @classmethod
+    def get(cls):
+        # Counts read from a replica may predate the write that invalidated
+        # the snapshot, so they are kept only as long as writers are pinned
+        # to the primary.
+        timeout = cls.cache.timeout
+        if reading_from_replica():
+            timeout = settings.REPLICA_STICKY_SECONDS
+        return cls.cache.get_or_set(cls.cache_key(), cls.compute, timeout)
+
+    @classmethod
+    async def aget(cls):
+        return await sync_to_async(cls.get)()
+
+    @classmethod
+    def compute(cls):
+        # One round-trip regardless of table sizes: the task counters are
+        # conditional aggregates, the worker/position totals are scalar
+        # subqueries evaluated in the same statement. The overdue count is a
+        # subquery too, so that it reads the partial open-deadline index.
+        connection = connections[router.db_for_read(Task)]
+        quote = connection.ops.quote_name
+        is_completed = quote("is_completed")
+        task_table = quote(Task._meta.db_table)
+        sql = (
+            f"SELECT "
+            f"(SELECT COUNT(*) FROM {quote(Worker._meta.db_table)}), "
+            f"(SELECT COUNT(*) FROM {quote(Position._meta.db_table)}), "
+            f"COUNT(*), "
+            f"COALESCE(SUM(CASE WHEN {is_completed} THEN 0 ELSE 1 END), 0), "
+            f"COALESCE(SUM(CASE WHEN {is_completed} THEN 1 ELSE 0 END), 0), "
+            f"(SELECT COUNT(*) FROM {task_table} "
+            f"WHERE NOT {is_completed} AND {quote('deadline')} < %s) "
+            f"FROM {task_table}"
+        )
+        today = connection.ops.adapt_datetimefield_value(start_of_today())
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [today])
+            row = cursor.fetchone()
+        return dict(zip(cls.fields, (int(value) for value in row)))
+
+    @classmethod
+    def invalidate(cls):
+        cls.cache.delete(cls.cache_key())
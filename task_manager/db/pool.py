@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+from collections import deque
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    # Keeps up to max_size DB-API connections of one process. Checkouts take
+    # the most recently returned connection, so under light load the older
+    # ones go idle for max_idle seconds and are closed.
+    def __init__(
+        self, max_size=10, timeout=5.0, max_idle=300.0, check=None, reset=None
+    ):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.check = check
+        self.reset = reset
+        self.idle = deque()
+        self.size = 0
+        self.condition = threading.Condition()
+        self.counters = dict.fromkeys(
+            ["opened", "closed", "checkouts", "waits", "timeouts", "failed_checks"], 0
+        )
+        self.wait_time = 0.0
+
+    def getconn(self, connect):
+        while True:
+            connection, returned_at = self._reserve()
+            if connection is None:
+                break
+            if self._usable(connection, returned_at):
+                return connection
+            self._discard(connection)
+        try:
+            connection = connect()
+        except Exception:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+        with self.condition:
+            self.counters["opened"] += 1
+        return connection
+
+    def putconn(self, connection):
+        if not connection.closed and self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception:
+                pass
+        if connection.closed:
+            self._discard(connection)
+            return
+        now = time.monotonic()
+        stale = []
+        with self.condition:
+            while self.idle and now - self.idle[0][1] > self.max_idle:
+                stale.append(self.idle.popleft()[0])
+            self.idle.append((connection, now))
+            self.condition.notify()
+        for connection in stale:
+            self._discard(connection)
+
+    def close(self):
+        with self.condition:
+            idle = [connection for connection, _ in self.idle]
+            self.idle.clear()
+        for connection in idle:
+            self._discard(connection)
+
+    def stats(self):
+        with self.condition:
+            idle = len(self.idle)
+            return {
+                **self.counters,
+                "size": self.size,
+                "idle": idle,
+                "in_use": self.size - idle,
+                "max_size": self.max_size,
+                "wait_time_ms": round(self.wait_time * 1000, 3),
+            }
+
+    def _reserve(self):
+        # Returns an idle connection, or (None, None) once a slot for a new
+        # connection is reserved; waits up to timeout when the pool is full.
+        with self.condition:
+            self.counters["checkouts"] += 1
+            if not self.idle and self.size >= self.max_size:
+                self.counters["waits"] += 1
+                start = time.monotonic()
+                deadline = start + self.timeout
+                while not self.idle and self.size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.counters["timeouts"] += 1
+                        self.wait_time += time.monotonic() - start
+                        raise PoolTimeout(
+                            f"No connection available within {self.timeout}s "
+                            f"({self.max_size} in use)."
+                        )
+                    self.condition.wait(remaining)
+                self.wait_time += time.monotonic() - start
+            if self.idle:
+                return self.idle.pop()
+            self.size += 1
+            return None, None
+
+    def _usable(self, connection, returned_at):
+        if connection.closed or time.monotonic() - returned_at > self.max_idle:
+            return False
+        if self.check is not None and not self.check(connection):
+            with self.condition:
+                self.counters["failed_checks"] += 1
+            return False
+        return True
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self.condition:
+            self.size -= 1
+            self.counters["closed"] += 1
+            self.condition.notify()
+
+
+def get_pool(alias, database, **options):
+    # One pool per process: a forked worker must not share its parent's
+    # sockets, so the pid is part of the key.
+    key = (os.getpid(), alias, database)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(**options)
+        return _pools[key]
+
+
+def process_pools():
+    pid = os.getpid()
+    with _pools_lock:
+        return [(key[1:], pool) for key, pool in _pools.items() if key[0] == pid]
+
+
+def pool_stats():
+    return [
+        {"alias": alias, "database": database, **pool.stats()}
+        for (alias, database), pool in process_pools()
+    ]
+
+
+def close_pools():
+    for _, pool in process_pools():
+        pool.close()
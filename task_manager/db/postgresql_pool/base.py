@@ -0,0 +1,63 @@
+from django.db.backends.postgresql import base
+
+from task_manager.db.pool import PoolTimeout, get_pool
+
+# connection.info.transaction_status of an idle connection, in psycopg2 and 3.
+TRANSACTION_STATUS_IDLE = 0
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    # PostgreSQL with an in-process pool: closing a connection (at the end of
+    # each request when CONN_MAX_AGE is 0) hands it back to the pool instead
+    # of dropping the socket. Configured with the "POOL" key of the database.
+    def get_pool(self):
+        options = self.settings_dict.get("POOL", {})
+        check = (
+            self.check_connection if self.settings_dict["CONN_HEALTH_CHECKS"] else None
+        )
+        return get_pool(
+            self.alias,
+            self.settings_dict["NAME"],
+            max_size=options.get("MAX_SIZE", 10),
+            timeout=options.get("TIMEOUT", 5.0),
+            max_idle=options.get("MAX_IDLE", 300.0),
+            check=check,
+            reset=self.reset_connection,
+        )
+
+    def get_new_connection(self, conn_params):
+        def connect():
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+
+        try:
+            return self.get_pool().getconn(connect)
+        except PoolTimeout as error:
+            raise self.Database.OperationalError(str(error)) from error
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.get_pool().putconn(self.connection)
+
+    @staticmethod
+    def check_connection(connection):
+        # Only idle connections are checked, and outside autocommit the query
+        # is rolled back: it must not hand out a connection inside a
+        # transaction it opened itself.
+        if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if not connection.autocommit:
+                connection.rollback()
+        except base.Database.Error:
+            return False
+        return True
+
+    @staticmethod
+    def reset_connection(connection):
+        # A connection given back inside a transaction (e.g. after an error)
+        # is rolled back before the next checkout.
+        if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+            connection.rollback()
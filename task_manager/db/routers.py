@@ -0,0 +1,42 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_replica_reads = ContextVar("replica_reads", default=False)
+
+# Sessions are written by most requests and read back by the next one.
+PRIMARY_ONLY_APPS = {"sessions"}
+
+
+@contextmanager
+def replica_reads(enabled=True):
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def reading_from_replica():
+    return _replica_reads.get() and bool(settings.DATABASE_REPLICAS)
+
+
+class ReplicaRouter:
+    # Reads inside replica_reads() go to a random DATABASE_REPLICAS alias,
+    # everything else (writes included) to the primary.
+    def db_for_read(self, model, **hints):
+        if not reading_from_replica() or model._meta.app_label in PRIMARY_ONLY_APPS:
+            return "default"
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        # Without this, saving an object read from a replica would write to it.
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db not in settings.DATABASE_REPLICAS
@@ -0,0 +1,104 @@
+import csv
+import json
+from collections import defaultdict
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from task_manager.models import Task
+
+CHUNK_SIZE = 2000
+
+FIELDS = [
+    "id",
+    "slug",
+    "name",
+    "description",
+    "deadline",
+    "priority",
+    "is_completed",
+    "task_type",
+    "creator",
+    "assignees",
+    "tags",
+]
+
+NAME_FIELDS = {"worker": "username", "tag": "name"}
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def export_queryset(queryset=None):
+    if queryset is None:
+        queryset = Task.objects.all()
+    return queryset.for_export()
+
+
+def related_names(through, related_field, task_ids, using):
+    names = defaultdict(list)
+    rows = (
+        through.objects.using(using)
+        .filter(task_id__in=task_ids)
+        .order_by("pk")
+        .values_list("task_id", f"{related_field}__{NAME_FIELDS[related_field]}")
+    )
+    for task_id, name in rows:
+        names[task_id].append(name)
+    return names
+
+
+def export_chunk(chunk, using):
+    task_ids = [row["id"] for row in chunk]
+    assignees = related_names(Task.assignees.through, "worker", task_ids, using)
+    tags = related_names(Task.tags.through, "tag", task_ids, using)
+    for row in chunk:
+        row["task_type"] = row.pop("task_type_name")
+        row["creator"] = row.pop("creator_name")
+        row["assignees"] = assignees[row["id"]]
+        row["tags"] = tags[row["id"]]
+        yield row
+
+
+def export_rows(queryset=None, chunk_size=CHUNK_SIZE):
+    # Rows are read through a server-side cursor where the database supports
+    # it; assignees and tags are fetched per chunk with one query each, so
+    # memory use depends on chunk_size and not on the number of tasks. The
+    # names come from the same database as the rows.
+    rows = export_queryset(queryset)
+    chunk = []
+    for row in rows.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield from export_chunk(chunk, rows.db)
+            chunk = []
+    yield from export_chunk(chunk, rows.db)
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(FIELDS)
+    for row in rows:
+        row["assignees"] = ";".join(row["assignees"])
+        row["tags"] = ";".join(row["tags"])
+        yield writer.writerow([row[field] for field in FIELDS])
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def export_lines(export_format, queryset=None, chunk_size=CHUNK_SIZE):
+    rows = export_rows(queryset, chunk_size=chunk_size)
+    if export_format == "csv":
+        return csv_lines(rows)
+    if export_format == "ndjson":
+        return ndjson_lines(rows)
+    raise ValueError(f"Unknown export format: {export_format}")
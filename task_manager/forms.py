@@ -7,19 +7,21 @@ from django.core.exceptions import ValidationError
 from django.db.models import Q
 from django.utils.text import slugify
 
+from task_manager.bulk import MAX_TASKS, BulkTaskOperation
+from task_manager.importer import FORMATS
 from task_manager.models import Task, Worker, Tag
+from task_manager.search import search_tasks
 
 
 class TaskForm(forms.ModelForm):
     assignees = forms.ModelMultipleChoiceField(
-        queryset=get_user_model().objects.all(),
+        queryset=get_user_model().objects.select_related("position"),
         widget=forms.CheckboxSelectMultiple,
     )
     deadline = forms.DateTimeField(widget=forms.DateInput(attrs={"type": "date"}))
     tags = forms.ModelMultipleChoiceField(
         queryset=Tag.objects.all(), widget=forms.CheckboxSelectMultiple, required=False
     )
-    slug = forms.SlugField(required=False, widget=forms.HiddenInput())
 
     class Meta:
         model = Task
@@ -32,7 +34,6 @@ class TaskForm(forms.ModelForm):
             "task_type",
             "assignees",
             "tags",
-            "slug",
         )
 
     def clean(self):
@@ -44,8 +45,8 @@ class TaskForm(forms.ModelForm):
 
         name = cleaned_data.get("name")
         if name:
-            slug = slugify(name)
-            cleaned_data["slug"] = slug
+            # Task.save() turns this into a unique slug.
+            self.instance.slug = slugify(name)
 
         return cleaned_data
 
@@ -96,16 +97,73 @@ class TaskSearchForm(forms.Form):
         label="",
         widget=forms.TextInput(attrs={"placeholder": "Search task..."}),
     )
+    status = forms.ChoiceField(
+        choices=[("", "All tasks")] + Task.STATUS_CHOICES,
+        required=False,
+        label="",
+    )
 
     def search(self, queryset):
         search_query = self.cleaned_data.get("search_query")
         if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query) | Q(tags__name__icontains=search_query)
-            )
+            queryset = search_tasks(queryset, search_query)
+        status = self.cleaned_data.get("status")
+        if status:
+            queryset = queryset.by_status(status)
         return queryset
 
 
+class BulkTaskForm(TaskSearchForm):
+    ACTION_CHOICES = [(action, action) for action in BulkTaskOperation.actions]
+    action = forms.ChoiceField(choices=ACTION_CHOICES)
+    ids = forms.ModelMultipleChoiceField(
+        queryset=Task.objects.only("pk"), required=False
+    )
+    workers = forms.ModelMultipleChoiceField(
+        queryset=Worker.objects.only("pk"), required=False
+    )
+    tags = forms.ModelMultipleChoiceField(
+        queryset=Tag.objects.only("pk"), required=False
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get("ids") and not cleaned_data.get("search_query"):
+            raise ValidationError("Select tasks by ids or by a search query.")
+        action = cleaned_data.get("action")
+        if action in ("assign", "unassign") and not cleaned_data.get("workers"):
+            self.add_error("workers", "This action needs at least one worker.")
+        if action in ("tag", "untag") and not cleaned_data.get("tags"):
+            self.add_error("tags", "This action needs at least one tag.")
+        return cleaned_data
+
+    def get_task_ids(self):
+        queryset = Task.objects.all()
+        if self.cleaned_data["ids"]:
+            queryset = queryset.filter(pk__in=self.cleaned_data["ids"])
+        queryset = self.search(queryset).order_by()
+        task_ids = list(queryset.values_list("pk", flat=True)[: MAX_TASKS + 1])
+        if len(task_ids) > MAX_TASKS:
+            raise ValidationError(f"At most {MAX_TASKS} tasks can be changed at once.")
+        return task_ids
+
+    def get_operation(self):
+        return BulkTaskOperation(
+            self.cleaned_data["action"],
+            self.get_task_ids(),
+            worker_ids=[worker.pk for worker in self.cleaned_data["workers"]],
+            tag_ids=[tag.pk for tag in self.cleaned_data["tags"]],
+        )
+
+
+class TaskImportForm(forms.Form):
+    FORMAT_CHOICES = [("", "Detect from file name")] + [
+        (import_format, import_format.upper()) for import_format in FORMATS
+    ]
+    file = forms.FileField()
+    format = forms.ChoiceField(choices=FORMAT_CHOICES, required=False)
+
+
 class WorkerSearchForm(forms.Form):
     search_query = forms.CharField(
         max_length=255,
@@ -125,7 +183,38 @@ class WorkerSearchForm(forms.Form):
         return queryset
 
 
-class PositionSearchForm(forms.Form):
+class UsageSearchForm(forms.Form):
+    usage_field = None
+    ORDERING_CHOICES = [
+        ("", "Sort by name"),
+        ("-usage", "Most used first"),
+        ("usage", "Least used first"),
+    ]
+    min_usage = forms.IntegerField(
+        min_value=0,
+        required=False,
+        label="",
+        widget=forms.NumberInput(attrs={"placeholder": "Used at least..."}),
+    )
+    ordering = forms.ChoiceField(choices=ORDERING_CHOICES, required=False, label="")
+    field_order = ["name", "min_usage", "ordering"]
+
+    def search(self, queryset):
+        name = self.cleaned_data.get("name")
+        if name:
+            queryset = queryset.filter(name__icontains=name)
+        min_usage = self.cleaned_data.get("min_usage")
+        if min_usage is not None:
+            queryset = queryset.filter(**{f"{self.usage_field}__gte": min_usage})
+        ordering = self.cleaned_data.get("ordering")
+        if ordering:
+            field = ordering.replace("usage", self.usage_field)
+            queryset = queryset.order_by(field, "name")
+        return queryset
+
+
+class PositionSearchForm(UsageSearchForm):
+    usage_field = "num_workers"
     name = forms.CharField(
         max_length=255,
         required=False,
@@ -134,7 +223,8 @@ class PositionSearchForm(forms.Form):
     )
 
 
-class TaskTypeSearchForm(forms.Form):
+class TaskTypeSearchForm(UsageSearchForm):
+    usage_field = "num_tasks"
     name = forms.CharField(
         max_length=255,
         required=False,
@@ -143,7 +233,8 @@ class TaskTypeSearchForm(forms.Form):
     )
 
 
-class TagSearchForm(forms.Form):
+class TagSearchForm(UsageSearchForm):
+    usage_field = "num_tasks"
     name = forms.CharField(
         max_length=255,
         required=False,
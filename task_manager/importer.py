@@ -0,0 +1,189 @@
+import csv
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from task_manager.bulk import tasks_bulk_changed
+from task_manager.models import Tag, Task, TaskType, Worker
+from task_manager.slugs import MAX_ATTEMPTS, allocate_slugs
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+FORMATS = ("csv", "ndjson")
+
+# Columns checked by Task.clean_fields(); relations are resolved by name.
+VALIDATED_FIELDS = {"name", "description", "deadline", "is_completed", "priority"}
+UNVALIDATED_FIELDS = [
+    field.name for field in Task._meta.fields if field.name not in VALIDATED_FIELDS
+]
+
+
+def detect_format(filename):
+    if filename.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return "csv"
+
+
+def read_rows(stream, import_format):
+    # Yields (line number, row, error) one record at a time.
+    if import_format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row, None
+    elif import_format == "ndjson":
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_number, None, "Invalid JSON."
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Expected a JSON object."
+                continue
+            yield line_number, row, None
+    else:
+        raise ValueError(f"Unknown import format: {import_format}")
+
+
+def split_names(value):
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(name).strip() for name in value if str(name).strip()]
+    return [name.strip() for name in str(value).split(";") if name.strip()]
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, line, messages):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, messages))
+
+
+class TaskImporter:
+    def __init__(self, creator=None, batch_size=BATCH_SIZE):
+        self.creator = creator
+        self.batch_size = batch_size
+        # Lookups by name are loaded once, rows are resolved in memory.
+        self.task_types = dict(TaskType.objects.values_list("name", "pk"))
+        self.tags = dict(Tag.objects.values_list("name", "pk"))
+        self.workers = dict(Worker.objects.values_list("username", "pk"))
+
+    def run(self, stream, import_format="csv"):
+        result = ImportResult()
+        batch = []
+        for line, row, error in read_rows(stream, import_format):
+            if error:
+                result.add_error(line, [error])
+                continue
+            try:
+                batch.append(self.build(row))
+            except ValidationError as error:
+                result.add_error(line, error.messages)
+                continue
+            if len(batch) == self.batch_size:
+                result.created += self.save(batch)
+                batch = []
+        if batch:
+            result.created += self.save(batch)
+        return result
+
+    def resolve(self, lookup, names, label):
+        missing = [name for name in names if name not in lookup]
+        if missing:
+            raise ValidationError(f"Unknown {label}: {', '.join(missing)}.")
+        return [lookup[name] for name in names]
+
+    def build(self, row):
+        errors = []
+        values = {
+            field: row.get(field)
+            for field in VALIDATED_FIELDS
+            if row.get(field) not in (None, "")
+        }
+        task = Task(**values)
+        try:
+            task.clean_fields(exclude=UNVALIDATED_FIELDS)
+        except ValidationError as error:
+            errors.extend(
+                f"{field}: {message}"
+                for field, messages in error.message_dict.items()
+                for message in messages
+            )
+        if not errors and timezone.is_naive(task.deadline):
+            task.deadline = timezone.make_aware(task.deadline)
+        task.slug = row.get("slug") or task.name
+
+        relations = [
+            ("task_type", self.task_types, "task type"),
+            ("creator", self.workers, "worker"),
+            ("assignees", self.workers, "worker"),
+            ("tags", self.tags, "tag"),
+        ]
+        resolved = {}
+        for field, lookup, label in relations:
+            try:
+                resolved[field] = self.resolve(
+                    lookup, split_names(row.get(field)), label
+                )
+            except ValidationError as error:
+                errors.extend(f"{field}: {message}" for message in error.messages)
+        if not errors and len(resolved["task_type"]) != 1:
+            errors.append("task_type: Exactly one task type is required.")
+        if not errors and len(resolved["creator"]) > 1:
+            errors.append("creator: At most one creator can be given.")
+        if errors:
+            raise ValidationError(errors)
+
+        task.task_type_id = resolved["task_type"][0]
+        if resolved["creator"]:
+            task.creator_id = resolved["creator"][0]
+        elif self.creator:
+            task.creator_id = self.creator.pk
+        return task, resolved["assignees"], resolved["tags"]
+
+    def save(self, batch):
+        tasks = [task for task, _, _ in batch]
+        requested = [task.slug for task in tasks]
+        for attempt in range(MAX_ATTEMPTS):
+            for task, slug in zip(tasks, allocate_slugs(Task, requested)):
+                task.slug = slug
+            try:
+                return self.insert(batch)
+            except IntegrityError:
+                # Another writer took one of the slugs, allocate them again.
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+
+    def insert(self, batch):
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create([task for task, _, _ in batch])
+            assignments = []
+            taggings = []
+            for task, (_, worker_ids, tag_ids) in zip(tasks, batch):
+                assignments.extend(
+                    Task.assignees.through(task_id=task.pk, worker_id=worker_id)
+                    for worker_id in set(worker_ids)
+                )
+                taggings.extend(
+                    Task.tags.through(task_id=task.pk, tag_id=tag_id)
+                    for tag_id in set(tag_ids)
+                )
+            Task.assignees.through.objects.bulk_create(assignments)
+            Task.tags.through.objects.bulk_create(taggings)
+        tasks_bulk_changed.send(
+            sender=Task,
+            action="create",
+            task_ids=[task.pk for task in tasks],
+            worker_ids=list({assignment.worker_id for assignment in assignments}),
+        )
+        return len(tasks)
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.export import CHUNK_SIZE, CONTENT_TYPES, export_lines
+from task_manager.forms import TaskSearchForm
+from task_manager.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream every task, or those matching a search query and status, as CSV "
+        "or NDJSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=list(CONTENT_TYPES), default="csv")
+        parser.add_argument("--search-query", default="")
+        parser.add_argument(
+            "--status",
+            choices=[status for status, _ in Task.STATUS_CHOICES],
+            default="",
+        )
+        parser.add_argument(
+            "--output", help="File to write to, defaults to standard output."
+        )
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        form = TaskSearchForm(
+            {"search_query": options["search_query"], "status": options["status"]}
+        )
+        if not form.is_valid():
+            raise CommandError(form.errors.as_text())
+        lines = export_lines(
+            options["format"],
+            form.search(Task.objects.all()),
+            chunk_size=options["chunk_size"],
+        )
+        if options["output"]:
+            with open(options["output"], "w", newline="", encoding="utf-8") as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.importer import BATCH_SIZE, FORMATS, TaskImporter, detect_format
+from task_manager.models import Worker
+
+
+class Command(BaseCommand):
+    help = "Create tasks from a CSV or NDJSON file in the format of export_tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format", choices=FORMATS, help="Defaults to the file extension."
+        )
+        parser.add_argument(
+            "--creator", help="Username used for rows without a creator."
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        creator = None
+        if options["creator"]:
+            try:
+                creator = Worker.objects.get(username=options["creator"])
+            except Worker.DoesNotExist:
+                raise CommandError(f"Unknown worker: {options['creator']}")
+        import_format = options["format"] or detect_format(options["path"])
+        importer = TaskImporter(creator=creator, batch_size=options["batch_size"])
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as stream:
+                result = importer.run(stream, import_format)
+        except OSError as error:
+            raise CommandError(error)
+        for line, messages in result.errors:
+            self.stderr.write(f"Line {line}: {' '.join(messages)}")
+        if result.failed > len(result.errors):
+            self.stderr.write(f"... and {result.failed - len(result.errors)} more")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.created} tasks, skipped {result.failed} rows"
+            )
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.models import Task
+from task_manager.search import index_tasks
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index of every task."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        indexed = 0
+        while True:
+            ids = list(
+                Task.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            index_tasks(Task.objects.filter(pk__in=ids))
+            indexed += len(ids)
+            last_id = ids[-1]
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} tasks"))
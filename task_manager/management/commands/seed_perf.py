@@ -0,0 +1,78 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from task_manager.seeding import PerfSeeder
+
+
+class Command(BaseCommand):
+    help = "Generate a large synthetic dataset for load and performance testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=10_000)
+        parser.add_argument(
+            "--workers", type=int, help="Defaults to one worker per 20 tasks."
+        )
+        parser.add_argument("--positions", type=int)
+        parser.add_argument("--task-types", type=int)
+        parser.add_argument(
+            "--tags", type=int, help="Defaults to one tag per 100 tasks."
+        )
+        parser.add_argument("--max-assignees", type=int, default=3)
+        parser.add_argument("--max-tags", type=int, default=3)
+        parser.add_argument("--completed-ratio", type=float, default=0.4)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--prefix",
+            default="perf",
+            help="Prefix of generated names, used to find the rows again for --clear.",
+        )
+        parser.add_argument(
+            "--password",
+            help="Password of every generated worker (unusable if omitted).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete rows generated earlier with the same prefix first.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        seeder = PerfSeeder(
+            tasks=options["tasks"],
+            workers=options["workers"],
+            positions=options["positions"],
+            task_types=options["task_types"],
+            tags=options["tags"],
+            max_assignees=options["max_assignees"],
+            max_tags=options["max_tags"],
+            completed_ratio=options["completed_ratio"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            password=options["password"],
+            batch_size=options["batch_size"],
+            log=self.log,
+        )
+        started = time.monotonic()
+        if options["clear"]:
+            seeder.clear()
+        try:
+            created = seeder.run()
+        except IntegrityError as error:
+            raise CommandError(
+                f"{error}. Rows with the prefix {options['prefix']!r} already exist, "
+                "rerun with --clear or another --prefix."
+            )
+        summary = ", ".join(f"{number} {name}" for name, number in created.items())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {summary} in {time.monotonic() - started:.1f}s"
+            )
+        )
+
+    def log(self, message):
+        if self.verbosity > 1:
+            self.stdout.write(message)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = "Compile the templates listed in TEMPLATE_WARMUP into the cached loader."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "patterns",
+            nargs="*",
+            help="Glob patterns relative to the template directories.",
+        )
+
+    def handle(self, *args, **options):
+        names = warm_templates(options["patterns"] or None)
+        if options["verbosity"] > 1:
+            for name in names:
+                self.stdout.write(name)
+        self.stdout.write(self.style.SUCCESS(f"Compiled {len(names)} templates"))
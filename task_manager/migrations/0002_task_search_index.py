@@ -0,0 +1,70 @@
+# Generated by Django 4.2.2 on 2026-10-18 08:35
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+FTS_TABLE = "task_manager_task_fts"
+
+POSTGRESQL_BACKFILL = """
+UPDATE task_manager_task SET search_vector =
+    setweight(to_tsvector('english', name), 'A')
+    || setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(tag.name, ' ')
+        FROM task_manager_tag tag
+        INNER JOIN task_manager_task_tags task_tag ON task_tag.tag_id = tag.id
+        WHERE task_tag.task_id = task_manager_task.id
+    ), '')), 'B')
+    || setweight(to_tsvector('english', description), 'C')
+"""
+
+SQLITE_BACKFILL = f"""
+INSERT INTO {FTS_TABLE}(rowid, name, description, tags)
+SELECT task.id, task.name, task.description, (
+    SELECT group_concat(tag.name, ' ')
+    FROM task_manager_tag tag
+    INNER JOIN task_manager_task_tags task_tag ON task_tag.tag_id = tag.id
+    WHERE task_tag.task_id = task.id
+)
+FROM task_manager_task task
+"""
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE INDEX task_search_vector_gin "
+            "ON task_manager_task USING GIN (search_vector)"
+        )
+        schema_editor.execute(POSTGRESQL_BACKFILL)
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} "
+            f"USING fts5(name, description, tags, tokenize='unicode61')"
+        )
+        schema_editor.execute(SQLITE_BACKFILL)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS task_search_vector_gin")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.2 on 2026-10-18 09:29
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+from task_manager.slugs import allocate_slugs
+
+BATCH_SIZE = 1000
+
+
+def deduplicate_slugs(apps, schema_editor):
+    # The oldest row keeps a duplicated slug, later ones get a numbered
+    # suffix; empty slugs are rebuilt from the name / username.
+    for model_name, source in (("Task", "name"), ("Worker", "username")):
+        model = apps.get_model("task_manager", model_name)
+        duplicated = (
+            model.objects.values("slug")
+            .annotate(rows=Count("pk"))
+            .filter(rows__gt=1)
+            .values_list("slug", flat=True)
+        )
+        keep = set(
+            model.objects.filter(slug__in=list(duplicated))
+            .exclude(slug="")
+            .values("slug")
+            .annotate(first=models.Min("pk"))
+            .values_list("first", flat=True)
+        )
+        rows = list(
+            model.objects.filter(Q(slug__in=list(duplicated)) | Q(slug=""))
+            .exclude(pk__in=keep)
+            .order_by("pk")
+            .only("pk", "slug", source)
+        )
+        for start in range(0, len(rows), BATCH_SIZE):
+            batch = rows[start : start + BATCH_SIZE]
+            slugs = allocate_slugs(
+                model, [row.slug or getattr(row, source) for row in batch]
+            )
+            for row, slug in zip(batch, slugs):
+                row.slug = slug
+            model.objects.bulk_update(batch, ["slug"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0004_task_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_slugs, migrations.RunPython.noop),
+    ]
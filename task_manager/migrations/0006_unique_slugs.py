@@ -0,0 +1,22 @@
+# Generated by Django 4.2.2 on 2026-10-18 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0005_deduplicate_slugs"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="task",
+            name="slug",
+            field=models.SlugField(allow_unicode=True, blank=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="worker",
+            name="slug",
+            field=models.SlugField(allow_unicode=True, blank=True, unique=True),
+        ),
+    ]
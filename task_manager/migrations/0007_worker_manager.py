@@ -0,0 +1,19 @@
+# Generated by Django 4.2.2 on 2026-10-18 10:23
+
+from django.db import migrations
+import task_manager.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0006_unique_slugs"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="worker",
+            managers=[
+                ("objects", task_manager.models.WorkerManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.2 on 2026-10-18 11:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0007_worker_manager"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskSearchEntry",
+            fields=[
+                (
+                    "task",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search_entry",
+                        serialize=False,
+                        to="task_manager.task",
+                    ),
+                ),
+                ("document", models.TextField(db_column="task_manager_task_fts")),
+            ],
+            options={
+                "db_table": "task_manager_task_fts",
+                "managed": False,
+            },
+        ),
+    ]
@@ -1,7 +1,13 @@
+from datetime import datetime, time
+
 from django.conf import settings
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.slugs import save_with_unique_slug
 
 
 class Position(models.Model):
@@ -14,11 +20,28 @@ class Position(models.Model):
         return self.name
 
 
+class WorkerQuerySet(models.QuerySet):
+    # Loading profiles: the columns and joins each kind of page renders.
+    def for_list(self):
+        return self.select_related("position").only(
+            "username", "first_name", "last_name", "slug", "position__name"
+        )
+
+    def for_detail(self):
+        return self.select_related("position")
+
+
+class WorkerManager(UserManager.from_queryset(WorkerQuerySet)):
+    pass
+
+
 class Worker(AbstractUser):
     position = models.ForeignKey(
         Position, on_delete=models.CASCADE, default=None, null=True
     )
-    slug = models.SlugField(max_length=50, blank=True, allow_unicode=True)
+    slug = models.SlugField(max_length=50, blank=True, unique=True, allow_unicode=True)
+
+    objects = WorkerManager()
 
     class Meta:
         verbose_name = "worker"
@@ -27,6 +50,9 @@ class Worker(AbstractUser):
     def __str__(self):
         return f"{self.username} ({self.position})"
 
+    def save(self, *args, **kwargs):
+        save_with_unique_slug(self, super().save, self.username, *args, **kwargs)
+
     def get_absolute_url(self):
         return reverse("task_manager:worker-detail", kwargs={"slug": self.slug})
 
@@ -48,6 +74,66 @@ class Tag(models.Model):
         return self.name
 
 
+def start_of_today():
+    # Midnight in the active time zone. A deadline before it falls on an
+    # earlier local date: the same test as truncating deadlines to dates, but
+    # one the partial deadline index can answer.
+    return timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+
+
+class TaskQuerySet(models.QuerySet):
+    # Loading profiles, see WorkerQuerySet. The search vector is never shown.
+    def for_list(self):
+        return self.select_related("task_type").only(
+            "name", "slug", "priority", "deadline", "is_completed", "task_type__name"
+        )
+
+    def for_detail(self):
+        return self.select_related("task_type").defer("search_vector")
+
+    def for_export(self):
+        # Plain rows, read in chunks; task_manager.export adds the assignee
+        # and tag names with one query per chunk.
+        queryset = self if self.query.order_by else self.order_by("pk")
+        return queryset.values(
+            "id",
+            "slug",
+            "name",
+            "description",
+            "deadline",
+            "priority",
+            "is_completed",
+            task_type_name=models.F("task_type__name"),
+            creator_name=models.F("creator__username"),
+        )
+
+    def overdue(self):
+        return self.filter(is_completed=False, deadline__lt=start_of_today())
+
+    def in_progress(self):
+        return self.filter(is_completed=False, deadline__gte=start_of_today())
+
+    def completed(self):
+        return self.filter(is_completed=True)
+
+    def by_status(self, status):
+        if status not in dict(Task.STATUS_CHOICES):
+            raise ValueError(f"Unknown task status: {status}")
+        return getattr(self, status)()
+
+    def with_status(self):
+        return self.annotate(
+            status=models.Case(
+                models.When(is_completed=True, then=models.Value("completed")),
+                models.When(
+                    deadline__lt=start_of_today(), then=models.Value("overdue")
+                ),
+                default=models.Value("in_progress"),
+                output_field=models.CharField(),
+            )
+        )
+
+
 class Task(models.Model):
     PRIORITY_CHOICES = [
         ("Urgent and important", "Urgent and important"),
@@ -55,6 +141,11 @@ class Task(models.Model):
         ("Medium priority", "Medium priority"),
         ("Low priority", "Low priority"),
     ]
+    STATUS_CHOICES = [
+        ("in_progress", "In progress"),
+        ("overdue", "Overdue"),
+        ("completed", "Completed"),
+    ]
     name = models.CharField(max_length=255)
     creator = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -70,10 +161,58 @@ class Task(models.Model):
     task_type = models.ForeignKey(TaskType, on_delete=models.CASCADE)
     assignees = models.ManyToManyField(Worker, related_name="tasks")
     tags = models.ManyToManyField(Tag, related_name="tasks", default=None, blank=True)
-    slug = models.SlugField(max_length=50, blank=True, allow_unicode=True)
+    slug = models.SlugField(max_length=50, blank=True, unique=True, allow_unicode=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Serves TaskQuerySet.overdue() and in_progress().
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_completed=False),
+                name="task_open_deadline_idx",
+            ),
+            models.Index(
+                fields=["is_completed", "deadline"], name="task_status_deadline_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} {self.deadline}"
 
+    def save(self, *args, **kwargs):
+        # Every write gets a new version, the JSON API derives ETags from it.
+        # The database increments it, so that bumps made meanwhile by bulk
+        # actions and relation changes are not overwritten.
+        if self._state.adding:
+            return save_with_unique_slug(self, super().save, self.name, *args, **kwargs)
+        self.version = models.F("version") + 1
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "version"}
+        save_with_unique_slug(self, super().save, self.name, *args, **kwargs)
+        self.refresh_from_db(fields=["version"])
+
     def get_absolute_url(self):
         return reverse("task_manager:task-detail", kwargs={"slug": self.slug})
+
+
+class TaskSearchEntry(models.Model):
+    # A row of the SQLite full-text index of task_manager.search, which only
+    # exists on SQLite. Modelled so that searches can join it to tasks; the
+    # document column stands for the table in FTS5 MATCH conditions.
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="search_entry",
+    )
+    document = models.TextField(db_column="task_manager_task_fts")
+
+    class Meta:
+        managed = False
+        db_table = "task_manager_task_fts"
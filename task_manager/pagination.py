@@ -0,0 +1,344 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    Page,
+    PageNotAnInteger,
+    Paginator,
+)
+from django.db import DatabaseError, connections
+from django.db.models import Model, Q
+from django.http import Http404
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+COUNT_ESTIMATE_THRESHOLD = 100_000
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+def encode_cursor(values, backwards=False):
+    payload = {"v": [encode_value(value) for value in values]}
+    if backwards:
+        payload["b"] = 1
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor, fields):
+    # Cursors come from clients: every value has to be a valid value of the
+    # field it is compared with, or building the page query would fail.
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(data)
+        values = [decode_value(value) for value in payload["v"]]
+        if len(values) != len(fields):
+            raise InvalidCursor("Cursor does not match the ordering.")
+        values = [prepare_value(field, value) for field, value in zip(fields, values)]
+    except (binascii.Error, ValueError, TypeError, KeyError, ValidationError):
+        raise InvalidCursor("Invalid cursor.")
+    return values, bool(payload.get("b"))
+
+
+def encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return parse_datetime(value["dt"])
+        if "d" in value:
+            return parse_date(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+        raise ValueError("Unknown cursor value.")
+    return value
+
+
+def prepare_value(field, value):
+    if value is None:
+        raise ValueError("Cursor values cannot be null.")
+    value = field.to_python(value)
+    field.get_prep_value(value)
+    return value
+
+
+class CursorPage(Sequence):
+    def __init__(self, object_list, paginator, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<CursorPage of {len(self.object_list)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+# Pages are located by the ordering values of the last (or first) row seen,
+# so neither OFFSET nor COUNT(*) is needed. Ordering must use plain fields or
+# annotations; the primary key is appended to make it unique.
+class CursorPaginator:
+    def __init__(self, object_list, per_page):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = self.get_ordering(object_list)
+
+    @staticmethod
+    def get_ordering(queryset):
+        ordering = [
+            field
+            for field in (queryset.query.order_by or queryset.model._meta.ordering)
+            if isinstance(field, str)
+        ]
+        names = [field.lstrip("-") for field in ordering]
+        if "pk" not in names and queryset.model._meta.pk.name not in names:
+            ordering.append("pk")
+        return ordering
+
+    @cached_property
+    def fields(self):
+        # The model fields (or annotation output fields) ordered by.
+        query = self.object_list.query.chain()
+        return [
+            query.resolve_ref(field.lstrip("-")).output_field for field in self.ordering
+        ]
+
+    @cached_property
+    def count(self):
+        # Only evaluated if something asks for it; templates don't.
+        return self.object_list.count()
+
+    def page(self, cursor=None):
+        queryset, backwards = self.page_queryset(cursor)
+        return self.build_page(list(queryset), cursor, backwards)
+
+    async def apage(self, cursor=None):
+        queryset, backwards = self.page_queryset(cursor)
+        return self.build_page([row async for row in queryset], cursor, backwards)
+
+    def page_queryset(self, cursor):
+        backwards = False
+        queryset = self.object_list
+        if cursor:
+            values, backwards = decode_cursor(cursor, self.fields)
+            queryset = queryset.filter(self.keyset_filter(values, backwards))
+        if backwards:
+            queryset = queryset.order_by(*map(self.reverse, self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        return queryset[: self.per_page + 1], backwards
+
+    def build_page(self, rows, cursor, backwards):
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if backwards:
+            rows.reverse()
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_more or backwards:
+                next_cursor = encode_cursor(self.values(rows[-1]))
+            if cursor and (has_more or not backwards):
+                previous_cursor = encode_cursor(self.values(rows[0]), backwards=True)
+        return CursorPage(rows, self, next_cursor, previous_cursor)
+
+    def keyset_filter(self, values, backwards):
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != backwards
+            lookup = "lt" if descending else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def values(self, obj):
+        values = []
+        for field in self.ordering:
+            value = getattr(obj, field.lstrip("-"))
+            values.append(value.pk if isinstance(value, Model) else value)
+        return values
+
+    @staticmethod
+    def reverse(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def estimate_count(queryset):
+    query = queryset.query
+    if query.distinct or query.combinator or query.is_sliced or query.extra_tables:
+        return None
+    connection = connections[queryset.db]
+    try:
+        if not query.where:
+            return estimate_table_rows(connection, queryset.model._meta.db_table)
+        if connection.vendor == "postgresql":
+            return estimate_query_rows(connection, queryset)
+    except DatabaseError:
+        pass
+    return None
+
+
+def estimate_table_rows(connection, table):
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(table)],
+            )
+        elif connection.vendor == "sqlite":
+            # Filled in by ANALYZE, one row per index; the first number of "stat"
+            # is the number of rows indexed, which is less for partial indexes.
+            cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s", [table])
+        else:
+            return None
+        counts = [
+            int(str(stat).split()[0])
+            for (stat,) in cursor.fetchall()
+            if stat is not None
+        ]
+    if not counts:
+        return None
+    rows = max(counts)
+    # A table that was never analyzed reports -1 (Postgres) or nothing at all.
+    return rows if rows >= 0 else None
+
+
+def estimate_query_rows(connection, queryset):
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPage(Page):
+    has_more = None
+
+    def has_next(self):
+        if self.has_more is None:
+            return super().has_next()
+        return self.has_more
+
+
+# Above COUNT_ESTIMATE_THRESHOLD rows the planner's estimate stands in for
+# COUNT(*). Smaller sets, and sets the database cannot estimate, are counted.
+# Once the count is estimated, pages are bounded by the rows actually fetched
+# rather than by num_pages.
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def estimated_count(self):
+        if not hasattr(self.object_list, "query"):
+            return None
+        estimate = estimate_count(self.object_list)
+        threshold = getattr(
+            settings, "COUNT_ESTIMATE_THRESHOLD", COUNT_ESTIMATE_THRESHOLD
+        )
+        if estimate is None or estimate < threshold:
+            return None
+        return estimate
+
+    @property
+    def is_estimated(self):
+        return self.estimated_count is not None
+
+    @cached_property
+    def count(self):
+        if self.is_estimated:
+            return self.estimated_count
+        return super().count
+
+    def validate_number(self, number):
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        if not self.is_estimated:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(_("That page contains no results"))
+        page = self._get_page(rows[: self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedCountPage(*args, **kwargs)
+
+
+# Requests carrying ?page= keep the offset paginator, so old links still work.
+class CursorPaginationMixin:
+    cursor_kwarg = "cursor"
+    cursor_paginator_class = CursorPaginator
+    paginator_class = EstimatedCountPaginator
+
+    def paginate_queryset(self, queryset, page_size):
+        page_kwarg = self.page_kwarg
+        if self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = self.cursor_paginator_class(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        if self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg):
+            # Offset pages may count rows, which the paginator does synchronously.
+            return await sync_to_async(self.paginate_queryset)(queryset, page_size)
+
+        paginator = self.cursor_paginator_class(queryset, page_size)
+        try:
+            page = await paginator.apage(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
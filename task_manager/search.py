@@ -0,0 +1,129 @@
+import re
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+from django.db.models import F, FloatField, Lookup, OuterRef, Q, Subquery, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Coalesce
+
+from task_manager.models import Tag, Task, TaskSearchEntry
+
+SEARCH_CONFIG = "english"
+FTS_TABLE = TaskSearchEntry._meta.db_table
+TERM_RE = re.compile(r"\w+")
+
+
+def search_tasks(queryset, search_query):
+    terms = TERM_RE.findall(search_query)
+    if not terms:
+        return substring_search(queryset, search_query)
+    if connection.vendor == "postgresql":
+        return postgresql_search(queryset, terms)
+    if connection.vendor == "sqlite":
+        return sqlite_search(queryset, terms)
+    return substring_search(queryset, search_query)
+
+
+def postgresql_search(queryset, terms):
+    # Every term is matched as a prefix, so partially typed words still hit.
+    query = SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+    # ts_rank() is a real: cursors carry the rank as a double, which would
+    # never compare equal to it again and break keyset paging on ties.
+    rank = Cast(SearchRank(F("search_vector"), query), FloatField())
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "id")
+    )
+
+
+@TaskSearchEntry._meta.get_field("document").register_lookup
+class FullTextMatch(Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", [*lhs_params, *rhs_params]
+
+
+def sqlite_search(queryset, terms):
+    match = " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+    # The FTS table is joined (not probed per row) for bm25() to be computed
+    # once per match.
+    return (
+        queryset.filter(search_entry__document__match=match)
+        .annotate(
+            # bm25() is lower for better matches, negate it to sort like Postgres.
+            # Column weights mirror the A/C/B weights of name/description/tags.
+            search_rank=RawSQL(
+                f"-bm25({FTS_TABLE}, 10.0, 1.0, 4.0)", [], output_field=FloatField()
+            )
+        )
+        .order_by("-search_rank", "id")
+    )
+
+
+def substring_search(queryset, search_query):
+    matching = Task.objects.filter(
+        Q(name__icontains=search_query) | Q(tags__name__icontains=search_query)
+    )
+    return queryset.filter(pk__in=matching.values("pk"))
+
+
+def index_tasks(queryset):
+    if connection.vendor == "postgresql":
+        tag_names = Subquery(
+            Tag.objects.filter(tasks=OuterRef("pk"))
+            .order_by()
+            .values("tasks")
+            .annotate(names=StringAgg("name", " "))
+            .values("names")
+        )
+        queryset.update(
+            search_vector=SearchVector("name", weight="A", config=SEARCH_CONFIG)
+            + SearchVector(
+                Coalesce(tag_names, Value("")), weight="B", config=SEARCH_CONFIG
+            )
+            + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+        )
+    elif connection.vendor == "sqlite":
+        try:
+            ids_sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        except EmptyResultSet:
+            return
+        quote = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({ids_sql})", params
+            )
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE}(rowid, name, description, tags) "
+                f"SELECT task.id, task.name, task.description, "
+                f"(SELECT group_concat(tag.name, ' ') "
+                f"FROM {quote(Tag._meta.db_table)} tag "
+                f"INNER JOIN {quote(Task.tags.through._meta.db_table)} task_tag "
+                f"ON task_tag.tag_id = tag.id WHERE task_tag.task_id = task.id) "
+                f"FROM {quote(Task._meta.db_table)} task WHERE task.id IN ({ids_sql})",
+                params,
+            )
+
+
+def unindex_task(task_id):
+    unindex_tasks([task_id])
+
+
+def unindex_tasks(task_ids):
+    if connection.vendor == "sqlite" and task_ids:
+        placeholders = ", ".join(["%s"] * len(task_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})",
+                list(task_ids),
+            )
@@ -0,0 +1,216 @@
+import random
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from task_manager.dashboard import DashboardStats
+from task_manager.models import Position, Tag, Task, TaskType, Worker
+from task_manager.search import index_tasks
+
+VERBS = [
+    "Fix",
+    "Implement",
+    "Review",
+    "Refactor",
+    "Test",
+    "Document",
+    "Deploy",
+    "Design",
+    "Investigate",
+    "Optimize",
+    "Migrate",
+    "Update",
+]
+SUBJECTS = [
+    "login page",
+    "payment flow",
+    "search results",
+    "user profile",
+    "REST API",
+    "dashboard",
+    "email notifications",
+    "CI pipeline",
+    "database schema",
+    "onboarding",
+    "reports export",
+    "access control",
+]
+POSITIONS = [
+    "Backend",
+    "Frontend",
+    "QA",
+    "DevOps",
+    "Designer",
+    "Project manager",
+    "Data engineer",
+    "Mobile",
+    "Support",
+    "Analyst",
+]
+TASK_TYPES = ["Bug", "New feature", "Breaking change", "Refactoring", "QA", "Research"]
+
+
+class PerfSeeder:
+    def __init__(
+        self,
+        tasks=1000,
+        workers=None,
+        positions=None,
+        task_types=None,
+        tags=None,
+        max_assignees=3,
+        max_tags=3,
+        completed_ratio=0.4,
+        seed=0,
+        prefix="perf",
+        password=None,
+        batch_size=5000,
+        log=None,
+    ):
+        self.tasks = tasks
+        self.workers = workers if workers is not None else max(5, tasks // 20)
+        self.positions = positions if positions is not None else len(POSITIONS)
+        self.task_types = task_types if task_types is not None else len(TASK_TYPES)
+        self.tags = tags if tags is not None else max(5, tasks // 100)
+        self.max_assignees = max_assignees
+        self.max_tags = max_tags
+        self.completed_ratio = completed_ratio
+        self.prefix = prefix
+        self.password = password
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.random = random.Random(seed)
+
+    def clear(self):
+        Task.objects.filter(slug__startswith=f"{self.prefix}-task-").delete()
+        Worker.objects.filter(username__startswith=f"{self.prefix}_worker_").delete()
+        Tag.objects.filter(name__startswith=f"{self.prefix}-tag-").delete()
+        TaskType.objects.filter(name__startswith=f"{self.prefix} ").delete()
+        Position.objects.filter(name__startswith=f"{self.prefix} ").delete()
+
+    def run(self):
+        with transaction.atomic():
+            positions = self.create_positions()
+            task_types = self.create_task_types()
+            tags = self.create_tags()
+            workers = self.create_workers(positions)
+        self.create_tasks(task_types, tags, workers)
+        self.analyze()
+        DashboardStats.invalidate()
+        return {
+            "positions": len(positions),
+            "task_types": len(task_types),
+            "tags": len(tags),
+            "workers": len(workers),
+            "tasks": self.tasks,
+        }
+
+    def analyze(self):
+        # Refresh planner statistics so row estimates match the new volume.
+        models = [Position, Worker, TaskType, Tag, Task]
+        models += [Task.tags.through, Task.assignees.through]
+        with connection.cursor() as cursor:
+            for model in models:
+                cursor.execute(
+                    f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}"
+                )
+
+    def create_positions(self):
+        return Position.objects.bulk_create(
+            Position(name=f"{self.prefix} {self.cycle(POSITIONS, number)}")
+            for number in range(self.positions)
+        )
+
+    def create_task_types(self):
+        return TaskType.objects.bulk_create(
+            TaskType(name=f"{self.prefix} {self.cycle(TASK_TYPES, number)}")
+            for number in range(self.task_types)
+        )
+
+    def create_tags(self):
+        return Tag.objects.bulk_create(
+            (Tag(name=f"{self.prefix}-tag-{number}") for number in range(self.tags)),
+            batch_size=self.batch_size,
+        )
+
+    def create_workers(self, positions):
+        # Hash once: every seeded worker shares the same (optional) password.
+        password = make_password(self.password)
+        workers = Worker.objects.bulk_create(
+            (
+                Worker(
+                    username=f"{self.prefix}_worker_{number}",
+                    password=password,
+                    first_name=f"First{number}",
+                    last_name=f"Last{number}",
+                    position=self.random.choice(positions),
+                    slug=f"{self.prefix}-worker-{number}",
+                )
+                for number in range(self.workers)
+            ),
+            batch_size=self.batch_size,
+        )
+        self.log(f"Created {len(workers)} workers")
+        return workers
+
+    def create_tasks(self, task_types, tags, workers):
+        # A few workers and tags get most of the traffic, like in real teams.
+        worker_weights = self.skewed_weights(len(workers))
+        tag_weights = self.skewed_weights(len(tags))
+        priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+        today = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+        for start in range(0, self.tasks, self.batch_size):
+            stop = min(start + self.batch_size, self.tasks)
+            with transaction.atomic():
+                tasks = Task.objects.bulk_create(
+                    Task(
+                        name=f"{self.random.choice(VERBS)} "
+                        f"{self.random.choice(SUBJECTS)} #{number}",
+                        description=f"{self.random.choice(VERBS)} the "
+                        f"{self.random.choice(SUBJECTS)} before the release.",
+                        deadline=today + timedelta(days=self.random.randint(-180, 180)),
+                        is_completed=self.random.random() < self.completed_ratio,
+                        priority=self.random.choice(priorities),
+                        task_type=self.random.choice(task_types),
+                        creator=self.random.choice(workers),
+                        slug=f"{self.prefix}-task-{number}",
+                    )
+                    for number in range(start, stop)
+                )
+                assignees = []
+                task_tags = []
+                for task in tasks:
+                    for worker in self.sample(
+                        workers, worker_weights, 1, self.max_assignees
+                    ):
+                        assignees.append(
+                            Task.assignees.through(task_id=task.id, worker_id=worker.id)
+                        )
+                    for tag in self.sample(tags, tag_weights, 0, self.max_tags):
+                        task_tags.append(
+                            Task.tags.through(task_id=task.id, tag_id=tag.id)
+                        )
+                Task.assignees.through.objects.bulk_create(assignees)
+                Task.tags.through.objects.bulk_create(task_tags)
+                index_tasks(Task.objects.filter(pk__in=[task.pk for task in tasks]))
+            self.log(f"Created {stop} of {self.tasks} tasks")
+
+    def sample(self, population, cum_weights, minimum, maximum):
+        if not population or maximum < 1:
+            return set()
+        size = self.random.randint(minimum, min(maximum, len(population)))
+        return set(self.random.choices(population, cum_weights=cum_weights, k=size))
+
+    @staticmethod
+    def skewed_weights(size):
+        return list(accumulate(1 / (rank + 1) ** 0.8 for rank in range(size)))
+
+    @staticmethod
+    def cycle(names, number):
+        if number < len(names):
+            return names[number]
+        return f"{names[number % len(names)]} {number // len(names)}"
@@ -0,0 +1,195 @@
+from django.db.models import F, Q
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from task_manager import search
+from task_manager.bulk import tasks_bulk_changed
+from task_manager.dashboard import DashboardStats
+from task_manager.models import Position, Tag, Task, Worker
+from task_manager.versions import ObjectVersion
+
+
+@receiver(post_save, sender=Task)
+def invalidate_dashboard_on_task_save(
+    sender, instance, created, update_fields, **kwargs
+):
+    if created or update_fields is None or "is_completed" in update_fields:
+        DashboardStats.invalidate()
+
+
+@receiver(post_save, sender=Worker)
+@receiver(post_save, sender=Position)
+def invalidate_dashboard_on_create(sender, instance, created, **kwargs):
+    # Workers are saved on every login (last_login), only new rows change
+    # the totals shown on the dashboard.
+    if created:
+        DashboardStats.invalidate()
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Worker)
+@receiver(post_delete, sender=Position)
+def invalidate_dashboard_on_delete(sender, instance, **kwargs):
+    DashboardStats.invalidate()
+
+
+@receiver(post_save, sender=Task)
+def index_task_on_save(sender, instance, update_fields, **kwargs):
+    if update_fields is None or {"name", "description"} & set(update_fields):
+        search.index_tasks(Task.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Task)
+def unindex_task_on_delete(sender, instance, **kwargs):
+    search.unindex_task(instance.pk)
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def index_tasks_on_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            search.index_tasks(Task.objects.filter(pk=instance.pk))
+    elif action == "pre_clear":
+        instance._cleared_task_ids = list(instance.tasks.values_list("pk", flat=True))
+    elif action == "post_clear":
+        search.index_tasks(Task.objects.filter(pk__in=instance._cleared_task_ids))
+    elif action in ("post_add", "post_remove"):
+        search.index_tasks(Task.objects.filter(pk__in=pk_set))
+
+
+@receiver(post_save, sender=Tag)
+def index_tasks_on_tag_save(sender, instance, created, **kwargs):
+    if not created:
+        search.index_tasks(Task.objects.filter(tags=instance))
+
+
+@receiver(pre_delete, sender=Tag)
+def collect_tasks_on_tag_delete(sender, instance, **kwargs):
+    instance._deleted_task_ids = list(instance.tasks.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+def index_tasks_on_tag_delete(sender, instance, **kwargs):
+    search.index_tasks(Task.objects.filter(pk__in=instance._deleted_task_ids))
+
+
+@receiver(post_save, sender=Task)
+def bump_versions_on_task_save(sender, instance, created, **kwargs):
+    ObjectVersion.bump(Task, instance.pk)
+    if not created:
+        # Worker pages list their tasks' names, deadlines and status.
+        assignees = instance.assignees.values_list("pk", flat=True)
+        ObjectVersion.bump_many(Worker, assignees)
+
+
+@receiver(pre_delete, sender=Task)
+def collect_assignees_on_task_delete(sender, instance, **kwargs):
+    instance._deleted_assignee_ids = list(
+        instance.assignees.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Task)
+def bump_versions_on_task_delete(sender, instance, **kwargs):
+    ObjectVersion.bump(Task, instance.pk)
+    ObjectVersion.bump_many(Worker, instance._deleted_assignee_ids)
+
+
+@receiver(post_save, sender=Worker)
+def bump_versions_on_worker_save(sender, instance, update_fields, **kwargs):
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    ObjectVersion.bump(Worker, instance.pk)
+    # Task pages show the username and position of every assignee.
+    ObjectVersion.bump(Worker)
+
+
+@receiver(post_delete, sender=Worker)
+def bump_versions_on_worker_delete(sender, instance, **kwargs):
+    ObjectVersion.bump(Worker)
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def bump_versions_on_position_change(sender, instance, **kwargs):
+    ObjectVersion.bump(Position)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def bump_versions_on_assignees_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    if action == "pre_clear":
+        related = instance.tasks if reverse else instance.assignees
+        instance._cleared_assignment_ids = list(related.values_list("pk", flat=True))
+        return
+    if action == "post_clear":
+        pk_set = instance._cleared_assignment_ids
+    elif action not in ("post_add", "post_remove"):
+        return
+    ObjectVersion.bump(type(instance), instance.pk)
+    ObjectVersion.bump_many(model, pk_set)
+
+
+def bump_task_versions(task_ids):
+    Task.objects.filter(pk__in=task_ids).update(version=F("version") + 1)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+@receiver(m2m_changed, sender=Task.tags.through)
+def bump_task_version_on_m2m_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action == "pre_clear" and reverse:
+        instance._cleared_version_task_ids = list(
+            instance.tasks.values_list("pk", flat=True)
+        )
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action != "post_clear" and not pk_set:
+        return
+    if not reverse:
+        bump_task_versions([instance.pk])
+        instance.version += 1
+    elif action == "post_clear":
+        bump_task_versions(instance._cleared_version_task_ids)
+    else:
+        bump_task_versions(pk_set)
+
+
+@receiver(post_delete, sender=Tag)
+def bump_task_versions_on_tag_delete(sender, instance, **kwargs):
+    bump_task_versions(instance._deleted_task_ids)
+
+
+@receiver(pre_delete, sender=Worker)
+def collect_tasks_on_worker_delete(sender, instance, **kwargs):
+    # Assignments are cascaded and creators nulled without any Task signal.
+    instance._deleted_task_ids = list(
+        Task.objects.filter(Q(assignees=instance) | Q(creator=instance))
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+
+
+@receiver(post_delete, sender=Worker)
+def bump_task_versions_on_worker_delete(sender, instance, **kwargs):
+    bump_task_versions(instance._deleted_task_ids)
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def refresh_after_bulk_change(sender, action, task_ids, worker_ids, **kwargs):
+    if action in ("create", "complete", "reopen", "delete"):
+        DashboardStats.invalidate()
+    if action in ("create", "tag", "untag"):
+        search.index_tasks(Task.objects.filter(pk__in=task_ids))
+    elif action == "delete":
+        search.unindex_tasks(task_ids)
+    if action != "create":
+        ObjectVersion.bump_many(Task, task_ids)
+    ObjectVersion.bump_many(Worker, worker_ids)
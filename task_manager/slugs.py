@@ -0,0 +1,91 @@
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+# Room kept for a "-<number>" suffix when the base slug is already taken.
+SUFFIX_LENGTH = 11
+LOOKUP_CHUNK = 100
+MAX_ATTEMPTS = 5
+
+
+def slug_base(model, value):
+    max_length = model._meta.get_field("slug").max_length
+    base = slugify(value or "")[:max_length].strip("-")
+    return base or model._meta.model_name
+
+
+def slug_stem(model, base):
+    max_length = model._meta.get_field("slug").max_length
+    return base[: max_length - SUFFIX_LENGTH].rstrip("-") or model._meta.model_name
+
+
+def allocate_slugs(model, values, exclude_pk=None):
+    # Slugs that could collide are fetched with one query per LOOKUP_CHUNK
+    # distinct bases; a taken base gets the next free "-<number>" suffix.
+    bases = [slug_base(model, value) for value in values]
+    stems = {base: slug_stem(model, base) for base in bases}
+    queryset = model._default_manager.all()
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+    distinct_bases = sorted(stems)
+    taken = set()
+    for start in range(0, len(distinct_bases), LOOKUP_CHUNK):
+        chunk = distinct_bases[start : start + LOOKUP_CHUNK]
+        lookup = reduce(
+            or_,
+            (Q(slug__startswith=f"{stems[base]}-") for base in chunk),
+            Q(slug__in=chunk),
+        )
+        taken.update(queryset.filter(lookup).values_list("slug", flat=True))
+
+    suffixes = {}
+    stem_values = set(stems.values())
+    for slug in taken:
+        match = re.fullmatch(r"(.+)-(\d+)", slug)
+        if match and match.group(1) in stem_values:
+            stem, number = match.group(1), int(match.group(2))
+            suffixes[stem] = max(suffixes.get(stem, 1), number)
+
+    slugs = []
+    for base in bases:
+        if base not in taken:
+            slug = base
+        else:
+            stem = stems[base]
+            suffixes[stem] = suffixes.get(stem, 1) + 1
+            slug = f"{stem}-{suffixes[stem]}"
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def allocate_slug(model, value, exclude_pk=None):
+    return allocate_slugs(model, [value], exclude_pk=exclude_pk)[0]
+
+
+def save_with_unique_slug(instance, save, source, *args, **kwargs):
+    # The unique constraint settles races: if a concurrent insert took the
+    # allocated slug first, a new one is allocated and the save retried.
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "slug" not in update_fields:
+        return save(*args, **kwargs)
+    model = type(instance)
+    for attempt in range(MAX_ATTEMPTS):
+        instance.slug = allocate_slug(
+            model, instance.slug or source, exclude_pk=instance.pk
+        )
+        try:
+            with transaction.atomic():
+                return save(*args, **kwargs)
+        except IntegrityError:
+            taken = (
+                model._default_manager.filter(slug=instance.slug)
+                .exclude(pk=instance.pk)
+                .exists()
+            )
+            if not taken or attempt == MAX_ATTEMPTS - 1:
+                raise
@@ -0,0 +1,44 @@
+from django import template
+
+from task_manager.cache import namespace
+from task_manager.db.routers import reading_from_replica
+
+register = template.Library()
+
+# Fragments vary on the ObjectVersion of the objects they render.
+fragments = namespace("fragment", timeout=60 * 60, versioned=True)
+
+
+class FragmentNode(template.Node):
+    def __init__(self, nodelist, name, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+
+    def render(self, context):
+        key = fragments.key(
+            self.name.resolve(context),
+            *(variable.resolve(context) for variable in self.vary_on),
+        )
+        if reading_from_replica():
+            # Versions are bumped in the cache as soon as a write happens, a
+            # lagging replica may not have the rows yet. Fragments rendered
+            # from it are served but never stored under the new version.
+            cached = fragments.get(key)
+            return self.nodelist.render(context) if cached is None else cached
+        return fragments.get_or_set(key, lambda: self.nodelist.render(context))
+
+
+@register.tag
+def fragment(parser, token):
+    # {% fragment "name" var1 var2 %}...{% endfragment %}
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires a fragment name.")
+    nodelist = parser.parse(("endfragment",))
+    parser.delete_first_token()
+    return FragmentNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(bit) for bit in bits[2:]],
+    )
@@ -3,10 +3,16 @@ from django import template
 register = template.Library()
 
 
+# Offset and cursor pagination are mutually exclusive in a query string.
+EXCLUSIVE_PARAMS = {"page": "cursor", "cursor": "page"}
+
+
 @register.simple_tag
 def query_transform(request, **kwargs):
     updated = request.GET.copy()
     for key, value in kwargs.items():
+        if key in EXCLUSIVE_PARAMS:
+            updated.pop(EXCLUSIVE_PARAMS[key], 0)
         if value is not None:
             updated[key] = value
         else:
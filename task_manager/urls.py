@@ -1,9 +1,18 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
 
+from task_manager.api import (
+    ApiDetailView,
+    ApiListView,
+    BulkTaskView,
+    DatabasePoolView,
+)
 from task_manager.views import (
     HomePage,
     TaskListView,
+    TaskExportView,
+    TaskImportView,
     WorkerListView,
     PositionListView,
     TaskDetailView,
@@ -30,11 +39,23 @@ from task_manager.views import (
     ChangeTaskStatus,
 )
 
+if settings.ASYNC_VIEWS:
+    from task_manager.async_views import (  # noqa: F811
+        HomePage,
+        TaskListView,
+        TaskDetailView,
+        TaskExportView,
+        WorkerListView,
+        WorkerDetailView,
+    )
+
 urlpatterns = [
     path("", HomePage.as_view(), name="index"),
     path("register/", RegisterWorker.as_view(), name="register"),
     path("tasks/", TaskListView.as_view(), name="task-list"),
     path("tasks/create/", TaskCreateView.as_view(), name="task-create"),
+    path("tasks/export/", TaskExportView.as_view(), name="task-export"),
+    path("tasks/import/", TaskImportView.as_view(), name="task-import"),
     path("tasks/<slug:slug>/", TaskDetailView.as_view(), name="task-detail"),
     path("tasks/<slug:slug>/update/", TaskUpdateView.as_view(), name="task-update"),
     path("tasks/<slug:slug>/delete/", TaskDeleteView.as_view(), name="task-delete"),
@@ -101,6 +122,52 @@ urlpatterns = [
         TagDeleteView.as_view(),
         name="tag-delete",
     ),
+    path(
+        "api/tasks/", ApiListView.as_view(resource_name="tasks"), name="api-task-list"
+    ),
+    path("api/bulk/tasks/", BulkTaskView.as_view(), name="api-task-bulk"),
+    path("api/db/pools/", DatabasePoolView.as_view(), name="api-db-pools"),
+    path(
+        "api/tasks/<slug:slug>/",
+        ApiDetailView.as_view(resource_name="tasks"),
+        name="api-task-detail",
+    ),
+    path(
+        "api/workers/",
+        ApiListView.as_view(resource_name="workers"),
+        name="api-worker-list",
+    ),
+    path(
+        "api/workers/<slug:slug>/",
+        ApiDetailView.as_view(resource_name="workers"),
+        name="api-worker-detail",
+    ),
+    path(
+        "api/positions/",
+        ApiListView.as_view(resource_name="positions"),
+        name="api-position-list",
+    ),
+    path(
+        "api/positions/<int:pk>/",
+        ApiDetailView.as_view(resource_name="positions"),
+        name="api-position-detail",
+    ),
+    path(
+        "api/task_types/",
+        ApiListView.as_view(resource_name="task_types"),
+        name="api-task-type-list",
+    ),
+    path(
+        "api/task_types/<int:pk>/",
+        ApiDetailView.as_view(resource_name="task_types"),
+        name="api-task-type-detail",
+    ),
+    path("api/tags/", ApiListView.as_view(resource_name="tags"), name="api-tag-list"),
+    path(
+        "api/tags/<int:pk>/",
+        ApiDetailView.as_view(resource_name="tags"),
+        name="api-tag-detail",
+    ),
 ]
 
 app_name = "task_manager"
@@ -0,0 +1,42 @@
+import time
+
+from task_manager.cache import namespace
+
+
+class ObjectVersion:
+    # Versions are only ever bumped, never expired: a lost counter restarts
+    # from the clock, which is always ahead of any value handed out before.
+    cache = namespace("version", timeout=None)
+
+    @classmethod
+    def key(cls, model, pk=None):
+        if pk is None:
+            return cls.cache.key(model._meta.label_lower)
+        return cls.cache.key(model._meta.label_lower, pk)
+
+    @classmethod
+    def get(cls, *targets):
+        # Each target is a model (model-wide version) or a (model, pk) pair.
+        keys = [
+            cls.key(*target) if isinstance(target, tuple) else cls.key(target)
+            for target in targets
+        ]
+        versions = cls.cache.get_many(keys)
+        missing = {key: time.time_ns() for key in keys if key not in versions}
+        if missing:
+            cls.cache.set_many(missing)
+            versions.update(missing)
+        return ".".join(str(versions[key]) for key in keys)
+
+    @classmethod
+    def bump(cls, model, pk=None):
+        key = cls.key(model, pk)
+        try:
+            cls.cache.incr(key)
+        except ValueError:
+            cls.cache.set(key, time.time_ns())
+
+    @classmethod
+    def bump_many(cls, model, pks):
+        for pk in pks:
+            cls.bump(model, pk)
@@ -1,22 +1,38 @@
-from datetime import date
+import io
 from django.contrib.auth import login
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponseRedirect, HttpResponseBadRequest
+from django.db import router
+from django.db.models import Count, Q
+from django.http import (
+    Http404,
+    HttpResponseRedirect,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.urls import reverse_lazy
+from django.utils.cache import patch_vary_headers
 from django.views import generic, View
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 
+from .bulk import toggle_assignee, toggle_completed
+from .dashboard import DashboardStats
+from .export import CONTENT_TYPES, export_lines
 from .forms import (
     TaskForm,
     WorkerCreationForm,
     WorkerUpdateForm,
     TaskSearchForm,
+    TaskImportForm,
     WorkerSearchForm,
     PositionSearchForm,
     TaskTypeSearchForm,
     TagSearchForm,
 )
+from .importer import TaskImporter, detect_format
 from .models import Position, Worker, Task, TaskType, Tag
+from .pagination import CursorPaginationMixin
+from .versions import ObjectVersion
 
 
 class RegisterWorker(generic.CreateView):
@@ -36,42 +52,102 @@ class RegisterWorker(generic.CreateView):
         )
 
 
-class HomePage(LoginRequiredMixin, generic.ListView):
+class HomePage(LoginRequiredMixin, generic.TemplateView):
     template_name = "task_manager/index.html"
-    queryset = Task.objects.all()
-    context_object_name = "task_list"
+    read_from_replica = True
 
     def get_context_data(self, **kwargs):
         context = super(HomePage, self).get_context_data(**kwargs)
-        context["num_workers"] = Worker.objects.count()
-        context["num_positions"] = Position.objects.count()
-        context["num_tasks"] = self.queryset.count()
-        context["tasks_in_work"] = Task.objects.filter(is_completed=False).count()
-        context["completed_tasks"] = Task.objects.filter(is_completed=True).count()
+        context.update(DashboardStats.get())
         return context
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class PartialTemplateMixin:
+    # HTMX requests get only the results fragment, history restores the page.
+    partial_template_name = None
+
+    def is_partial_request(self):
+        headers = self.request.headers
+        return (
+            headers.get("HX-Request") == "true"
+            and headers.get("HX-History-Restore-Request") != "true"
+        )
+
+    def get_template_names(self):
+        if self.partial_template_name and self.is_partial_request():
+            return [self.partial_template_name]
+        return super(PartialTemplateMixin, self).get_template_names()
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super(PartialTemplateMixin, self).render_to_response(
+            context, **response_kwargs
+        )
+        patch_vary_headers(response, ["HX-Request"])
+        return response
+
+
+class TaskListView(
+    LoginRequiredMixin, PartialTemplateMixin, CursorPaginationMixin, generic.ListView
+):
     model = Task
+    partial_template_name = "task_manager/partials/task_list_results.html"
     ordering = ["name"]
     paginate_by = 5
+    read_from_replica = True
 
     def get_context_data(self, **kwargs):
         context = super(TaskListView, self).get_context_data(**kwargs)
-        context["today"] = date.today()
-        context["search_form"] = TaskSearchForm(
-            initial={"search_query": self.request.GET.get("search_query", "")}
-        )
+        context["search_form"] = TaskSearchForm(initial=self.request.GET.dict())
         return context
 
     def get_queryset(self):
-        queryset = Task.objects.all().prefetch_related("assignees", "task_type").order_by("id")
+        queryset = Task.objects.for_list().with_status().order_by("id")
         form = TaskSearchForm(self.request.GET)
         if form.is_valid():
             return form.search(queryset)
         return queryset
 
 
+class TaskExportView(LoginRequiredMixin, View):
+    read_from_replica = True
+
+    def get(self, request):
+        export_format = request.GET.get("format", "csv")
+        if export_format not in CONTENT_TYPES:
+            return HttpResponseBadRequest("Unknown export format.")
+        form = TaskSearchForm(request.GET)
+        if not form.is_valid():
+            return HttpResponseBadRequest("Invalid search query.")
+        # The rows are streamed after the view returns, outside the replica
+        # routing of the request, so the queryset is pinned to its database.
+        queryset = Task.objects.using(router.db_for_read(Task))
+        response = StreamingHttpResponse(
+            export_lines(export_format, form.search(queryset)),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        filename = f"tasks.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class TaskImportView(LoginRequiredMixin, generic.FormView):
+    form_class = TaskImportForm
+    template_name = "task_manager/task_import.html"
+
+    def form_valid(self, form):
+        upload = form.cleaned_data["file"]
+        import_format = form.cleaned_data["format"] or detect_format(upload.name)
+        stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        try:
+            result = TaskImporter(creator=self.request.user).run(stream, import_format)
+        except UnicodeDecodeError:
+            form.add_error("file", "The file must be UTF-8 encoded.")
+            return self.form_invalid(form)
+        return self.render_to_response(
+            self.get_context_data(form=self.form_class(), result=result)
+        )
+
+
 class TaskCreateView(LoginRequiredMixin, generic.CreateView):
     model = Task
     form_class = TaskForm
@@ -93,53 +169,63 @@ class TaskDeleteView(LoginRequiredMixin, generic.DeleteView):
 
 class TaskDetailView(LoginRequiredMixin, generic.DetailView):
     model = Task
+    queryset = Task.objects.for_detail()
+    read_from_replica = True
+
+    def get_queryset(self):
+        return super(TaskDetailView, self).get_queryset().with_status()
 
     def get_context_data(self, **kwargs):
         context = super(TaskDetailView, self).get_context_data(**kwargs)
-        context["today"] = date.today()
+        task = self.object
+        context["is_assignee"] = task.assignees.filter(pk=self.request.user.pk).exists()
+        # Only evaluated when the cached fragment has to be rendered.
+        context["assignees"] = task.assignees.for_list()
+        context["fragment_version"] = ObjectVersion.get(
+            (Task, task.pk), Worker, Position
+        )
         return context
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+class WorkerListView(
+    LoginRequiredMixin, PartialTemplateMixin, CursorPaginationMixin, generic.ListView
+):
     model = Worker
+    partial_template_name = "task_manager/partials/worker_list_results.html"
     ordering = ["last_name"]
     paginate_by = 5
+    read_from_replica = True
 
     def get_context_data(self, **kwargs):
         context = super(WorkerListView, self).get_context_data(**kwargs)
-        number_tasks_in_work = Task.objects.filter(is_completed=False)
-        context["number_tasks_in_work"] = number_tasks_in_work
-        dict_workers_with_tasks_in_work = {}
-        for task in number_tasks_in_work:
-            for worker in task.assignees.all():
-                if worker in dict_workers_with_tasks_in_work:
-                    dict_workers_with_tasks_in_work[worker] += 1
-                else:
-                    dict_workers_with_tasks_in_work[worker] = 1
-        context["dict_workers_with_tasks_in_work"] = dict_workers_with_tasks_in_work
         context["search_form"] = WorkerSearchForm(
             initial={"search_query": self.request.GET.get("search_query", "")}
         )
         return context
 
     def get_queryset(self):
-        queryset = Worker.objects.prefetch_related("position").order_by("id")
+        queryset = Worker.objects.for_list().order_by("id")
         form = WorkerSearchForm(self.request.GET)
         if form.is_valid():
-            return form.search(queryset)
-        return queryset
+            queryset = form.search(queryset)
+        return queryset.annotate(
+            num_tasks_in_work=Count("tasks", filter=Q(tasks__is_completed=False))
+        )
 
 
 class WorkerDetailView(LoginRequiredMixin, generic.DetailView):
     model = Worker
+    queryset = Worker.objects.for_detail()
+    read_from_replica = True
 
     def get_context_data(self, **kwargs):
         context = super(WorkerDetailView, self).get_context_data(**kwargs)
-        worker = self.get_object()
-        completed_tasks = worker.tasks.filter(is_completed=True)
-        tasks_in_work = worker.tasks.filter(is_completed=False)
+        worker = self.object
+        completed_tasks = worker.tasks.for_list().filter(is_completed=True)
+        tasks_in_work = worker.tasks.for_list().filter(is_completed=False)
         context["completed_tasks"] = completed_tasks
         context["tasks_in_work"] = tasks_in_work
+        context["fragment_version"] = ObjectVersion.get((Worker, worker.pk))
         return context
 
 
@@ -159,25 +245,22 @@ class WorkerDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task_manager:worker-list")
 
 
-class PositionListView(LoginRequiredMixin, generic.ListView):
+class PositionListView(LoginRequiredMixin, CursorPaginationMixin, generic.ListView):
     model = Position
     ordering = ["name"]
     paginate_by = 5
+    read_from_replica = True
 
     def get_context_data(self, **kwargs):
         context = super(PositionListView, self).get_context_data(**kwargs)
-        context["search_form"] = PositionSearchForm(
-            initial={"name": self.request.GET.get("name", "")}
-        )
+        context["search_form"] = PositionSearchForm(initial=self.request.GET.dict())
         return context
 
     def get_queryset(self):
-        queryset = Position.objects.prefetch_related("worker_set").order_by("id")
+        queryset = Position.objects.annotate(num_workers=Count("worker")).order_by("id")
         form = PositionSearchForm(self.request.GET)
         if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"],
-            )
+            return form.search(queryset)
         return queryset
 
 
@@ -198,26 +281,23 @@ class PositionDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task_manager:position-list")
 
 
-class TaskTypeListView(LoginRequiredMixin, generic.ListView):
+class TaskTypeListView(LoginRequiredMixin, CursorPaginationMixin, generic.ListView):
     model = TaskType
     template_name = "task_manager/task_type_list.html"
     ordering = ["name"]
     paginate_by = 5
+    read_from_replica = True
 
     def get_context_data(self, **kwargs):
         context = super(TaskTypeListView, self).get_context_data(**kwargs)
-        context["search_form"] = TaskTypeSearchForm(
-            initial={"name": self.request.GET.get("name", "")}
-        )
+        context["search_form"] = TaskTypeSearchForm(initial=self.request.GET.dict())
         return context
 
     def get_queryset(self):
-        queryset = TaskType.objects.prefetch_related("task_set").order_by("id")
+        queryset = TaskType.objects.annotate(num_tasks=Count("task")).order_by("id")
         form = TaskTypeSearchForm(self.request.GET)
         if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"],
-            )
+            return form.search(queryset)
         return queryset
 
 
@@ -241,38 +321,49 @@ class TaskTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task_manager:task-type-list")
 
 
-class ChangeTaskStatus(generic.View):
-    def post(self, request, slug):
-        task = get_object_or_404(Task, slug=slug)
-        task.is_completed = not task.is_completed
-        task.save()
+class ToggleResponseMixin:
+    # AJAX callers get the new state as JSON, forms are redirected back.
+    def wants_json(self):
+        request = self.request
+        if request.headers.get("x-requested-with") == "XMLHttpRequest":
+            return True
+        return request.accepts("application/json") and not request.accepts("text/html")
+
+    def toggled(self, slug, **state):
+        if self.wants_json():
+            return JsonResponse({"slug": slug, **state})
         return HttpResponseRedirect(
             reverse_lazy("task_manager:task-detail", args=[slug])
         )
 
+
+class ChangeTaskStatus(LoginRequiredMixin, ToggleResponseMixin, generic.View):
+    def post(self, request, slug):
+        is_completed = toggle_completed(slug)
+        if is_completed is None:
+            raise Http404("No task found matching the query")
+        return self.toggled(slug, is_completed=is_completed)
+
     def get(self, request, *args, **kwargs):
         return HttpResponseBadRequest("Invalid request method.")
 
 
-class TagListView(LoginRequiredMixin, generic.ListView):
+class TagListView(LoginRequiredMixin, CursorPaginationMixin, generic.ListView):
     model = Tag
     ordering = ["name"]
     paginate_by = 5
+    read_from_replica = True
 
     def get_context_data(self, **kwargs):
         context = super(TagListView, self).get_context_data(**kwargs)
-        context["search_form"] = TagSearchForm(
-            initial={"name": self.request.GET.get("name", "")}
-        )
+        context["search_form"] = TagSearchForm(initial=self.request.GET.dict())
         return context
 
     def get_queryset(self):
-        queryset = Tag.objects.prefetch_related("tasks").order_by("id")
+        queryset = Tag.objects.annotate(num_tasks=Count("tasks")).order_by("id")
         form = TagSearchForm(self.request.GET)
         if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"],
-            )
+            return form.search(queryset)
         return queryset
 
 
@@ -293,19 +384,12 @@ class TagDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task_manager:tag-list")
 
 
-class ToggleAssignToTaskView(LoginRequiredMixin, generic.View):
+class ToggleAssignToTaskView(LoginRequiredMixin, ToggleResponseMixin, generic.View):
     def post(self, request, slug):
-        if request.method == "POST":
-            worker = get_object_or_404(Worker, id=request.user.id)
-            task = get_object_or_404(Task, slug=slug)
-            if task in worker.tasks.all():
-                worker.tasks.remove(task)
-            else:
-                worker.tasks.add(task)
-
-            return HttpResponseRedirect(
-                reverse_lazy("task_manager:task-detail", args=[slug])
-            )
+        assigned = toggle_assignee(slug, request.user.id)
+        if assigned is None:
+            raise Http404("No task found matching the query")
+        return self.toggled(slug, assigned=assigned)
 
     def get(self, request, *args, **kwargs):
         return HttpResponseBadRequest("Invalid request method.")
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+
+
+def template_dirs(engine):
+    # Loaders rather than engine.dirs, so app directories are found even when
+    # the loaders are configured explicitly.
+    dirs = []
+    for loader in engine.template_loaders:
+        if hasattr(loader, "get_dirs"):
+            dirs.extend(Path(directory) for directory in loader.get_dirs())
+    return dirs
+
+
+def template_names(engine, patterns):
+    names = set()
+    for directory in template_dirs(engine):
+        for pattern in patterns:
+            names.update(
+                path.relative_to(directory).as_posix()
+                for path in directory.glob(pattern)
+                if path.is_file()
+            )
+    return sorted(names)
+
+
+def warm_templates(patterns=None):
+    # Compiles every matching template once, so with the cached loader no
+    # request has to find and parse them. Syntax errors surface here.
+    if patterns is None:
+        patterns = settings.TEMPLATE_WARMUP
+    warmed = []
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name in template_names(backend.engine, patterns):
+            backend.get_template(name)
+            warmed.append(name)
+    return warmed
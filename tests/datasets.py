@@ -0,0 +1,15 @@
+from task_manager.models import Task, Worker
+from task_manager.seeding import PerfSeeder
+
+PROBE_FAN_OUT = 10
+
+
+def seed_dataset(size):
+    PerfSeeder(tasks=size, positions=3, task_types=3, seed=size).run()
+
+    # The probe task stays open and fans out further as the dataset grows,
+    # so per-row queries on its detail page show up as growth between sizes.
+    Task.objects.filter(slug="perf-task-0").update(is_completed=False)
+    probe = Task.objects.get(slug="perf-task-0")
+    probe.assignees.add(*Worker.objects.order_by("id")[:PROBE_FAN_OUT])
+    return Worker.objects.get(slug="perf-worker-0")
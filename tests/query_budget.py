@@ -0,0 +1,25 @@
+from contextlib import ContextDecorator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryBudget(ContextDecorator, CaptureQueriesContext):
+    def __init__(self, budget, using=DEFAULT_DB_ALIAS):
+        super().__init__(connections[using])
+        self.budget = budget
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is None and len(self) > self.budget:
+            queries = "\n".join(
+                f"{number}. {query['sql']}"
+                for number, query in enumerate(self.captured_queries, start=1)
+            )
+            raise QueryBudgetExceeded(
+                f"{len(self)} queries executed, budget is {self.budget}:\n{queries}"
+            )
@@ -0,0 +1,219 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Position, Tag, Task, TaskType
+from task_manager.pagination import encode_cursor
+
+TASK_API_URL = reverse("task_manager:api-task-list")
+
+
+class ApiTestCase(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="Backend")
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test password",
+            slug="test",
+            position=self.position,
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.tag = Tag.objects.create(name="backend")
+        self.tasks = []
+        for task_id in range(5):
+            task = Task.objects.create(
+                name=f"Task {task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=self.task_type,
+                creator=self.user,
+                slug=f"task-{task_id}",
+            )
+            task.assignees.add(self.user)
+            task.tags.add(self.tag)
+            self.tasks.append(task)
+        self.client.force_login(self.user)
+
+    def get_json(self, url, status=200, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def task_url(self, task):
+        return reverse("task_manager:api-task-detail", kwargs={"slug": task.slug})
+
+
+class ApiTest(ApiTestCase):
+    def test_login_required(self):
+        self.client.logout()
+        self.get_json(TASK_API_URL, status=403)
+
+    def test_task_list_default_representation(self):
+        data = self.get_json(TASK_API_URL, page_size=2)
+
+        self.assertEqual(len(data["results"]), 2)
+        task = data["results"][0]
+        self.assertEqual(task["slug"], "task-0")
+        self.assertEqual(task["task_type"], self.task_type.pk)
+        self.assertEqual(task["assignees"], [self.user.pk])
+        self.assertEqual(task["tags"], [self.tag.pk])
+        self.assertIsNone(data["previous"])
+
+    def test_keyset_pages_follow_next_links(self):
+        slugs = []
+        url, params = TASK_API_URL, {"page_size": 2, "fields": "slug"}
+        while url:
+            data = self.get_json(url, **params)
+            slugs += [task["slug"] for task in data["results"]]
+            url, params = data["next"], {}
+        self.assertEqual(slugs, [task.slug for task in self.tasks])
+
+    def test_sparse_fieldsets_load_only_requested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get_json(TASK_API_URL, fields="id,name")
+
+        self.assertEqual(data["results"][0], {"id": self.tasks[0].pk, "name": "Task 0"})
+        task_queries = [
+            query["sql"] for query in queries if "task_manager_task" in query["sql"]
+        ]
+        self.assertEqual(len(task_queries), 1)
+        self.assertNotIn("description", task_queries[0])
+
+    def test_expand_embeds_related_objects_without_extra_queries_per_row(self):
+        params = {"fields": "slug", "expand": "task_type,assignees"}
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get_json(TASK_API_URL, **params)
+        Task.objects.create(
+            name="Task 5",
+            description="test description",
+            deadline=date(year=2323, month=10, day=10),
+            task_type=self.task_type,
+            slug="task-5",
+        ).assignees.add(self.user)
+        with CaptureQueriesContext(connection) as more_queries:
+            self.get_json(TASK_API_URL, **params)
+
+        self.assertEqual(
+            data["results"][0],
+            {
+                "slug": "task-0",
+                "task_type": {"id": self.task_type.pk, "name": "Bug"},
+                "assignees": [
+                    {
+                        "id": self.user.pk,
+                        "username": "test",
+                        "slug": "test",
+                        "first_name": "",
+                        "last_name": "",
+                    }
+                ],
+            },
+        )
+        self.assertEqual(len(more_queries), len(queries))
+
+    def test_bulk_fetch_by_ids(self):
+        ids = f"{self.tasks[1].pk},{self.tasks[3].pk}"
+        data = self.get_json(TASK_API_URL, ids=ids, fields="slug")
+        self.assertEqual(data["results"], [{"slug": "task-1"}, {"slug": "task-3"}])
+
+    def test_ids_out_of_range(self):
+        self.get_json(TASK_API_URL, status=400, ids="1,x")
+        self.get_json(TASK_API_URL, status=400, ids="99999999999999999999999")
+        self.get_json(TASK_API_URL, status=400, ids="0")
+
+    def test_invalid_parameters(self):
+        self.get_json(TASK_API_URL, status=400, fields="password")
+        self.get_json(TASK_API_URL, status=400, expand="name")
+        self.get_json(TASK_API_URL, status=400, page_size="all")
+        self.get_json(TASK_API_URL, status=400, cursor="broken")
+        self.get_json(TASK_API_URL, status=400, cursor=encode_cursor(["abc"]))
+        self.get_json(TASK_API_URL, status=400, cursor=encode_cursor([None]))
+        self.get_json(self.task_url(Task(slug="missing")), status=404)
+
+    def test_other_resources(self):
+        worker = self.get_json(
+            reverse("task_manager:api-worker-detail", kwargs={"slug": "test"}),
+            expand="position",
+        )
+        self.assertEqual(
+            worker["position"], {"id": self.position.pk, "name": "Backend"}
+        )
+        self.assertNotIn("password", worker)
+
+        for url_name in ("api-position-list", "api-task-type-list", "api-tag-list"):
+            data = self.get_json(reverse(f"task_manager:{url_name}"))
+            self.assertEqual(len(data["results"]), 1)
+
+
+class ApiETagTest(ApiTestCase):
+    def get_with_etag(self, url, etag, **params):
+        return self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+    def test_detail_not_modified_until_task_changes(self):
+        task = self.tasks[0]
+        etag = self.client.get(self.task_url(task))["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_with_etag(self.task_url(task), etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        # No prefetch of assignees or tags for a 304.
+        self.assertFalse(any("task_tags" in query["sql"] for query in queries))
+
+        task.refresh_from_db()
+        task.name = "Renamed"
+        task.save()
+        response = self.get_with_etag(self.task_url(task), etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_saves_keep_concurrent_version_bumps(self):
+        task = Task.objects.get(pk=self.tasks[0].pk)
+        version = task.version
+        Task.objects.filter(pk=task.pk).update(version=F("version") + 1)
+        task.name = "Renamed"
+        task.save()
+        self.assertEqual(task.version, version + 2)
+        self.assertEqual(Task.objects.get(pk=task.pk).version, version + 2)
+
+    def test_versions_follow_relation_changes(self):
+        task = self.tasks[0]
+        changes = [
+            lambda: task.tags.clear(),
+            lambda: self.user.tasks.remove(task),
+            lambda: Tag.objects.create(name="new").tasks.add(task),
+            lambda: Tag.objects.get(name="new").delete(),
+        ]
+        etag = self.client.get(self.task_url(task))["ETag"]
+        for change in changes:
+            change()
+            response = self.get_with_etag(self.task_url(task), etag)
+            self.assertEqual(response.status_code, 200)
+            etag = response["ETag"]
+
+    def test_list_etag_changes_when_rows_are_added(self):
+        etag = self.client.get(TASK_API_URL)["ETag"]
+        self.assertEqual(self.get_with_etag(TASK_API_URL, etag).status_code, 304)
+
+        Task.objects.create(
+            name="Task 5",
+            description="test description",
+            deadline=date(year=2323, month=10, day=10),
+            task_type=self.task_type,
+            slug="task-5",
+        )
+        self.assertEqual(self.get_with_etag(TASK_API_URL, etag).status_code, 200)
+
+    def test_unversioned_resources_hash_the_body(self):
+        url = reverse("task_manager:api-tag-list")
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.get_with_etag(url, etag).status_code, 304)
+
+        self.tag.name = "frontend"
+        self.tag.save()
+        self.assertEqual(self.get_with_etag(url, etag).status_code, 200)
@@ -0,0 +1,127 @@
+from datetime import date
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, TestCase
+
+from task_manager import async_views, cache, views
+from task_manager.middleware import StaticFilesMiddleware
+from task_manager.models import Task, TaskType
+
+
+class AsyncViewTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        task_type = TaskType.objects.create(name="test type")
+        for task_id in range(8):
+            Task.objects.create(
+                name=f"Test task_{task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=task_type,
+                slug=f"test-task_{task_id}",
+            )
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        Task.objects.get(slug="test-task_0").assignees.add(self.user)
+
+    async def render(self, view_class, path="/", user=None, headers=None, **kwargs):
+        request = AsyncRequestFactory().get(path, headers=headers)
+        request.user = user or self.user
+        response = await view_class.as_view()(request, **kwargs)
+        if hasattr(response, "render"):
+            await sync_to_async(response.render)()
+        return response
+
+    def render_sync(self, view_class, path="/", **kwargs):
+        request = RequestFactory().get(path)
+        request.user = self.user
+        return view_class.as_view()(request, **kwargs).render()
+
+    async def test_list_pages_match_the_sync_views(self):
+        for path in ("/", "/?search_query=task", "/?page=2"):
+            response = await self.render(async_views.TaskListView, path)
+            expected = await sync_to_async(self.render_sync)(views.TaskListView, path)
+            self.assertEqual(
+                list(response.context_data["task_list"]),
+                list(expected.context_data["task_list"]),
+            )
+            self.assertEqual(response.content, expected.content)
+
+        response = await self.render(async_views.WorkerListView)
+        self.assertContains(response, "(Me)")
+
+    async def test_cursor_links_are_followed(self):
+        first = await self.render(async_views.TaskListView)
+        next_cursor = first.context_data["page_obj"].next_cursor
+        second = await self.render(async_views.TaskListView, f"/?cursor={next_cursor}")
+        self.assertEqual(len(second.context_data["task_list"]), 3)
+
+        with self.assertRaises(Http404):
+            await self.render(async_views.TaskListView, "/?cursor=broken")
+
+    async def test_htmx_requests_get_the_partial(self):
+        response = await self.render(
+            async_views.TaskListView, headers={"HX-Request": "true"}
+        )
+        self.assertNotContains(response, "<html")
+        self.assertContains(response, "Test task_0")
+
+    async def test_detail_pages(self):
+        response = await self.render(async_views.TaskDetailView, slug="test-task_0")
+        self.assertTrue(response.context_data["is_assignee"])
+        self.assertContains(response, "Test task_0")
+
+        response = await self.render(async_views.WorkerDetailView, slug="test")
+        self.assertContains(response, "Test task_0")
+
+        with self.assertRaises(Http404):
+            await self.render(async_views.TaskDetailView, slug="missing")
+
+    async def test_home_page_counters(self):
+        response = await self.render(async_views.HomePage)
+        self.assertEqual(response.context_data["num_tasks"], 8)
+        self.assertEqual(response.context_data["num_workers"], 1)
+
+    async def test_login_required(self):
+        response = await self.render(async_views.TaskListView, user=AnonymousUser())
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("/accounts/login/", response.url)
+
+    async def test_export_streams_asynchronously(self):
+        request = RequestFactory().get("/tasks/export/?format=ndjson")
+        request.user = self.user
+        with mock.patch.object(async_views, "EXPORT_LINES_PER_BATCH", 3):
+            response = await sync_to_async(async_views.TaskExportView.as_view())(
+                request
+            )
+            self.assertTrue(response.is_async)
+            lines = [line async for line in response.streaming_content]
+        self.assertEqual(len(lines), 8)
+
+
+class StaticFilesMiddlewareTest(SimpleTestCase):
+    async def test_async_chain(self):
+        async def view(request):
+            return HttpResponse("view")
+
+        middleware = StaticFilesMiddleware(view)
+        middleware.add_files(settings.STATICFILES_DIRS[0], prefix=settings.STATIC_URL)
+        self.assertTrue(iscoroutinefunction(middleware))
+        factory = AsyncRequestFactory()
+
+        response = await middleware(factory.get("/static/css/forms.css"))
+        self.assertEqual(response["Content-Type"], 'text/css; charset="utf-8"')
+        response = await middleware(factory.get("/tasks/"))
+        self.assertEqual(response.content, b"view")
+
+    def test_sync_chain(self):
+        middleware = StaticFilesMiddleware(lambda request: HttpResponse("view"))
+        self.assertFalse(iscoroutinefunction(middleware))
+        response = middleware(RequestFactory().get("/tasks/"))
+        self.assertEqual(response.content, b"view")
@@ -0,0 +1,162 @@
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.bulk import BulkTaskOperation, referring_models, tasks_bulk_changed
+from task_manager.dashboard import DashboardStats
+from task_manager.models import Tag, Task, TaskSearchEntry, TaskType
+from task_manager.search import search_tasks
+
+BULK_URL = reverse("task_manager:api-task-bulk")
+
+
+class BulkTaskTest(TestCase):
+    def setUp(self) -> None:
+        task_type = TaskType.objects.create(name="test type")
+        self.tasks = [
+            Task.objects.create(
+                name=f"Sprint task {task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=task_type,
+                slug=f"sprint-task-{task_id}",
+            )
+            for task_id in range(6)
+        ]
+        self.other = Task.objects.create(
+            name="Backlog item",
+            description="test description",
+            deadline=date(year=2323, month=10, day=10),
+            task_type=task_type,
+            slug="backlog-item",
+        )
+        self.workers = [
+            get_user_model().objects.create_user(
+                username=f"worker_{number}", slug=f"worker_{number}"
+            )
+            for number in range(2)
+        ]
+        self.tag = Tag.objects.create(name="release")
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.client.force_login(self.user)
+
+    def post(self, payload, status=200):
+        response = self.client.post(
+            BULK_URL, json.dumps(payload), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status, response.content)
+        return response.json()
+
+    def ids(self, tasks):
+        return [task.pk for task in tasks]
+
+    def test_complete_by_ids(self):
+        DashboardStats.get()
+        result = self.post({"action": "complete", "ids": self.ids(self.tasks[:3])})
+
+        self.assertEqual(result, {"action": "complete", "tasks": 3, "changed": 3})
+        self.assertEqual(Task.objects.filter(is_completed=True).count(), 3)
+        self.assertEqual(DashboardStats.get()["completed_tasks"], 3)
+        self.assertEqual(Task.objects.get(pk=self.tasks[0].pk).version, 2)
+
+    def test_operations_are_selected_by_search_query(self):
+        self.post({"action": "tag", "search_query": "sprint", "tags": [self.tag.pk]})
+
+        self.assertEqual(set(self.tag.tasks.all()), set(self.tasks))
+        self.assertEqual(
+            set(search_tasks(Task.objects.all(), "release")), set(self.tasks)
+        )
+
+    def test_assign_and_unassign(self):
+        self.tasks[0].assignees.add(self.workers[0])
+        payload = {"ids": self.ids(self.tasks), "workers": self.ids(self.workers)}
+
+        self.post({"action": "assign", **payload})
+        for task in self.tasks:
+            self.assertEqual(set(task.assignees.all()), set(self.workers))
+
+        self.post({"action": "unassign", **payload, "workers": [self.workers[1].pk]})
+        self.assertEqual(set(self.workers[0].tasks.all()), set(self.tasks))
+        self.assertFalse(self.workers[1].tasks.exists())
+
+    def test_untag_and_delete(self):
+        for task in self.tasks:
+            task.tags.add(self.tag)
+        self.tasks[0].assignees.add(self.workers[0])
+
+        self.post(
+            {"action": "untag", "ids": self.ids(self.tasks[:2]), "tags": [self.tag.pk]}
+        )
+        self.assertEqual(self.tag.tasks.count(), 4)
+
+        result = self.post({"action": "delete", "search_query": "sprint"})
+        self.assertEqual(result["changed"], 6)
+        self.assertEqual(list(Task.objects.all()), [self.other])
+        self.assertFalse(self.workers[0].tasks.exists())
+        self.assertEqual(list(search_tasks(Task.objects.all(), "sprint")), [])
+
+    def test_delete_removes_every_row_referring_to_the_tasks(self):
+        # delete() empties the m2m tables before deleting the tasks without a
+        # collector, and the search index is cleared on tasks_bulk_changed; a
+        # new table referring to tasks needs a step of its own.
+        self.assertEqual(
+            referring_models(Task),
+            {Task.assignees.through, Task.tags.through, TaskSearchEntry},
+        )
+        self.tasks[0].assignees.add(self.workers[0])
+        self.tasks[0].tags.add(self.tag)
+        changed = BulkTaskOperation("delete", self.ids(self.tasks)).run()
+        self.assertEqual(changed, 6)
+        self.assertFalse(Task.assignees.through.objects.exists())
+        self.assertFalse(Task.tags.through.objects.exists())
+
+    def test_query_count_does_not_depend_on_task_count(self):
+        def run(tasks):
+            with CaptureQueriesContext(connection) as queries:
+                self.post(
+                    {
+                        "action": "assign",
+                        "ids": self.ids(tasks),
+                        "workers": self.ids(self.workers),
+                    }
+                )
+            return len(queries)
+
+        self.assertEqual(run(self.tasks[:1]), run(self.tasks[1:]))
+
+    def test_one_consolidated_signal(self):
+        received = []
+
+        def receiver(sender, **kwargs):
+            received.append(kwargs)
+
+        tasks_bulk_changed.connect(receiver)
+        self.addCleanup(tasks_bulk_changed.disconnect, receiver)
+        self.tasks[0].assignees.add(self.workers[0])
+        BulkTaskOperation("complete", self.ids(self.tasks)).run()
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]["task_ids"], self.ids(self.tasks))
+        self.assertEqual(received[0]["worker_ids"], [self.workers[0].pk])
+
+    def test_invalid_requests(self):
+        errors = self.post({"action": "complete"}, status=400)["errors"]
+        self.assertIn("__all__", errors)
+        errors = self.post({"action": "assign", "ids": [self.tasks[0].pk]}, status=400)
+        self.assertIn("workers", errors["errors"])
+        self.post({"action": "archive", "ids": [self.tasks[0].pk]}, status=400)
+        self.post({"action": "complete", "ids": [0]}, status=400)
+        self.assertEqual(self.client.get(BULK_URL).status_code, 405)
+
+    def test_form_encoded_requests(self):
+        response = self.client.post(
+            BULK_URL, {"action": "complete", "ids": self.ids(self.tasks[:2])}
+        )
+        self.assertEqual(response.json()["changed"], 2)
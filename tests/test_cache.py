@@ -0,0 +1,112 @@
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from task_manager import cache
+from task_manager.cache import LocalLRU, Namespace
+
+
+class LocalLRUTest(SimpleTestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        lru = LocalLRU(max_entries=2)
+        lru.set("a", 1, None)
+        lru.set("b", 2, None)
+        lru.get("a")
+        lru.set("c", 3, None)
+
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIs(lru.get("b"), cache.MISSING)
+        self.assertEqual(len(lru), 2)
+
+    def test_entries_expire(self):
+        lru = LocalLRU(max_entries=2)
+        with mock.patch("task_manager.cache.time.monotonic", return_value=100):
+            lru.set("a", 1, 5)
+        with mock.patch("task_manager.cache.time.monotonic", return_value=104):
+            self.assertEqual(lru.get("a"), 1)
+        with mock.patch("task_manager.cache.time.monotonic", return_value=105):
+            self.assertIs(lru.get("a"), cache.MISSING)
+
+
+class NamespaceTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.shared_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.shared_dir.cleanup)
+        settings = override_settings(
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                "shared": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": self.shared_dir.name,
+                },
+            },
+            TASK_MANAGER_CACHE={"ALIAS": "shared"},
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.ns = Namespace("test")
+
+    def test_keys_are_namespaced(self):
+        self.assertEqual(self.ns.key("task", 1), "task_manager:test:task:1")
+
+    def test_local_tier_in_front_of_shared_tier(self):
+        key = self.ns.key("answer")
+        self.ns.set(key, 42)
+        self.assertEqual(self.ns.get(key), 42)
+
+        other_process = Namespace("test")
+        self.assertEqual(other_process.get(key), 42)
+        self.assertEqual(other_process.get(key), 42)
+        self.assertIsNone(other_process.get(self.ns.key("unknown")))
+
+        self.assertEqual(self.ns.stats["local_hits"], 1)
+        self.assertEqual(
+            other_process.stats, {"local_hits": 1, "shared_hits": 1, "misses": 1}
+        )
+
+    def test_writes_reach_both_tiers(self):
+        key = self.ns.key("counter")
+        self.ns.set(key, 1)
+        self.assertEqual(self.ns.incr(key), 2)
+        self.assertEqual(Namespace("test").get(key), 2)
+
+        self.ns.delete(key)
+        self.assertIsNone(self.ns.get(key))
+        with self.assertRaises(ValueError):
+            self.ns.incr(key)
+
+    def test_get_many_and_get_or_set(self):
+        self.ns.set_many({self.ns.key("a"): 1, self.ns.key("b"): 2})
+        self.assertEqual(
+            self.ns.get_many([self.ns.key("a"), self.ns.key("c")]),
+            {self.ns.key("a"): 1},
+        )
+        compute = mock.Mock(return_value="value")
+        self.assertEqual(self.ns.get_or_set(self.ns.key("c"), compute), "value")
+        self.assertEqual(self.ns.get_or_set(self.ns.key("c"), compute), "value")
+        compute.assert_called_once()
+
+    @override_settings(TASK_MANAGER_CACHE={"ALIAS": "default", "MAX_TIMEOUT": 5})
+    def test_timeouts_are_capped(self):
+        ns = Namespace("test", timeout=None)
+        with mock.patch.object(ns.shared, "set") as shared_set:
+            ns.set(ns.key("a"), 1)
+            ns.set(ns.key("b"), 1, timeout=60)
+            ns.set(ns.key("c"), 1, timeout=2)
+        self.assertEqual([c.args[2] for c in shared_set.call_args_list], [5, 5, 2])
+
+    @override_settings(TASK_MANAGER_CACHE={"ALIAS": "default", "MAX_TIMEOUT": 5})
+    def test_versioned_timeouts_are_not_capped(self):
+        ns = Namespace("test", timeout=60, versioned=True)
+        with mock.patch.object(ns.shared, "set") as shared_set:
+            ns.set(ns.key("a"), 1)
+        self.assertEqual(shared_set.call_args.args[2], 60)
+
+    @override_settings(TASK_MANAGER_CACHE={"ALIAS": None})
+    def test_without_shared_tier(self):
+        ns = Namespace("test", timeout=None)
+        key = ns.key("counter")
+        ns.set(key, 1)
+        self.assertEqual(ns.incr(key), 2)
+        self.assertIsNone(Namespace("test").get(key))
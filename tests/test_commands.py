@@ -0,0 +1,47 @@
+from django.core.management import call_command
+from django.test import TestCase
+
+from task_manager.models import Position, Tag, Task, TaskType, Worker
+
+
+class SeedPerfCommandTest(TestCase):
+    def seed(self, *args):
+        call_command(
+            "seed_perf",
+            "--tasks=120",
+            "--workers=12",
+            "--tags=6",
+            "--batch-size=50",
+            "--seed=7",
+            *args,
+            verbosity=0,
+        )
+
+    def assignments(self):
+        return list(
+            Task.assignees.through.objects.order_by(
+                "task__slug", "worker__slug"
+            ).values_list("task__slug", "worker__slug")
+        )
+
+    def test_seed_perf_creates_requested_rows(self):
+        self.seed()
+        self.assertEqual(Task.objects.count(), 120)
+        self.assertEqual(Worker.objects.count(), 12)
+        self.assertEqual(Tag.objects.count(), 6)
+        self.assertEqual(Position.objects.count(), 10)
+        self.assertEqual(TaskType.objects.count(), 6)
+        self.assertFalse(Task.objects.filter(assignees=None).exists())
+
+    def test_seed_perf_is_deterministic(self):
+        self.seed()
+        first_run = self.assignments()
+        first_names = list(Task.objects.order_by("slug").values_list("name", flat=True))
+
+        self.seed("--clear")
+        self.assertEqual(Task.objects.count(), 120)
+        self.assertEqual(self.assignments(), first_run)
+        self.assertEqual(
+            list(Task.objects.order_by("slug").values_list("name", flat=True)),
+            first_names,
+        )
@@ -0,0 +1,125 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import router
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task_manager import cache
+from task_manager.dashboard import DashboardStats
+from task_manager.db.routers import replica_reads
+from task_manager.models import Position, Task, TaskType
+
+INDEX_URL = reverse("task_manager:index")
+
+
+class DashboardStatsTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        position = Position.objects.create(name="test position")
+        self.task_type = TaskType.objects.create(name="test type")
+        for task_id in range(3):
+            Task.objects.create(
+                name=f"Test task_{task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=self.task_type,
+                is_completed=task_id == 0,
+                slug=f"test-task_{task_id}",
+            )
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test password",
+            position=position,
+            slug="test",
+        )
+        self.client.force_login(self.user)
+
+    def test_compute_uses_single_query(self):
+        with self.assertNumQueries(1):
+            stats = DashboardStats.compute()
+        self.assertEqual(
+            stats,
+            {
+                "num_workers": 1,
+                "num_positions": 1,
+                "num_tasks": 3,
+                "tasks_in_work": 2,
+                "completed_tasks": 1,
+                "overdue_tasks": 0,
+            },
+        )
+
+    def test_overdue_counter(self):
+        Task.objects.create(
+            name="Late task",
+            description="test description",
+            deadline=date(year=2020, month=1, day=1),
+            task_type=self.task_type,
+            slug="late-task",
+        )
+        response = self.client.get(INDEX_URL)
+        self.assertEqual(response.context["overdue_tasks"], 1)
+        self.assertContains(response, "1 overdue")
+
+    def test_compute_on_empty_tables(self):
+        Task.objects.all().delete()
+        stats = DashboardStats.compute()
+        self.assertEqual(stats["num_tasks"], 0)
+        self.assertEqual(stats["tasks_in_work"], 0)
+        self.assertEqual(stats["completed_tasks"], 0)
+
+    def test_get_is_served_from_cache(self):
+        DashboardStats.get()
+        with self.assertNumQueries(0):
+            stats = DashboardStats.get()
+        self.assertEqual(stats["num_tasks"], 3)
+
+    def test_index_page_context(self):
+        response = self.client.get(INDEX_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["num_tasks"], 3)
+        self.assertEqual(response.context["tasks_in_work"], 2)
+        self.assertEqual(response.context["completed_tasks"], 1)
+        self.assertNotIn("task_list", response.context)
+
+    def test_task_changes_invalidate_snapshot(self):
+        DashboardStats.get()
+        task = Task.objects.get(slug="test-task_1")
+        task.is_completed = True
+        task.save()
+        self.assertEqual(DashboardStats.get()["completed_tasks"], 2)
+
+        task.delete()
+        self.assertEqual(DashboardStats.get()["num_tasks"], 2)
+
+    def test_worker_and_position_changes_invalidate_snapshot(self):
+        DashboardStats.get()
+        position = Position.objects.create(name="another position")
+        get_user_model().objects.create_user(
+            username="another", password="test password", slug="another"
+        )
+        stats = DashboardStats.get()
+        self.assertEqual(stats["num_workers"], 2)
+        self.assertEqual(stats["num_positions"], 2)
+
+        position.delete()
+        self.assertEqual(DashboardStats.get()["num_positions"], 1)
+
+    def test_login_does_not_invalidate_snapshot(self):
+        DashboardStats.get()
+        self.client.login(username="test", password="test password")
+        with self.assertNumQueries(0):
+            DashboardStats.get()
+
+    @override_settings(DATABASE_REPLICAS=["default"], REPLICA_STICKY_SECONDS=5)
+    def test_replica_counts_are_kept_briefly(self):
+        with replica_reads(), mock.patch.object(
+            router, "db_for_read", wraps=router.db_for_read
+        ) as db_for_read, mock.patch.object(
+            DashboardStats.cache, "set", wraps=DashboardStats.cache.set
+        ) as cache_set:
+            DashboardStats.get()
+        db_for_read.assert_called_once_with(Task)
+        self.assertEqual(cache_set.call_args.args[2], 5)
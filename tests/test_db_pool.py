@@ -0,0 +1,159 @@
+import threading
+import time
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from task_manager.db import pool as db_pool
+from task_manager.db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def test_returned_connections_are_reused(self):
+        pool = ConnectionPool(max_size=2)
+        first = pool.getconn(FakeConnection)
+        pool.putconn(first)
+        self.assertIs(pool.getconn(FakeConnection), first)
+
+        stats = pool.stats()
+        self.assertEqual((stats["opened"], stats["checkouts"]), (1, 2))
+        self.assertEqual((stats["size"], stats["in_use"], stats["idle"]), (1, 1, 0))
+
+    def test_full_pool_times_out(self):
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+        pool.getconn(FakeConnection)
+        with self.assertRaises(PoolTimeout):
+            pool.getconn(FakeConnection)
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_waiting_checkout_gets_the_returned_connection(self):
+        pool = ConnectionPool(max_size=1, timeout=5)
+        connection = pool.getconn(FakeConnection)
+        result = []
+        waiter = threading.Thread(
+            target=lambda: result.append(pool.getconn(FakeConnection))
+        )
+        waiter.start()
+        time.sleep(0.05)
+        pool.putconn(connection)
+        waiter.join()
+
+        self.assertEqual(result, [connection])
+        self.assertEqual((pool.stats()["waits"], pool.stats()["opened"]), (1, 1))
+
+    def test_closed_and_failing_connections_are_replaced(self):
+        healthy = {"value": True}
+        pool = ConnectionPool(max_size=1, check=lambda connection: healthy["value"])
+        first = pool.getconn(FakeConnection)
+        first.close()
+        pool.putconn(first)
+        second = pool.getconn(FakeConnection)
+        self.assertIsNot(second, first)
+
+        pool.putconn(second)
+        healthy["value"] = False
+        third = pool.getconn(FakeConnection)
+        self.assertIsNot(third, second)
+        self.assertTrue(second.closed)
+        stats = pool.stats()
+        self.assertEqual((stats["opened"], stats["closed"]), (3, 2))
+        self.assertEqual((stats["failed_checks"], stats["size"]), (1, 1))
+
+    def test_idle_connections_expire(self):
+        pool = ConnectionPool(max_size=2, max_idle=0)
+        first = pool.getconn(FakeConnection)
+        pool.putconn(first)
+        time.sleep(0.01)
+        self.assertIsNot(pool.getconn(FakeConnection), first)
+        self.assertTrue(first.closed)
+
+    def test_failed_connect_frees_the_slot(self):
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+
+        def refuse():
+            raise OSError("connection refused")
+
+        with self.assertRaises(OSError):
+            pool.getconn(refuse)
+        self.assertIsInstance(pool.getconn(FakeConnection), FakeConnection)
+
+    def test_reset_runs_before_the_connection_is_idle(self):
+        reset = []
+        pool = ConnectionPool(reset=reset.append)
+        connection = pool.getconn(FakeConnection)
+        pool.putconn(connection)
+        self.assertEqual(reset, [connection])
+
+
+@skipUnless(connection.vendor == "postgresql", "needs a PostgreSQL DATABASE_URL")
+class PostgresPoolConnectionTest(SimpleTestCase):
+    databases = {"default"}
+
+    def setUp(self) -> None:
+        from django.db.backends.postgresql import base
+
+        from task_manager.db.postgresql_pool.base import (
+            TRANSACTION_STATUS_IDLE,
+            DatabaseWrapper,
+        )
+
+        self.idle = TRANSACTION_STATUS_IDLE
+        self.wrapper = DatabaseWrapper
+        # A connection of its own, outside the pool and the test transaction.
+        self.raw = base.DatabaseWrapper.get_new_connection(
+            connection, connection.get_connection_params()
+        )
+        self.addCleanup(self.raw.close)
+
+    def test_check_leaves_no_transaction_open(self):
+        for autocommit in (True, False):
+            self.raw.autocommit = autocommit
+            self.assertTrue(self.wrapper.check_connection(self.raw))
+            self.assertEqual(self.raw.info.transaction_status, self.idle)
+
+    def test_connections_inside_a_transaction_fail_the_check(self):
+        self.raw.autocommit = False
+        with self.raw.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        self.assertFalse(self.wrapper.check_connection(self.raw))
+
+        self.wrapper.reset_connection(self.raw)
+        self.assertEqual(self.raw.info.transaction_status, self.idle)
+        self.assertTrue(self.wrapper.check_connection(self.raw))
+
+
+class DatabasePoolViewTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.client.force_login(self.user)
+        self.addCleanup(db_pool.close_pools)
+        self.addCleanup(db_pool._pools.clear)
+
+    def test_staff_only(self):
+        response = self.client.get(reverse("task_manager:api-db-pools"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_stats_of_the_process_pools(self):
+        self.user.is_staff = True
+        self.user.save()
+        pool = db_pool.get_pool("default", "workflow", max_size=3)
+        pool.getconn(FakeConnection)
+
+        response = self.client.get(reverse("task_manager:api-db-pools"))
+
+        [stats] = response.json()["pools"]
+        self.assertEqual((stats["alias"], stats["database"]), ("default", "workflow"))
+        self.assertEqual((stats["in_use"], stats["max_size"]), (1, 3))
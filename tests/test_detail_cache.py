@@ -0,0 +1,89 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager import cache
+from task_manager.models import Position, Task, TaskType
+
+
+class DetailFragmentCacheTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.position = Position.objects.create(name="Backend")
+        self.worker = get_user_model().objects.create_user(
+            username="assignee",
+            password="test password",
+            slug="assignee",
+            position=self.position,
+        )
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.task = Task.objects.create(
+            name="Test task",
+            description="test description",
+            deadline=date(year=2323, month=10, day=10),
+            task_type=TaskType.objects.create(name="test type"),
+            slug="test-task",
+        )
+        self.task.assignees.add(self.worker)
+        self.task_url = reverse(
+            "task_manager:task-detail", kwargs={"slug": "test-task"}
+        )
+        self.worker_url = reverse(
+            "task_manager:worker-detail", kwargs={"slug": "assignee"}
+        )
+        self.client.force_login(self.user)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        return response, len(queries)
+
+    def test_repeat_views_skip_fragment_queries(self):
+        for url in (self.task_url, self.worker_url):
+            with self.subTest(url=url):
+                _, first = self.count_queries(url)
+                response, repeat = self.count_queries(url)
+                self.assertLess(repeat, first)
+                self.assertContains(
+                    response,
+                    "Test task" if url == self.worker_url else "(Backend)",
+                )
+
+    def test_assignee_changes_refresh_both_pages(self):
+        self.client.get(self.task_url)
+        self.client.get(self.worker_url)
+
+        self.user.tasks.add(self.task)
+        self.assertContains(self.client.get(self.task_url), "(None)")
+        self.task.assignees.remove(self.worker)
+        self.assertNotContains(self.client.get(self.task_url), "(Backend)")
+        self.assertContains(
+            self.client.get(self.worker_url), "The worker is not assigned"
+        )
+
+    def test_related_changes_refresh_pages(self):
+        self.client.get(self.task_url)
+        self.client.get(self.worker_url)
+
+        self.position.name = "Frontend"
+        self.position.save()
+        self.assertContains(self.client.get(self.task_url), "(Frontend)")
+
+        self.task.is_completed = True
+        self.task.save(update_fields=["is_completed"])
+        response = self.client.get(self.worker_url)
+        self.assertContains(response, "There are no projects in works")
+
+    def test_per_user_parts_are_not_cached(self):
+        response = self.client.get(self.task_url)
+        self.assertContains(response, "Assign me to this project")
+
+        self.client.force_login(self.worker)
+        response = self.client.get(self.task_url)
+        self.assertContains(response, "Delete me from this project")
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.db.routers import replica_reads
+from task_manager.export import export_lines
+from task_manager.models import Tag, Task, TaskType
+
+EXPORT_URL = reverse("task_manager:task-export")
+
+
+class TaskExportTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        task_type = TaskType.objects.create(name="Bug")
+        self.tag = Tag.objects.create(name="backend")
+        for task_id in range(5):
+            task = Task.objects.create(
+                name=f"Fix login {task_id}" if task_id < 2 else f"Write docs {task_id}",
+                description="test description",
+                deadline=datetime(2323, 10, 10, tzinfo=timezone.utc),
+                priority="Low priority",
+                task_type=task_type,
+                creator=self.user,
+                slug=f"task-{task_id}",
+            )
+            task.assignees.add(self.user)
+            task.tags.add(self.tag)
+        self.client.force_login(self.user)
+
+    def read(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_export(self):
+        response = self.client.get(EXPORT_URL)
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("tasks.csv", response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["slug"], "task-0")
+        self.assertEqual(rows[0]["task_type"], "Bug")
+        self.assertEqual(rows[0]["assignees"], "test")
+        self.assertEqual(rows[0]["tags"], "backend")
+
+    def test_ndjson_export_is_filtered_like_the_task_list(self):
+        response = self.client.get(
+            EXPORT_URL, {"format": "ndjson", "search_query": "login"}
+        )
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(sorted(row["slug"] for row in rows), ["task-0", "task-1"])
+        self.assertEqual(rows[0]["creator"], "test")
+        self.assertEqual(rows[0]["assignees"], ["test"])
+        self.assertEqual(rows[0]["deadline"], "2323-10-10T00:00:00Z")
+
+    def test_invalid_format(self):
+        response = self.client.get(EXPORT_URL, {"format": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_login_required(self):
+        self.client.logout()
+        response = self.client.get(EXPORT_URL)
+        self.assertNotEqual(response.status_code, 200)
+
+    def test_queries_per_chunk(self):
+        with CaptureQueriesContext(connection) as queries:
+            lines = list(export_lines("ndjson", chunk_size=2))
+
+        self.assertEqual(len(lines), 5)
+        # One query for the tasks plus assignees and tags for each of 3 chunks.
+        self.assertEqual(len(queries), 1 + 3 * 2)
+
+    @override_settings(DATABASE_REPLICAS=["replica_1"])
+    def test_names_are_read_from_the_database_of_the_rows(self):
+        # Outside the pinned database every read would go to the replica,
+        # which does not exist here.
+        with replica_reads():
+            lines = list(export_lines("ndjson", Task.objects.using("default")))
+        self.assertEqual(json.loads(lines[0])["assignees"], ["test"])
+
+    def test_export_tasks_command(self):
+        out = io.StringIO()
+        call_command(
+            "export_tasks", "--format", "ndjson", "--chunk-size", "2", stdout=out
+        )
+        self.assertEqual(len(out.getvalue().splitlines()), 5)
+
+        out = io.StringIO()
+        call_command("export_tasks", "--search-query", "docs", stdout=out)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual([row["slug"] for row in rows], ["task-2", "task-3", "task-4"])
+
+        Task.objects.filter(slug="task-3").update(is_completed=True)
+        out = io.StringIO()
+        call_command(
+            "export_tasks",
+            "--search-query",
+            "docs",
+            "--status",
+            "completed",
+            stdout=out,
+        )
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual([row["slug"] for row in rows], ["task-3"])
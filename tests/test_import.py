@@ -0,0 +1,157 @@
+import io
+import json
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager import cache
+from task_manager.dashboard import DashboardStats
+from task_manager.export import export_lines
+from task_manager.importer import TaskImporter
+from task_manager.models import Tag, Task, TaskType
+from task_manager.search import search_tasks
+
+IMPORT_URL = reverse("task_manager:task-import")
+
+CSV_HEADER = (
+    "name,description,deadline,priority,is_completed,task_type,assignees,tags\n"
+)
+
+
+def csv_row(name, task_type="Bug", assignees="alice;bob", tags="backend", **kwargs):
+    values = {
+        "description": "test description",
+        "deadline": "2323-10-10",
+        "priority": "Low priority",
+        "is_completed": "False",
+        **kwargs,
+    }
+    return (
+        f"{name},{values['description']},{values['deadline']},{values['priority']},"
+        f"{values['is_completed']},{task_type},{assignees},{tags}\n"
+    )
+
+
+class TaskImportTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.tag = Tag.objects.create(name="backend")
+        self.alice = get_user_model().objects.create_user(
+            username="alice", slug="alice"
+        )
+        self.bob = get_user_model().objects.create_user(username="bob", slug="bob")
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+
+    def run_import(self, content, import_format="csv", **kwargs):
+        return TaskImporter(**kwargs).run(io.StringIO(content), import_format)
+
+    def test_csv_import_resolves_relations_by_name(self):
+        result = self.run_import(
+            CSV_HEADER + csv_row("Fix login") + csv_row("Write docs", tags=""),
+            creator=self.user,
+        )
+
+        self.assertEqual((result.created, result.failed), (2, 0))
+        task = Task.objects.get(slug="fix-login")
+        self.assertEqual(task.task_type, self.task_type)
+        self.assertEqual(task.creator, self.user)
+        self.assertEqual(set(task.assignees.all()), {self.alice, self.bob})
+        self.assertEqual(list(task.tags.all()), [self.tag])
+        self.assertFalse(Task.objects.get(slug="write-docs").tags.exists())
+
+    def test_invalid_rows_are_reported_without_aborting_the_batch(self):
+        content = (
+            CSV_HEADER
+            + csv_row("Fix login")
+            + csv_row("Unknown type", task_type="Feature")
+            + csv_row("Unknown worker", assignees="carol")
+            + csv_row("Bad deadline", deadline="tomorrow")
+            + csv_row("", priority="Someday")
+            + csv_row("Write docs")
+        )
+        result = self.run_import(content)
+
+        self.assertEqual((result.created, result.failed), (2, 4))
+        self.assertEqual([line for line, _ in result.errors], [3, 4, 5, 6])
+        self.assertIn("task_type: Unknown task type: Feature.", result.errors[0][1])
+        self.assertIn("assignees: Unknown worker: carol.", result.errors[1][1])
+        self.assertTrue(result.errors[2][1][0].startswith("deadline:"))
+        self.assertEqual(len(result.errors[3][1]), 2)
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_ndjson_round_trip_of_the_export(self):
+        self.run_import(CSV_HEADER + csv_row("Fix login") + csv_row("Write docs"))
+        exported = "".join(export_lines("ndjson"))
+        Task.objects.all().delete()
+
+        result = self.run_import(exported + "\nnot json\n", import_format="ndjson")
+
+        self.assertEqual((result.created, result.failed), (2, 1))
+        self.assertEqual(result.errors, [(4, ["Invalid JSON."])])
+        self.assertEqual("".join(export_lines("ndjson")).count("Write docs"), 1)
+        row = json.loads(exported.splitlines()[0])
+        self.assertEqual(row["assignees"], ["alice", "bob"])
+
+    def test_caches_and_search_index_are_refreshed(self):
+        self.assertEqual(DashboardStats.get()["num_tasks"], 0)
+        self.run_import(CSV_HEADER + csv_row("Fix login"))
+
+        self.assertEqual(DashboardStats.get()["num_tasks"], 1)
+        self.assertEqual(
+            [task.slug for task in search_tasks(Task.objects.all(), "login")],
+            ["fix-login"],
+        )
+
+    def test_queries_per_batch(self):
+        content = CSV_HEADER + "".join(csv_row(f"Task {number}") for number in range(6))
+        with CaptureQueriesContext(connection) as queries:
+            result = TaskImporter(batch_size=3).run(io.StringIO(content), "csv")
+
+        self.assertEqual(result.created, 6)
+        with CaptureQueriesContext(connection) as single:
+            TaskImporter(batch_size=6).run(io.StringIO(content), "csv")
+        # Three lookup queries, then the same number of queries per batch.
+        self.assertEqual(len(queries) - 3, 2 * (len(single) - 3))
+
+    def test_import_tasks_command(self):
+        source = tempfile.NamedTemporaryFile("w", suffix=".csv")
+        self.addCleanup(source.close)
+        source.write(CSV_HEADER + csv_row("Fix login") + csv_row("Oops", tags="qa"))
+        source.flush()
+        out = io.StringIO()
+        err = io.StringIO()
+        call_command(
+            "import_tasks", source.name, "--creator", "test", stdout=out, stderr=err
+        )
+
+        self.assertIn("Imported 1 tasks, skipped 1 rows", out.getvalue())
+        self.assertIn("Line 3: tags: Unknown tag: qa.", err.getvalue())
+        self.assertEqual(Task.objects.get().creator, self.user)
+
+    def test_upload_view(self):
+        self.client.force_login(self.user)
+        upload = SimpleUploadedFile(
+            "tasks.csv",
+            (
+                CSV_HEADER + csv_row("Fix login") + csv_row("Oops", task_type="")
+            ).encode(),
+        )
+        response = self.client.post(IMPORT_URL, {"file": upload})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["result"].created, 1)
+        self.assertContains(response, "Exactly one task type is required.")
+        self.assertEqual(Task.objects.get().creator, self.user)
+
+    def test_upload_view_login_required(self):
+        response = self.client.get(IMPORT_URL)
+        self.assertNotEqual(response.status_code, 200)
@@ -1,5 +1,9 @@
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
 from task_manager.models import(
     Position,
@@ -42,3 +46,60 @@ class ModelsTest(TestCase):
     def test_tag_str(self):
         tag = TaskType.objects.create(name="Test tag")
         self.assertEqual(str(tag), tag.name)
+
+
+class TaskIndexesTest(TestCase):
+    def test_open_tasks_by_deadline_use_partial_index(self):
+        plan = Task.objects.filter(is_completed=False).order_by("deadline").explain()
+        self.assertIn("task_open_deadline_idx", plan)
+
+    def test_slug_lookups_use_index(self):
+        task_plan = Task.objects.filter(slug="task").explain()
+        worker_plan = get_user_model().objects.filter(slug="worker").explain()
+        self.assertIn("index", task_plan.lower())
+        self.assertIn("index", worker_plan.lower())
+
+
+class TaskStatusTest(TestCase):
+    def setUp(self) -> None:
+        self.task_type = TaskType.objects.create(name="test type")
+
+    def create_task(self, slug, deadline, is_completed=False):
+        return Task.objects.create(
+            name=slug,
+            description="test description",
+            deadline=deadline,
+            task_type=self.task_type,
+            is_completed=is_completed,
+            slug=slug,
+        )
+
+    def test_status_is_computed_in_the_query(self):
+        self.create_task("done", "2020-01-01 10:00Z", is_completed=True)
+        self.create_task("late", "2020-01-01 10:00Z")
+        self.create_task("open", "2323-01-01 10:00Z")
+
+        statuses = dict(Task.objects.with_status().values_list("slug", "status"))
+        self.assertEqual(
+            statuses, {"done": "completed", "late": "overdue", "open": "in_progress"}
+        )
+        overdue = Task.objects.overdue().values_list("slug", flat=True)
+        self.assertEqual(list(overdue), ["late"])
+        for status, _ in Task.STATUS_CHOICES:
+            self.assertEqual(
+                list(Task.objects.by_status(status)),
+                list(Task.objects.with_status().filter(status=status)),
+            )
+
+    @override_settings(TIME_ZONE="Asia/Tokyo")
+    def test_overdue_follows_the_local_date(self):
+        # 16:00 UTC is already the next day in Tokyo.
+        now = datetime(2023, 10, 10, 16, 0, tzinfo=dt_timezone.utc)
+        self.create_task("late", datetime(2023, 10, 10, 14, 0, tzinfo=dt_timezone.utc))
+        self.create_task("today", now.replace(hour=15, minute=30))
+        with mock.patch.object(timezone, "now", return_value=now):
+            overdue = list(Task.objects.overdue().values_list("slug", flat=True))
+        self.assertEqual(overdue, ["late"])
+
+    def test_overdue_uses_partial_index(self):
+        self.assertIn("task_open_deadline_idx", Task.objects.overdue().explain())
@@ -0,0 +1,231 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Task, TaskType
+from task_manager.pagination import (
+    CursorPaginator,
+    EstimatedCountPaginator,
+    InvalidCursor,
+    encode_cursor,
+)
+from task_manager.templatetags.query_transform import query_transform
+
+TASK_LIST_URL = reverse("task_manager:task-list")
+
+
+class CursorPaginatorTest(TestCase):
+    def setUp(self) -> None:
+        task_type = TaskType.objects.create(name="test type")
+        for task_id in range(12):
+            Task.objects.create(
+                name=f"Test task_{task_id % 4}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10) + timedelta(days=task_id),
+                task_type=task_type,
+                slug=f"test-task_{task_id}",
+            )
+
+    def walk(self, queryset, per_page=5):
+        paginator = CursorPaginator(queryset, per_page)
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+        return paginator, pages
+
+    def test_forward_pages_cover_every_row_once(self):
+        queryset = Task.objects.order_by("-name")
+        _, pages = self.walk(queryset)
+
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+        self.assertEqual(
+            [task for page in pages for task in page],
+            list(queryset.order_by("-name", "pk")),
+        )
+        self.assertFalse(pages[0].has_previous())
+        self.assertTrue(pages[-1].has_previous())
+
+    def test_previous_cursor_returns_previous_page(self):
+        paginator, pages = self.walk(Task.objects.order_by("deadline"))
+
+        previous = paginator.page(pages[2].previous_cursor)
+        self.assertEqual(list(previous), list(pages[1]))
+        self.assertTrue(previous.has_next())
+
+        first = paginator.page(previous.previous_cursor)
+        self.assertEqual(list(first), list(pages[0]))
+        self.assertFalse(first.has_previous())
+
+    def test_page_does_not_count_rows(self):
+        paginator = CursorPaginator(Task.objects.order_by("id"), 5)
+        with CaptureQueriesContext(connection) as queries:
+            paginator.page()
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("COUNT(", queries[0]["sql"])
+
+    def test_invalid_cursor(self):
+        paginator = CursorPaginator(Task.objects.order_by("id"), 5)
+        with self.assertRaises(InvalidCursor):
+            paginator.page("not a cursor")
+
+    def test_cursor_values_must_match_the_ordering_fields(self):
+        paginator = CursorPaginator(Task.objects.order_by("deadline"), 5)
+        for values in (["abc", 1], [date(2323, 10, 10), "abc"], [[1], 1]):
+            with self.assertRaises(InvalidCursor):
+                paginator.page(encode_cursor(values))
+
+    def test_null_cursor_values_are_invalid(self):
+        paginator = CursorPaginator(Task.objects.order_by("deadline"), 5)
+        with self.assertRaises(InvalidCursor):
+            paginator.page(encode_cursor([None, 1]))
+
+
+@override_settings(COUNT_ESTIMATE_THRESHOLD=10)
+class EstimatedCountPaginatorTest(TestCase):
+    def setUp(self) -> None:
+        self.task_type = TaskType.objects.create(name="test type")
+        self.create_tasks(range(12))
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Task._meta.db_table}")
+
+    def create_tasks(self, numbers):
+        for task_id in numbers:
+            Task.objects.create(
+                name=f"Test task_{task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=self.task_type,
+                slug=f"test-task_{task_id}",
+            )
+
+    def test_large_table_count_comes_from_statistics(self):
+        # Rows added after ANALYZE are not in the estimate.
+        self.create_tasks(range(12, 15))
+        paginator = EstimatedCountPaginator(Task.objects.order_by("id"), 5)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(paginator.count, 12)
+        self.assertTrue(paginator.is_estimated)
+        self.assertFalse(any("COUNT(" in query["sql"] for query in queries))
+
+    def test_partial_index_statistics_are_not_the_row_count(self):
+        # task_open_deadline_idx only indexes the tasks that are not completed.
+        # Its statistics are moved first, so that reading only the first row of
+        # the table's statistics would pick them.
+        Task.objects.filter(name__endswith="1").update(is_completed=True)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Task._meta.db_table}")
+            cursor.execute(
+                "SELECT tbl, idx, stat FROM sqlite_stat1 WHERE tbl = %s "
+                "ORDER BY idx = 'task_open_deadline_idx' DESC",
+                [Task._meta.db_table],
+            )
+            stats = cursor.fetchall()
+            cursor.execute(
+                "DELETE FROM sqlite_stat1 WHERE tbl = %s", [Task._meta.db_table]
+            )
+            cursor.executemany("INSERT INTO sqlite_stat1 VALUES (%s, %s, %s)", stats)
+        self.assertEqual(stats[0][1], "task_open_deadline_idx")
+        self.assertEqual(stats[0][2].split()[0], "10")
+
+        paginator = EstimatedCountPaginator(Task.objects.order_by("id"), 5)
+        self.assertEqual(paginator.count, 12)
+        self.assertTrue(paginator.is_estimated)
+
+    def test_estimated_pages_are_bounded_by_rows(self):
+        self.create_tasks(range(12, 15))
+        paginator = EstimatedCountPaginator(Task.objects.order_by("id"), 5)
+
+        self.assertTrue(paginator.page(2).has_next())
+        last_page = paginator.page(3)
+        self.assertEqual(len(last_page), 5)
+        self.assertFalse(last_page.has_next())
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
+
+    def test_filtered_and_small_sets_are_counted_exactly(self):
+        filtered = Task.objects.filter(name__endswith="1").order_by("id")
+        paginator = EstimatedCountPaginator(filtered, 5)
+        self.assertEqual(paginator.count, 2)
+        self.assertFalse(paginator.is_estimated)
+
+        with override_settings(COUNT_ESTIMATE_THRESHOLD=100):
+            paginator = EstimatedCountPaginator(Task.objects.order_by("id"), 5)
+            self.assertEqual(paginator.count, 12)
+            self.assertFalse(paginator.is_estimated)
+
+
+class CursorPaginationViewTest(TestCase):
+    def setUp(self) -> None:
+        task_type = TaskType.objects.create(name="test type")
+        for task_id in range(8):
+            Task.objects.create(
+                name=f"Test task_{task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=task_type,
+                slug=f"test-task_{task_id}",
+            )
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.client.force_login(self.user)
+
+    def test_task_list_follows_cursor_links(self):
+        first = self.client.get(TASK_LIST_URL)
+        next_cursor = first.context["page_obj"].next_cursor
+        self.assertContains(first, f"?cursor={next_cursor}")
+
+        second = self.client.get(TASK_LIST_URL, {"cursor": next_cursor})
+        self.assertEqual(second.status_code, 200)
+        self.assertTrue(second.context["is_paginated"])
+        self.assertEqual(len(second.context["task_list"]), 3)
+        self.assertFalse(second.context["page_obj"].has_next())
+        self.assertEqual(
+            list(first.context["task_list"]) + list(second.context["task_list"]),
+            list(Task.objects.order_by("id")),
+        )
+
+    def test_search_results_follow_cursor_links(self):
+        first = self.client.get(TASK_LIST_URL, {"search_query": "test"})
+        second = self.client.get(
+            TASK_LIST_URL,
+            {
+                "search_query": "test",
+                "cursor": first.context["page_obj"].next_cursor,
+            },
+        )
+        tasks = list(first.context["task_list"]) + list(second.context["task_list"])
+        self.assertEqual(len(set(tasks)), 8)
+
+    @override_settings(COUNT_ESTIMATE_THRESHOLD=1)
+    def test_page_links_use_estimated_count(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Task._meta.db_table}")
+        response = self.client.get(TASK_LIST_URL, {"page": 2})
+
+        self.assertTrue(response.context["paginator"].is_estimated)
+        self.assertEqual(len(response.context["task_list"]), 3)
+        self.assertContains(response, "?page=1")
+        self.assertNotContains(response, "?page=3")
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get(TASK_LIST_URL, {"cursor": "broken"})
+        self.assertEqual(response.status_code, 404)
+
+        for values in (["abc"], [None], [[1]]):
+            response = self.client.get(TASK_LIST_URL, {"cursor": encode_cursor(values)})
+            self.assertEqual(response.status_code, 404)
+
+    def test_query_transform_keeps_one_pagination_mode(self):
+        request = RequestFactory().get("/tasks/?search_query=x&page=2")
+        self.assertEqual(
+            query_transform(request, cursor="abc"), "search_query=x&cursor=abc"
+        )
+        request = RequestFactory().get("/tasks/?cursor=abc")
+        self.assertEqual(query_transform(request, page=3), "page=3")
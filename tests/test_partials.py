@@ -0,0 +1,70 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.models import Task, TaskType
+
+TASK_LIST_URL = reverse("task_manager:task-list")
+WORKER_LIST_URL = reverse("task_manager:worker-list")
+HTMX = {"HTTP_HX_REQUEST": "true"}
+
+
+class PartialListTest(TestCase):
+    def setUp(self) -> None:
+        task_type = TaskType.objects.create(name="test type")
+        for task_id in range(8):
+            Task.objects.create(
+                name=f"Test task_{task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=task_type,
+                slug=f"test-task_{task_id}",
+            )
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.client.force_login(self.user)
+
+    def test_htmx_request_renders_only_the_results(self):
+        full = self.client.get(TASK_LIST_URL)
+        partial = self.client.get(TASK_LIST_URL, **HTMX)
+
+        self.assertContains(full, "<html")
+        self.assertContains(full, '<script src="/static/js/plugins/htmx.js">')
+        self.assertNotContains(partial, "<html")
+        self.assertNotContains(partial, "search_query")
+        self.assertContains(partial, "Test task_0")
+        self.assertContains(partial, 'class="pagination"')
+        self.assertLess(len(partial.content) * 5, len(full.content))
+
+    def test_partial_search_and_pagination(self):
+        first = self.client.get(TASK_LIST_URL, {"search_query": "task_"}, **HTMX)
+        second = self.client.get(
+            TASK_LIST_URL,
+            {"search_query": "task_", "cursor": first.context["page_obj"].next_cursor},
+            **HTMX,
+        )
+        self.assertContains(second, "?search_query=task_&amp;cursor=")
+        tasks = list(first.context["task_list"]) + list(second.context["task_list"])
+        self.assertEqual(len(set(tasks)), 8)
+
+        response = self.client.get(TASK_LIST_URL, {"search_query": "nothing"}, **HTMX)
+        self.assertContains(response, "There are no tasks")
+
+    def test_responses_vary_on_htmx_header(self):
+        for headers in ({}, HTMX):
+            response = self.client.get(TASK_LIST_URL, **headers)
+            self.assertIn("HX-Request", response["Vary"])
+
+    def test_history_restore_gets_the_full_page(self):
+        response = self.client.get(
+            TASK_LIST_URL, HTTP_HX_HISTORY_RESTORE_REQUEST="true", **HTMX
+        )
+        self.assertContains(response, "<html")
+
+    def test_worker_list_partial(self):
+        response = self.client.get(WORKER_LIST_URL, **HTMX)
+        self.assertNotContains(response, "<html")
+        self.assertContains(response, "(Me)")
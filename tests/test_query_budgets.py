@@ -0,0 +1,167 @@
+import math
+import os
+
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager import cache
+from task_manager.export import CHUNK_SIZE
+from task_manager.models import Position, Tag, Task, TaskType
+from tests.datasets import seed_dataset
+from tests.query_budget import QueryBudget, QueryBudgetExceeded
+
+DATASET_SIZES = (10, 1_000, 100_000)
+if os.environ.get("QUERY_BUDGET_SIZES"):
+    DATASET_SIZES = tuple(
+        int(size) for size in os.environ["QUERY_BUDGET_SIZES"].split(",")
+    )
+
+
+def position_pk():
+    return {"pk": Position.objects.get(name="perf Backend").pk}
+
+
+def task_type_pk():
+    return {"pk": TaskType.objects.get(name="perf Bug").pk}
+
+
+def tag_pk():
+    return {"pk": Tag.objects.get(name="perf-tag-0").pk}
+
+
+def task_slug():
+    return {"slug": "perf-task-0"}
+
+
+def worker_slug():
+    return {"slug": "perf-worker-0"}
+
+
+def bulk_tag_data():
+    return {
+        "action": "tag",
+        "ids": [Task.objects.get(slug="perf-task-0").pk],
+        "tags": [Tag.objects.get(name="perf-tag-0").pk],
+    }
+
+
+def export_budget(size):
+    # The export reads every row: one query for the rows, then one for the
+    # assignee names and one for the tag names of each chunk.
+    return 3 + 2 * math.ceil(size / CHUNK_SIZE)
+
+
+# (url name, method, url kwargs, query budget) for every route of task_manager.
+# Budgets include the session and user lookups done by the auth middleware. A
+# callable budget is given the dataset size, for routes that read every row.
+ROUTE_BUDGETS = [
+    ("task_manager:index", "get", None, 3),
+    ("task_manager:register", "get", None, 3),
+    ("task_manager:task-list", "get", None, 3),
+    ("task_manager:task-create", "get", None, 5),
+    ("task_manager:task-detail", "get", task_slug, 5),
+    ("task_manager:task-update", "get", task_slug, 8),
+    ("task_manager:task-delete", "get", task_slug, 3),
+    ("task_manager:task-export", "get", None, export_budget),
+    ("task_manager:task-import", "get", None, 3),
+    ("task_manager:worker-list", "get", None, 3),
+    ("task_manager:worker-create", "get", None, 3),
+    ("task_manager:worker-detail", "get", worker_slug, 10),
+    ("task_manager:worker-update", "get", worker_slug, 4),
+    ("task_manager:worker-delete", "get", worker_slug, 3),
+    ("task_manager:position-list", "get", None, 3),
+    ("task_manager:position-create", "get", None, 2),
+    ("task_manager:position-update", "get", position_pk, 3),
+    ("task_manager:position-delete", "get", position_pk, 3),
+    ("task_manager:task-type-list", "get", None, 3),
+    ("task_manager:task-type-create", "get", None, 2),
+    ("task_manager:task-type-update", "get", task_type_pk, 3),
+    ("task_manager:task-type-delete", "get", task_type_pk, 3),
+    ("task_manager:tag-list", "get", None, 3),
+    ("task_manager:tag-create", "get", None, 2),
+    ("task_manager:tag-update", "get", tag_pk, 3),
+    ("task_manager:tag-delete", "get", tag_pk, 3),
+    ("task_manager:task-change-status", "post", task_slug, 6),
+    ("task_manager:toggle-task-assign", "post", task_slug, 7),
+    ("task_manager:api-task-list", "get", None, 5),
+    ("task_manager:api-task-detail", "get", task_slug, 5),
+    ("task_manager:api-worker-list", "get", None, 3),
+    ("task_manager:api-worker-detail", "get", worker_slug, 3),
+    ("task_manager:api-position-list", "get", None, 3),
+    ("task_manager:api-position-detail", "get", position_pk, 3),
+    ("task_manager:api-task-type-list", "get", None, 3),
+    ("task_manager:api-task-type-detail", "get", task_type_pk, 3),
+    ("task_manager:api-tag-list", "get", None, 3),
+    ("task_manager:api-tag-detail", "get", tag_pk, 3),
+    ("task_manager:api-task-bulk", "post", None, 11),
+    ("task_manager:api-db-pools", "get", None, 2),
+]
+
+# Data sent with the requests of ROUTE_BUDGETS.
+ROUTE_DATA = {
+    "task_manager:api-task-bulk": bulk_tag_data,
+}
+
+SCALED_ROUTES = {name for name, _, _, budget in ROUTE_BUDGETS if callable(budget)}
+
+# Admin change lists, which show up to 100 rows per page.
+ADMIN_BUDGETS = [
+    ("admin:task_manager_task_changelist", 5),
+    ("admin:task_manager_worker_changelist", 6),
+]
+
+
+class QueryBudgetTest(TestCase):
+    def measure(self, size):
+        counts = {}
+        savepoint = transaction.savepoint()
+        try:
+            cache.clear()
+            user = seed_dataset(size)
+            user.is_staff = True
+            user.save(update_fields=["is_staff"])
+            self.client.force_login(user)
+            for name, method, url_kwargs, budget in ROUTE_BUDGETS:
+                url = reverse(name, kwargs=url_kwargs() if url_kwargs else None)
+                data = ROUTE_DATA[name]() if name in ROUTE_DATA else None
+                if callable(budget):
+                    budget = budget(size)
+                budget_context = QueryBudget(budget)
+                try:
+                    with budget_context:
+                        response = getattr(self.client, method)(url, data)
+                        if response.streaming:
+                            b"".join(response.streaming_content)
+                except QueryBudgetExceeded as error:
+                    self.fail(f"{name} with {size} rows: {error}")
+                self.assertLess(response.status_code, 400, f"{name} with {size} rows")
+                counts[name] = len(budget_context)
+        finally:
+            transaction.savepoint_rollback(savepoint)
+        return counts
+
+    def test_views_query_count_does_not_grow_with_data(self):
+        measured = {size: self.measure(size) for size in DATASET_SIZES}
+        smallest = measured[DATASET_SIZES[0]]
+        for size in DATASET_SIZES[1:]:
+            for name, count in measured[size].items():
+                if name in SCALED_ROUTES:
+                    continue
+                with self.subTest(route=name, size=size):
+                    self.assertLessEqual(
+                        count,
+                        smallest[name],
+                        f"{name} runs {count} queries with {size} rows "
+                        f"but {smallest[name]} with {DATASET_SIZES[0]} rows",
+                    )
+
+    def test_admin_change_lists_do_not_query_per_row(self):
+        user = seed_dataset(1_000)
+        user.is_staff = user.is_superuser = True
+        user.save()
+        self.client.force_login(user)
+        for name, budget in ADMIN_BUDGETS:
+            with QueryBudget(budget):
+                response = self.client.get(reverse(name))
+            self.assertEqual(response.status_code, 200)
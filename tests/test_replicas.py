@@ -0,0 +1,95 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.sessions.models import Session
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import router
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from task_manager import cache
+from task_manager.db.routers import replica_reads
+from task_manager.middleware import STICKY_COOKIE, ReplicaRoutingMiddleware
+from task_manager.models import Task
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class ReplicaRouterTest(SimpleTestCase):
+    def test_reads_go_to_the_primary_by_default(self):
+        self.assertEqual(router.db_for_read(Task), "default")
+
+    def test_replica_reads(self):
+        with replica_reads():
+            self.assertEqual(router.db_for_read(Task), "replica_1")
+            self.assertEqual(router.db_for_read(Session), "default")
+            self.assertEqual(router.db_for_write(Task), "default")
+
+    def test_fragments_rendered_from_a_replica_are_not_stored(self):
+        cache.clear()
+        template = Template(
+            "{% load fragment_cache %}"
+            '{% fragment "test" version %}{{ value }}{% endfragment %}'
+        )
+
+        def render(value):
+            return template.render(Context({"version": 1, "value": value}))
+
+        with replica_reads():
+            self.assertEqual(render("replica"), "replica")
+        self.assertEqual(render("primary"), "primary")
+        with replica_reads():
+            self.assertEqual(render("replica"), "primary")
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(router.allow_migrate("replica_1", "task_manager"))
+        self.assertTrue(router.allow_migrate("default", "task_manager"))
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"], REPLICA_STICKY_SECONDS=5)
+class ReplicaRoutingMiddlewareTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.read_from = []
+
+        def view(request):
+            self.read_from.append(router.db_for_read(Task))
+            return HttpResponse()
+
+        self.middleware = ReplicaRoutingMiddleware(view)
+        self.factory = RequestFactory()
+
+    def test_marked_views_read_from_a_replica(self):
+        for path in ("/tasks/", "/tasks/some-task/", "/tasks/export/", "/api/tasks/"):
+            self.middleware(self.factory.get(path))
+        self.middleware(self.factory.get("/tasks/create/"))
+        self.middleware(self.factory.get("/missing/path/"))
+
+        self.assertEqual(self.read_from, ["replica_1"] * 4 + ["default"] * 2)
+        self.assertEqual(router.db_for_read(Task), "default")
+
+    def test_writes_stick_the_client_to_the_primary(self):
+        response = self.middleware(self.factory.post("/tasks/create/"))
+        self.assertEqual(response.cookies[STICKY_COOKIE]["max-age"], 5)
+
+        request = self.factory.get("/tasks/")
+        request.COOKIES[STICKY_COOKIE] = "1"
+        response = self.middleware(request)
+
+        self.assertEqual(self.read_from, ["default", "default"])
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    def test_async_chain(self):
+        async def view(request):
+            self.read_from.append(router.db_for_read(Task))
+            return HttpResponse()
+
+        middleware = ReplicaRoutingMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        async_to_sync(middleware)(self.factory.get("/tasks/"))
+        response = async_to_sync(middleware)(self.factory.post("/tasks/create/"))
+
+        self.assertEqual(self.read_from, ["replica_1", "default"])
+        self.assertIn(STICKY_COOKIE, response.cookies)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_unused_without_replicas(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ReplicaRoutingMiddleware(HttpResponse)
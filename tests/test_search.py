@@ -0,0 +1,134 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.models import Tag, Task, TaskType
+from task_manager.pagination import CursorPaginator
+from task_manager.search import FTS_TABLE, search_tasks
+
+TASK_LIST_URL = reverse("task_manager:task-list")
+
+
+class TaskSearchTest(TestCase):
+    def setUp(self) -> None:
+        self.task_type = TaskType.objects.create(name="test type")
+        self.backend = Tag.objects.create(name="backend")
+        self.billing = Tag.objects.create(name="billing")
+        self.login = self.create_task("Fix login page", "Users cannot sign in")
+        self.payment = self.create_task("Payment flow", "Broken login redirect")
+        self.report = self.create_task("Reports export", "Export to CSV")
+        self.report.tags.set([self.backend, self.billing])
+
+    def create_task(self, name, description):
+        return Task.objects.create(
+            name=name,
+            description=description,
+            deadline=date(year=2323, month=10, day=10),
+            task_type=self.task_type,
+            slug=name.lower().replace(" ", "-"),
+        )
+
+    def search(self, search_query):
+        return list(search_tasks(Task.objects.all(), search_query))
+
+    def test_search_matches_name_description_and_tags(self):
+        self.assertEqual(self.search("page"), [self.login])
+        self.assertEqual(self.search("CSV"), [self.report])
+        self.assertEqual(self.search("billing"), [self.report])
+
+    def test_search_matches_word_prefixes(self):
+        self.assertEqual(self.search("paym"), [self.payment])
+        self.assertEqual(self.search("rep exp"), [self.report])
+
+    def test_search_ranks_name_matches_first(self):
+        self.assertEqual(self.search("login"), [self.login, self.payment])
+
+    def test_search_does_not_duplicate_tasks_with_several_matching_tags(self):
+        self.backend.name = "billing backend"
+        self.backend.save()
+        self.assertEqual(self.search("billing"), [self.report])
+
+    def test_search_without_words_falls_back_to_substring(self):
+        task = self.create_task("Release v2.0 ++", "Notes")
+        self.assertEqual(self.search("++"), [task])
+
+    def test_index_follows_task_changes(self):
+        self.login.name = "Fix signup page"
+        self.login.save()
+        self.assertEqual(self.search("signup"), [self.login])
+        self.assertEqual(self.search("page"), [self.login])
+
+        self.login.delete()
+        self.assertEqual(self.search("signup"), [])
+
+    def test_index_follows_tag_changes(self):
+        self.report.tags.remove(self.billing)
+        self.assertEqual(self.search("billing"), [])
+
+        self.login.tags.add(self.billing)
+        self.assertEqual(self.search("billing"), [self.login])
+
+        self.billing.name = "invoices"
+        self.billing.save()
+        self.assertEqual(self.search("invoices"), [self.login])
+
+        self.billing.tasks.clear()
+        self.assertEqual(self.search("invoices"), [])
+
+        self.backend.delete()
+        self.assertEqual(self.search("backend"), [])
+
+    def test_rebuild_search_index_command(self):
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        call_command("rebuild_search_index", batch_size=2, stdout=StringIO())
+        self.assertEqual(self.search("billing"), [self.report])
+        self.assertEqual(self.search("login"), [self.login, self.payment])
+
+
+class TaskListSearchTest(TestCase):
+    def setUp(self) -> None:
+        task_type = TaskType.objects.create(name="test type")
+        tags = [Tag.objects.create(name=f"release {number}") for number in range(3)]
+        for task_id in range(7):
+            task = Task.objects.create(
+                name=f"Release task_{task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=task_type,
+                slug=f"release-task_{task_id}",
+            )
+            task.tags.set(tags)
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.client.force_login(self.user)
+
+    def test_search_pages_are_not_duplicated(self):
+        first_page = self.client.get(TASK_LIST_URL + "?search_query=release")
+        second_page = self.client.get(TASK_LIST_URL + "?search_query=release&page=2")
+
+        self.assertEqual(first_page.context["paginator"].count, 7)
+        tasks = list(first_page.context["task_list"]) + list(
+            second_page.context["task_list"]
+        )
+        self.assertEqual(len(tasks), 7)
+        self.assertEqual(len(set(tasks)), 7)
+
+    def test_cursor_pages_through_tied_ranks(self):
+        queryset = search_tasks(Task.objects.all(), "release")
+        ranks = queryset.values_list("search_rank", flat=True)
+        self.assertEqual(len(set(ranks)), 1)
+
+        paginator = CursorPaginator(queryset, 2)
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual([task for page in pages for task in page], list(queryset))
@@ -0,0 +1,148 @@
+import importlib
+import threading
+from datetime import date
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager import slugs
+from task_manager.models import Task, TaskType
+
+deduplicate_slugs = importlib.import_module(
+    "task_manager.migrations.0005_deduplicate_slugs"
+).deduplicate_slugs
+
+FIELDS = {
+    "description": "test description",
+    "deadline": date(year=2323, month=10, day=10),
+}
+
+
+def create_task(name, **kwargs):
+    task_type, _ = TaskType.objects.get_or_create(name="test type")
+    return Task.objects.create(name=name, task_type=task_type, **FIELDS, **kwargs)
+
+
+class SlugAllocationTest(TestCase):
+    def test_tasks_with_the_same_name_get_numbered_slugs(self):
+        slugs_ = [create_task("Fix login").slug for _ in range(3)]
+        self.assertEqual(slugs_, ["fix-login", "fix-login-2", "fix-login-3"])
+
+    def test_allocation_takes_one_query(self):
+        create_task("Fix login")
+        create_task("Fix login page")
+        with CaptureQueriesContext(connection) as queries:
+            slug = slugs.allocate_slug(Task, "Fix login")
+        self.assertEqual(slug, "fix-login-2")
+        self.assertEqual(len(queries), 1)
+
+    def test_saving_again_keeps_the_slug(self):
+        create_task("Fix login")
+        task = create_task("Fix login")
+        task.description = "changed"
+        task.save()
+        task.refresh_from_db()
+        self.assertEqual(task.slug, "fix-login-2")
+
+    def test_long_names_leave_room_for_the_suffix(self):
+        name = "x" * 80
+        first, second = create_task(name), create_task(name)
+        self.assertEqual(first.slug, "x" * 50)
+        self.assertEqual(second.slug, "x" * 39 + "-2")
+
+    def test_batches_are_unique_among_themselves(self):
+        create_task("Fix login")
+        self.assertEqual(
+            slugs.allocate_slugs(Task, ["Fix login", "Fix login", "Write docs"]),
+            ["fix-login-2", "fix-login-3", "write-docs"],
+        )
+
+    def test_worker_slugs(self):
+        first = get_user_model().objects.create_user(username="john.doe")
+        second = get_user_model().objects.create_user(username="johndoe")
+        self.assertEqual([first.slug, second.slug], ["johndoe", "johndoe-2"])
+
+    def test_create_view_with_duplicate_name(self):
+        user = get_user_model().objects.create_user(username="test", password="pw")
+        self.client.force_login(user)
+        task_type = TaskType.objects.create(name="Bug")
+        data = {
+            "name": "Fix login",
+            "description": "test description",
+            "deadline": "2323-10-10",
+            "priority": "Low priority",
+            "task_type": task_type.pk,
+            "assignees": [user.pk],
+        }
+        for _ in range(2):
+            response = self.client.post(reverse("task_manager:task-create"), data)
+            self.assertEqual(response.status_code, 302)
+
+        response = self.client.get(
+            reverse("task_manager:task-detail", kwargs={"slug": "fix-login-2"})
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_save_retries_when_a_concurrent_insert_takes_the_slug(self):
+        allocate_slug = slugs.allocate_slug
+        task_type = TaskType.objects.create(name="test type")
+
+        def allocate_then_lose_race(model, value, exclude_pk=None):
+            slug = allocate_slug(model, value, exclude_pk)
+            if not Task.objects.exists():
+                # Another request inserts the same slug before our save.
+                Task.objects.bulk_create(
+                    [Task(name="Fix login", slug=slug, task_type=task_type, **FIELDS)]
+                )
+            return slug
+
+        with mock.patch.object(slugs, "allocate_slug", allocate_then_lose_race):
+            task = create_task("Fix login")
+
+        self.assertEqual(task.slug, "fix-login-2")
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_migration_rebuilds_empty_slugs(self):
+        create_task("Fix login")
+        task = create_task("Fix login")
+        Task.objects.filter(pk=task.pk).update(slug="")
+
+        deduplicate_slugs(apps, None)
+
+        task.refresh_from_db()
+        self.assertEqual(task.slug, "fix-login-2")
+
+
+class ConcurrentSlugAllocationTest(TransactionTestCase):
+    def setUp(self) -> None:
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("Threads cannot share an in-memory SQLite database.")
+
+    def test_concurrent_creates_get_distinct_slugs(self):
+        TaskType.objects.create(name="test type")
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def create():
+            try:
+                barrier.wait()
+                create_task("Fix login")
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        slugs_ = Task.objects.values_list("slug", flat=True)
+        self.assertEqual(len(set(slugs_)), 8)
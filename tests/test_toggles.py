@@ -0,0 +1,155 @@
+import threading
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from task_manager import cache
+from task_manager.bulk import toggle_assignee, toggle_completed
+from task_manager.dashboard import DashboardStats
+from task_manager.models import Task, TaskType
+from task_manager.versions import ObjectVersion
+
+
+def create_task(slug="fix-login"):
+    task_type, _ = TaskType.objects.get_or_create(name="test type")
+    return Task.objects.create(
+        name="Fix login",
+        description="test description",
+        deadline=date(year=2323, month=10, day=10),
+        task_type=task_type,
+        slug=slug,
+    )
+
+
+class ToggleViewTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.task = create_task()
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.client.force_login(self.user)
+        self.status_url = reverse(
+            "task_manager:task-change-status", kwargs={"slug": self.task.slug}
+        )
+        self.assign_url = reverse(
+            "task_manager:toggle-task-assign", kwargs={"slug": self.task.slug}
+        )
+
+    def test_forms_are_redirected_to_the_task(self):
+        response = self.client.post(self.status_url)
+        self.assertRedirects(response, self.task.get_absolute_url())
+        response = self.client.post(self.assign_url)
+        self.assertRedirects(response, self.task.get_absolute_url())
+
+    def test_ajax_requests_get_the_new_state(self):
+        ajax = {"HTTP_X_REQUESTED_WITH": "XMLHttpRequest"}
+        self.assertEqual(
+            self.client.post(self.status_url, **ajax).json(),
+            {"slug": "fix-login", "is_completed": True},
+        )
+        self.assertEqual(
+            self.client.post(self.status_url, HTTP_ACCEPT="application/json").json(),
+            {"slug": "fix-login", "is_completed": False},
+        )
+        self.assertEqual(
+            self.client.post(self.assign_url, **ajax).json(),
+            {"slug": "fix-login", "assigned": True},
+        )
+        self.assertEqual(
+            self.client.post(self.assign_url, **ajax).json(),
+            {"slug": "fix-login", "assigned": False},
+        )
+
+    def test_unknown_task(self):
+        url = reverse("task_manager:toggle-task-assign", kwargs={"slug": "missing"})
+        self.assertEqual(self.client.post(url).status_code, 404)
+        url = reverse("task_manager:task-change-status", kwargs={"slug": "missing"})
+        self.assertEqual(self.client.post(url).status_code, 404)
+
+    def test_login_required(self):
+        self.client.logout()
+        for url in (self.status_url, self.assign_url):
+            response = self.client.post(url)
+            self.assertEqual(response.status_code, 302)
+            self.assertIn("/accounts/login/", response.url)
+        self.task.refresh_from_db()
+        self.assertFalse(self.task.is_completed)
+
+    def test_toggles_refresh_versions_and_dashboard(self):
+        self.task.assignees.add(self.user)
+        self.assertEqual(DashboardStats.get()["completed_tasks"], 0)
+        task_version = ObjectVersion.get((Task, self.task.pk))
+        worker_version = ObjectVersion.get((get_user_model(), self.user.pk))
+
+        toggle_completed(self.task.slug)
+        self.assertEqual(DashboardStats.get()["completed_tasks"], 1)
+        self.assertNotEqual(ObjectVersion.get((Task, self.task.pk)), task_version)
+        self.assertNotEqual(
+            ObjectVersion.get((get_user_model(), self.user.pk)), worker_version
+        )
+
+        task_version = ObjectVersion.get((Task, self.task.pk))
+        toggle_assignee(self.task.slug, self.user.pk)
+        self.assertFalse(self.task.assignees.exists())
+        self.assertNotEqual(ObjectVersion.get((Task, self.task.pk)), task_version)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.version, 4)
+
+    def test_toggles_apply_on_top_of_concurrent_changes(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        toggle_completed(self.task.slug)
+        # A request that loaded the task earlier still flips the current value.
+        self.assertFalse(toggle_completed(stale.slug))
+        self.assertFalse(Task.objects.get(pk=self.task.pk).is_completed)
+
+
+class ConcurrentToggleTest(TransactionTestCase):
+    def setUp(self) -> None:
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("Threads cannot share an in-memory SQLite database.")
+        self.task = create_task()
+        self.workers = [
+            get_user_model().objects.create_user(username=f"worker_{number}")
+            for number in range(6)
+        ]
+
+    def run_concurrently(self, calls):
+        barrier = threading.Barrier(len(calls))
+        errors = []
+
+        def run(call):
+            try:
+                barrier.wait()
+                call()
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=(call,)) for call in calls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_no_lost_status_updates(self):
+        self.run_concurrently([lambda: toggle_completed("fix-login")] * 9)
+
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.is_completed)
+        self.assertEqual(self.task.version, 10)
+
+    def test_no_lost_assignments(self):
+        self.run_concurrently(
+            [
+                lambda worker_id=worker.pk: toggle_assignee("fix-login", worker_id)
+                for worker in self.workers
+            ]
+        )
+
+        self.assertEqual(set(self.task.assignees.all()), set(self.workers))
@@ -0,0 +1,92 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Position, Tag, Task, TaskType
+
+POSITION_LIST_URL = reverse("task_manager:position-list")
+TASK_TYPE_LIST_URL = reverse("task_manager:task-type-list")
+TAG_LIST_URL = reverse("task_manager:tag-list")
+
+
+class UsageCountListTest(TestCase):
+    def setUp(self) -> None:
+        self.positions = [
+            Position.objects.create(name=f"Position {number}") for number in range(3)
+        ]
+        self.task_types = [
+            TaskType.objects.create(name=f"Type {number}") for number in range(3)
+        ]
+        self.tags = [Tag.objects.create(name=f"tag {number}") for number in range(3)]
+        # Item N is used N * 2 times.
+        for number in range(3):
+            for copy in range(number * 2):
+                get_user_model().objects.create_user(
+                    username=f"worker_{number}_{copy}",
+                    position=self.positions[number],
+                )
+                task = Task.objects.create(
+                    name=f"Task {number} {copy}",
+                    description="test description",
+                    deadline=date(year=2323, month=10, day=10),
+                    task_type=self.task_types[number],
+                    slug=f"task-{number}-{copy}",
+                )
+                task.tags.add(self.tags[number])
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test password", slug="test"
+        )
+        self.client.force_login(self.user)
+
+    def get_list(self, url, context_name, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return list(response.context[context_name])
+
+    def test_lists_show_annotated_counts(self):
+        positions = self.get_list(POSITION_LIST_URL, "position_list")
+        task_types = self.get_list(TASK_TYPE_LIST_URL, "tasktype_list")
+        tags = self.get_list(TAG_LIST_URL, "tag_list")
+
+        # The test user has no position.
+        self.assertEqual([position.num_workers for position in positions], [0, 2, 4])
+        self.assertEqual([task_type.num_tasks for task_type in task_types], [0, 2, 4])
+        self.assertEqual([tag.num_tasks for tag in tags], [0, 2, 4])
+
+    def test_filter_by_minimum_usage(self):
+        positions = self.get_list(POSITION_LIST_URL, "position_list", min_usage=2)
+        tags = self.get_list(TAG_LIST_URL, "tag_list", min_usage=3)
+
+        self.assertEqual(positions, self.positions[1:])
+        self.assertEqual(tags, self.tags[2:])
+
+    def test_sort_by_usage(self):
+        task_types = self.get_list(
+            TASK_TYPE_LIST_URL, "tasktype_list", ordering="-usage"
+        )
+        tags = self.get_list(TAG_LIST_URL, "tag_list", ordering="usage", page=1)
+
+        self.assertEqual(task_types, self.task_types[::-1])
+        self.assertEqual(tags, self.tags)
+
+    def test_query_count_does_not_depend_on_fan_out(self):
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(TAG_LIST_URL)
+        for number in range(10):
+            task = Task.objects.create(
+                name=f"Extra {number}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=self.task_types[0],
+                slug=f"extra-{number}",
+            )
+            task.tags.set(self.tags)
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(TAG_LIST_URL)
+
+        self.assertEqual(len(after), len(before))
+        self.assertContains(response, '<td class="total-count">14</td>')
@@ -157,3 +157,22 @@ class PrivateTaskTest(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "There are no tasks")
+
+    def test_task_status_filter(self):
+        Task.objects.filter(name="Test task_0").update(is_completed=True)
+        Task.objects.filter(name="Test task_1").update(
+            deadline=date(year=2020, month=1, day=1)
+        )
+
+        response = self.client.get(TASK_LIST_URL + "?status=overdue")
+        self.assertEqual(
+            [task.name for task in response.context["task_list"]], ["Test task_1"]
+        )
+        self.assertContains(response, "overdue task")
+
+        response = self.client.get(TASK_LIST_URL + "?status=completed")
+        self.assertContains(response, "completed task")
+        self.assertEqual(len(response.context["task_list"]), 1)
+
+        response = self.client.get(TASK_LIST_URL + "?status=in_progress&page=2")
+        self.assertEqual(len(response.context["task_list"]), 1)
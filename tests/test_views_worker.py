@@ -1,8 +1,12 @@
+from datetime import date
+
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from task_manager.models import Position
+from task_manager.models import Position, Task, TaskType
 
 WORKER_LIST_URL = reverse("task_manager:worker-list")
 
@@ -101,3 +105,39 @@ class PrivateDriverTest(TestCase):
         response = self.client.get("/workers/?search_query=Test&page=2")
         self.assertTrue(response.context["is_paginated"] is True)
         self.assertEqual(len(response.context["worker_list"]), 3)
+
+    def _create_tasks(self, number, is_completed=False):
+        task_type, _ = TaskType.objects.get_or_create(name="test type")
+        workers = list(get_user_model().objects.order_by("id")[:3])
+        start = Task.objects.count()
+        for task_id in range(start, start + number):
+            task = Task.objects.create(
+                name=f"Test task_{task_id}",
+                description="test description",
+                deadline=date(year=2323, month=10, day=10),
+                task_type=task_type,
+                is_completed=is_completed,
+                slug=f"test-task_{task_id}",
+            )
+            task.assignees.set(workers)
+
+    def test_worker_list_number_tasks_in_work(self):
+        self._create_tasks(3)
+        self._create_tasks(2, is_completed=True)
+        response = self.client.get(WORKER_LIST_URL)
+        workers = {worker.pk: worker for worker in response.context["worker_list"]}
+
+        self.assertEqual(workers[1].num_tasks_in_work, 3)
+        self.assertEqual(workers[4].num_tasks_in_work, 0)
+
+    def test_worker_list_query_count_does_not_grow_with_tasks(self):
+        self._create_tasks(2)
+        with CaptureQueriesContext(connection) as few_tasks:
+            self.client.get(WORKER_LIST_URL)
+
+        self._create_tasks(30)
+        with CaptureQueriesContext(connection) as many_tasks:
+            response = self.client.get(WORKER_LIST_URL)
+
+        self.assertEqual(len(few_tasks), len(many_tasks))
+        self.assertContains(response, "32")
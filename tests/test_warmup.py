@@ -0,0 +1,56 @@
+import io
+
+from django.conf import settings
+from django.core.management import call_command
+from django.template import engines
+from django.test import SimpleTestCase, override_settings
+
+from task_manager.warmup import warm_templates
+
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+CACHED_TEMPLATES = [
+    dict(
+        settings.TEMPLATES[0],
+        APP_DIRS=False,
+        OPTIONS=dict(
+            settings.TEMPLATES[0]["OPTIONS"],
+            loaders=[("django.template.loaders.cached.Loader", LOADERS)],
+        ),
+    )
+]
+
+
+@override_settings(TEMPLATES=CACHED_TEMPLATES)
+class WarmTemplatesTest(SimpleTestCase):
+    def template_cache(self):
+        return engines["django"].engine.template_loaders[0].get_template_cache
+
+    def test_project_app_and_crispy_templates_are_compiled(self):
+        names = warm_templates()
+
+        for name in (
+            "layouts/base.html",
+            "includes/pagination.html",
+            "task_manager/task_list.html",
+            "task_manager/partials/task_list_results.html",
+            "bootstrap5/uni_form.html",
+            "bootstrap5/field.html",
+        ):
+            self.assertIn(name, names)
+            self.assertIn(name, self.template_cache())
+        self.assertNotIn("admin/base.html", names)
+
+    def test_patterns_can_be_narrowed(self):
+        self.assertEqual(
+            warm_templates(["includes/pagination.html"]), ["includes/pagination.html"]
+        )
+        self.assertEqual(list(self.template_cache()), ["includes/pagination.html"])
+
+    def test_warm_templates_command(self):
+        out = io.StringIO()
+        call_command("warm_templates", "layouts/*.html", verbosity=2, stdout=out)
+        self.assertIn("layouts/base.html", out.getvalue())
+        self.assertIn("Compiled 2 templates", out.getvalue())
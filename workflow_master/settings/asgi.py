@@ -0,0 +1,16 @@
+from .prod import *  # noqa: F401, F403
+from .prod import DATABASES, MIDDLEWARE
+
+# prod served by an ASGI server, with the async variants of the read-heavy
+# views. Sync code runs in a fresh thread for every request there, so
+# connections cannot persist between requests; DB_POOL_MAX_SIZE reuses them.
+ASYNC_VIEWS = True
+
+for database in DATABASES.values():
+    database["CONN_MAX_AGE"] = 0
+
+# Every middleware has to be async-capable, or Django runs the whole chain
+# (the async views included) in a thread.
+MIDDLEWARE[
+    MIDDLEWARE.index("whitenoise.middleware.WhiteNoiseMiddleware")
+] = "task_manager.middleware.StaticFilesMiddleware"
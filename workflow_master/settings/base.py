@@ -0,0 +1,249 @@
+"""
+Django settings for workflow_master project, shared by every profile.
+
+Pick a profile with DJANGO_SETTINGS_MODULE: workflow_master.settings.dev,
+.test or .prod. manage.py defaults to dev (test for "manage.py test") and
+wsgi.py/asgi.py to prod.
+
+Generated by 'django-admin startproject' using Django 4.2.1.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/4.2/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/4.2/ref/settings/
+"""
+import os
+from pathlib import Path
+
+import dj_database_url
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+STATICFILES_DIRS = [
+    BASE_DIR / "static",
+    "static/",
+]
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = secret_key = os.environ["DJANGO_SECRET_KEY"]
+
+DEBUG = False
+
+ALLOWED_HOSTS = ["127.0.0.1", "task-manager-av4g.onrender.com"]
+
+# Application definition
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "crispy_forms",
+    "crispy_bootstrap5",
+    "task_manager",
+]
+
+MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "task_manager.middleware.ReplicaRoutingMiddleware",
+]
+
+ROOT_URLCONF = "workflow_master.urls"
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [BASE_DIR / "templates"],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+        },
+    },
+]
+
+# Templates compiled at worker boot (wsgi.py/asgi.py) and by warm_templates;
+# the globs are relative to every template directory.
+
+TEMPLATE_WARMUP = [
+    "layouts/*.html",
+    "includes/*.html",
+    "task_manager/**/*.html",
+    "bootstrap5/**/*.html",
+]
+
+WARM_TEMPLATES_ON_BOOT = False
+
+CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
+
+CRISPY_TEMPLATE_PACK = "bootstrap5"
+
+WSGI_APPLICATION = "workflow_master.wsgi.application"
+
+# Routes the read-heavy pages to task_manager.async_views (asgi profile).
+
+ASYNC_VIEWS = False
+
+# Database
+# https://docs.djangoproject.com/en/4.2/ref/settings/#databases
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ.get("PGDATABASE"),
+        "USER": os.environ.get("PGUSER"),
+        "PASSWORD": os.environ.get("PGPASSWORD"),
+        "HOST": os.environ.get("PGHOST"),
+        "PORT": os.environ.get("PGPORT", 5432),
+        "OPTIONS": {
+            "sslmode": "require",
+        },
+    }
+}
+
+# DATABASE_URL replaces the PG* settings instead of being merged into them,
+# so a URL without SSL (or a SQLite one) does not inherit sslmode=require.
+if os.environ.get("DATABASE_URL"):
+    DATABASES["default"] = dj_database_url.config()
+
+# Connections are kept for DB_CONN_MAX_AGE seconds and checked before reuse.
+# DB_POOL_MAX_SIZE switches PostgreSQL to an in-process pool instead: each
+# request returns its connection to the pool, which hands it to the next one.
+DATABASES["default"].update(
+    CONN_MAX_AGE=int(os.environ.get("DB_CONN_MAX_AGE", 500)),
+    CONN_HEALTH_CHECKS=True,
+)
+
+if (
+    os.environ.get("DB_POOL_MAX_SIZE")
+    and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql"
+):
+    DATABASES["default"].update(
+        ENGINE="task_manager.db.postgresql_pool",
+        CONN_MAX_AGE=0,
+        POOL={
+            "MAX_SIZE": int(os.environ["DB_POOL_MAX_SIZE"]),
+            "TIMEOUT": float(os.environ.get("DB_POOL_TIMEOUT", 5)),
+            "MAX_IDLE": float(os.environ.get("DB_POOL_MAX_IDLE", 300)),
+        },
+    )
+
+# DATABASE_REPLICA_URLS lists read replicas of default, comma separated. Views
+# with read_from_replica read from them, except for a client that wrote within
+# the last REPLICA_STICKY_SECONDS (see ReplicaRoutingMiddleware).
+DATABASE_REPLICAS = []
+
+for number, url in enumerate(
+    filter(None, os.environ.get("DATABASE_REPLICA_URLS", "").split(",")), start=1
+):
+    alias = f"replica_{number}"
+    DATABASES[alias] = dict(
+        dj_database_url.parse(url.strip()),
+        CONN_MAX_AGE=int(os.environ.get("DB_CONN_MAX_AGE", 500)),
+        CONN_HEALTH_CHECKS=True,
+        TEST={"MIRROR": "default"},
+    )
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["task_manager.db.routers.ReplicaRouter"]
+
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", 10))
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# SHARED_CACHE_DIR puts a file-based cache shared by all processes behind the
+# in-process LRU of task_manager.cache; without it each process caches alone.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    },
+}
+
+if os.environ.get("SHARED_CACHE_DIR"):
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ["SHARED_CACHE_DIR"],
+        "OPTIONS": {"MAX_ENTRIES": 100_000},
+    }
+
+TASK_MANAGER_CACHE = {
+    "ALIAS": "shared" if "shared" in CACHES else "default",
+    "LOCAL_MAX_ENTRIES": 1000,
+    "LOCAL_TIMEOUT": 5,
+}
+
+# Without SHARED_CACHE_DIR every process caches alone and a write handled by
+# one of them cannot invalidate the others' dashboard snapshot or object
+# versions, so those expire as quickly as the local tier's. Fragments are
+# keyed by version and keep their own timeout.
+if "shared" not in CACHES:
+    TASK_MANAGER_CACHE["MAX_TIMEOUT"] = TASK_MANAGER_CACHE["LOCAL_TIMEOUT"]
+
+# Password validation
+# https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+    },
+]
+
+AUTH_USER_MODEL = "task_manager.Worker"
+
+LOGIN_REDIRECT_URL = "/"
+
+# Internationalization
+# https://docs.djangoproject.com/en/4.2/topics/i18n/
+
+LANGUAGE_CODE = "en-us"
+
+TIME_ZONE = "UTC"
+
+USE_I18N = True
+
+USE_TZ = True
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/4.2/howto/static-files/
+
+STATIC_URL = "static/"
+
+STATIC_ROOT = "staticfiles/"
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# List pages stop running COUNT(*) and use the planner's row estimate
+# once a queryset is estimated to hold at least this many rows.
+
+COUNT_ESTIMATE_THRESHOLD = int(os.environ.get("COUNT_ESTIMATE_THRESHOLD", 100_000))
@@ -0,0 +1,19 @@
+from .base import *  # noqa: F401, F403
+from .base import INSTALLED_APPS, MIDDLEWARE, TEMPLATES
+
+DEBUG = True
+
+INTERNAL_IPS = [
+    "127.0.0.1",
+]
+
+INSTALLED_APPS += ["debug_toolbar"]
+
+MIDDLEWARE.insert(
+    MIDDLEWARE.index("whitenoise.middleware.WhiteNoiseMiddleware") + 1,
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+)
+
+TEMPLATES[0]["OPTIONS"]["context_processors"].insert(
+    0, "django.template.context_processors.debug"
+)
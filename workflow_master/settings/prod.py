@@ -0,0 +1,18 @@
+from .base import *  # noqa: F401, F403
+from .base import TEMPLATES
+
+DEBUG = False
+
+# Each template is parsed once per process and the common ones at boot.
+TEMPLATES[0]["APP_DIRS"] = False
+TEMPLATES[0]["OPTIONS"]["loaders"] = [
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    ),
+]
+
+WARM_TEMPLATES_ON_BOOT = True
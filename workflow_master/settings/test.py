@@ -0,0 +1,22 @@
+import os
+
+from .base import *  # noqa: F401, F403
+from .base import BASE_DIR
+
+# SQLite unless DATABASE_URL points the suite at another database.
+if not os.environ.get("DATABASE_URL"):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+            # A file rather than the default in-memory database, which
+            # threads cannot share: the concurrency tests need it.
+            "TEST": {"NAME": BASE_DIR / "test_db.sqlite3"},
+        }
+    }
+    DATABASE_REPLICAS = []
+
+# Tests create many users; a fast hasher keeps that from dominating the run.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
@@ -11,6 +11,13 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workflow_master.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'workflow_master.settings.prod')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.WARM_TEMPLATES_ON_BOOT:
+    from task_manager.warmup import warm_templates
+
+    warm_templates()